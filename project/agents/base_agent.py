@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Callable
 
+from providers.aio import run_coroutine
 from providers.llm_adapter import AutoGenAdapter
 from providers.llm_provider import LLMProvider
+from providers.usage import CallUsage
 from prompts.phase_prompts import phase_context_prompt
 
 
@@ -12,6 +15,9 @@ class AgentTurn:
     role: str
     phase: str
     content: str
+    usage: CallUsage | None = None
+    streamed: bool = False
+    hedge_losses: list[CallUsage] = field(default_factory=list)
 
 
 class BaseProjectAgent:
@@ -20,22 +26,89 @@ class BaseProjectAgent:
         self.language = language
         model_cfg = provider.build_agent_model_config(role)
         self._adapter = AutoGenAdapter(name=role, system_prompt=system_prompt, model_cfg=model_cfg)
+        self._dialog_epoch = -1
+        self._dialog_phase = ""
+        self._seen_turn = 0
+
+    @property
+    def model(self) -> str:
+        return self._adapter.active_model
+
+    @property
+    def dialog_tokens(self) -> int:
+        return self._adapter.dialog_tokens
+
+    @property
+    def hedges_fired(self) -> int:
+        return self._adapter.hedges_fired
+
+    @property
+    def hedges_won(self) -> int:
+        return self._adapter.hedges_won
+
+    def dialog_position(self, phase: str) -> int | None:
+        if self._dialog_epoch != self._adapter.dialog_epoch or self._dialog_phase != phase:
+            return None
+        return self._seen_turn
 
     def start_new_dialog(self) -> None:
         self._adapter.start_new_dialog()
 
-    def respond(self, phase: str, facilitator_instruction: str, context_messages: list[dict[str, str]]) -> AgentTurn:
+    def set_economy_mode(self, enabled: bool) -> None:
+        self._adapter.set_economy_mode(enabled)
+
+    def _build_turn_prompt(self, phase: str, facilitator_instruction: str) -> str:
         phase_instruction = phase_context_prompt(phase, language=self.language)
         language_instruction = (
             "All natural-language values in your JSON response MUST be in English."
             if self.language == "en"
             else "Все текстовые значения в JSON-ответе ДОЛЖНЫ быть на русском языке, даже если входной контекст на английском."
         )
-        prompt = (
+        return (
             f"{phase_instruction}\n"
             f"{language_instruction}\n"
             f"Facilitator instruction: {facilitator_instruction}\n"
             "Return role-scoped response only."
         )
-        text = self._adapter.reply(messages=context_messages + [{"role": "user", "content": prompt}])
-        return AgentTurn(role=self.role, phase=phase, content=text)
+
+    @staticmethod
+    def _build_followup_prompt(facilitator_instruction: str) -> str:
+        return f"Facilitator instruction: {facilitator_instruction}\nReturn role-scoped response only."
+
+    def respond(self, phase: str, facilitator_instruction: str, context_messages: list[dict[str, str]]) -> AgentTurn:
+        return run_coroutine(self.arespond(phase, facilitator_instruction, context_messages))
+
+    async def arespond(
+        self,
+        phase: str,
+        facilitator_instruction: str,
+        context_messages: list[dict[str, str]],
+        on_chunk: Callable[[str], None] | None = None,
+        through_turn: int | None = None,
+        continue_dialog: bool = False,
+    ) -> AgentTurn:
+        # With through_turn set the adapter keeps the dialog, and a continued dialog only receives new turns.
+        if through_turn is not None and not continue_dialog:
+            self._adapter.reset_dialog()
+        if continue_dialog:
+            prompt = self._build_followup_prompt(facilitator_instruction)
+        else:
+            prompt = self._build_turn_prompt(phase, facilitator_instruction)
+        epoch = self._adapter.dialog_epoch
+        text = await self._adapter.areply(
+            messages=context_messages + [{"role": "user", "content": prompt}],
+            on_chunk=on_chunk,
+            keep_history=through_turn is not None,
+        )
+        if through_turn is not None:
+            self._dialog_epoch = epoch
+            self._dialog_phase = phase
+            self._seen_turn = through_turn
+        return AgentTurn(
+            role=self.role,
+            phase=phase,
+            content=text,
+            usage=self._adapter.last_usage,
+            streamed=self._adapter.last_streamed,
+            hedge_losses=list(self._adapter.last_hedge_losses),
+        )
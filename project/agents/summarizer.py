@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from agents.base_agent import AgentTurn, BaseProjectAgent
+from providers.aio import run_coroutine
+from providers.llm_provider import LLMProvider
+from prompts.role_prompts import get_summarizer_prompt
+
+
+class SummarizerAgent(BaseProjectAgent):
+    def __init__(self, provider: LLMProvider, language: str = "en") -> None:
+        super().__init__("summarizer", get_summarizer_prompt(language), provider, language)
+
+    @staticmethod
+    def _render(raw_text: str) -> str:
+        raw_text = raw_text.strip()
+        start = raw_text.find("{")
+        end = raw_text.rfind("}")
+        try:
+            payload: Any = json.loads(raw_text[start : end + 1]) if start != -1 and end > start else None
+        except json.JSONDecodeError:
+            payload = None
+        if not isinstance(payload, dict):
+            return raw_text
+
+        parts = [str(payload.get("summary", "")).strip()]
+        for key, label in (("decisions", "Decisions"), ("open_questions", "Open questions")):
+            items = payload.get(key)
+            if isinstance(items, list) and items:
+                parts.append(f"{label}: " + "; ".join(str(item).strip() for item in items if str(item).strip()))
+        return " | ".join(part for part in parts if part)
+
+    def _summarize(self, phase: str, prompt: str) -> AgentTurn:
+        text = run_coroutine(self._adapter.areply(messages=[{"role": "user", "content": prompt}]))
+        return AgentTurn(
+            role=self.role,
+            phase=phase,
+            content=self._render(text),
+            usage=self._adapter.last_usage,
+            hedge_losses=list(self._adapter.last_hedge_losses),
+        )
+
+    def fold_turns(self, phase: str, previous_summary: str, turn_lines: list[str]) -> AgentTurn:
+        prompt = (
+            f"Phase: {phase}\n"
+            "Fold the transcript turns below into the rolling summary of this phase. "
+            "Keep the result under 200 words.\n"
+            f"Current rolling summary:\n{previous_summary or '(empty)'}\n\n"
+            "Turns to fold in:\n" + "\n".join(turn_lines)
+        )
+        return self._summarize(phase, prompt)
+
+    def fold_phase(self, phase: str, previous_meeting_summary: str, phase_summary: str) -> AgentTurn:
+        prompt = (
+            f"Phase: {phase}\n"
+            "Fold the approved phase summary below into the meeting summary that covers all earlier phases. "
+            "Keep the result under 300 words.\n"
+            f"Current meeting summary:\n{previous_meeting_summary or '(empty)'}\n\n"
+            f"Approved summary of phase '{phase}':\n{phase_summary}"
+        )
+        return self._summarize(phase, prompt)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -16,6 +16,11 @@ class ProviderSettings:
     base_url: str
     api_key: str
     model_map: dict[str, str]
+    requests_per_minute: float = 0.0
+    tokens_per_minute: float = 0.0
+    economy_model: str = ""
+    pricing: dict[str, tuple[float, float]] = field(default_factory=dict)
+    options: dict[str, Any] = field(default_factory=dict)
 
 
 @dataclass(frozen=True)
@@ -28,10 +33,21 @@ class RuntimeSettings:
     timeout_seconds: int
     retry_attempts: int
     retry_backoff_seconds: float
+    retry_backoff_max_seconds: float
     new_dialog_per_phase: bool
     smart_forgetting: bool
     context_window_turns: int
     phase_memory_limit: int
+    context_token_budget: int
+    context_role_token_budgets: dict[str, int]
+    context_model_token_budgets: dict[str, int]
+    context_pinned_speakers: tuple[str, ...]
+    incremental_dialog: bool
+    incremental_dialog_max_tokens: int
+    retrieval_top_k: int
+    retrieval_snippet_tokens: int
+    summary_memory_enabled: bool
+    summary_chunk_turns: int
     max_turns_per_phase: int
     global_max_turns: int
     output_dir: Path
@@ -41,6 +57,42 @@ class RuntimeSettings:
     api_key: str
     providers: dict[str, ProviderSettings]
     provider_chain: tuple[str, ...]
+    response_cache_enabled: bool
+    response_cache_memory_entries: int
+    response_cache_disk_entries: int
+    response_cache_ttl_seconds: float
+    http_pool_max_connections: int
+    http_pool_max_keepalive: int
+    http_keepalive_expiry_seconds: float
+    http2_enabled: bool
+    circuit_failure_threshold: int
+    circuit_error_rate_threshold: float
+    circuit_min_samples: int
+    circuit_cooldown_seconds: float
+    health_window_seconds: float
+    hedge_enabled: bool
+    hedge_percentile: float
+    hedge_min_samples: int
+    streaming_enabled: bool
+    budget_phase_soft_tokens: int
+    budget_phase_hard_tokens: int
+    budget_phase_soft_cost_usd: float
+    budget_phase_hard_cost_usd: float
+    budget_meeting_soft_tokens: int
+    budget_meeting_hard_tokens: int
+    budget_meeting_soft_cost_usd: float
+    budget_meeting_hard_cost_usd: float
+    background_persistence: bool
+    journal_fsync_events: int
+    checkpoint_encoding: str
+    checkpoint_compression: str
+    checkpoint_keep_per_project: int
+    checkpoint_max_age_days: int
+    journal_snapshot_events: int
+    batch_max_workers: int
+    cassette_mode: str
+    cassette_path: Path | None
+    cassette_strict: bool
 
 
 def _project_root() -> Path:
@@ -69,6 +121,34 @@ def _parse_backup_providers(raw: str | None, defaults: dict[str, Any]) -> list[s
     return [str(item).strip() for item in configured if str(item).strip()]
 
 
+def _parse_pricing(raw: Any) -> dict[str, tuple[float, float]]:
+    if not isinstance(raw, dict):
+        return {}
+    pricing: dict[str, tuple[float, float]] = {}
+    for model, prices in raw.items():
+        if not isinstance(prices, dict):
+            continue
+        pricing[str(model)] = (
+            max(0.0, float(prices.get("input", 0) or 0)),
+            max(0.0, float(prices.get("output", 0) or 0)),
+        )
+    return pricing
+
+
+def _parse_token_budgets(raw: Any) -> dict[str, int]:
+    if not isinstance(raw, dict):
+        return {}
+    return {str(name): max(0, int(tokens or 0)) for name, tokens in raw.items()}
+
+
+def _parse_name_list(raw: Any) -> list[str]:
+    if isinstance(raw, str):
+        return [item.strip() for item in raw.split(",") if item.strip()]
+    if isinstance(raw, list):
+        return [str(item).strip() for item in raw if str(item).strip()]
+    return []
+
+
 def load_settings() -> RuntimeSettings:
     root = _project_root()
     load_dotenv(root.parent / ".env")
@@ -107,12 +187,110 @@ def load_settings() -> RuntimeSettings:
     timeout_seconds = int(os.getenv("TIMEOUT_SECONDS", defaults.get("timeout_seconds", 45)))
     retry_attempts = int(os.getenv("RETRY_ATTEMPTS", defaults.get("retry_attempts", 2)))
     retry_backoff_seconds = float(os.getenv("RETRY_BACKOFF_SECONDS", defaults.get("retry_backoff_seconds", 1.4)))
+    retry_backoff_max_seconds = float(
+        os.getenv("RETRY_BACKOFF_MAX_SECONDS", defaults.get("retry_backoff_max_seconds", 30))
+    )
     new_dialog_per_phase = _to_bool(os.getenv("NEW_DIALOG_PER_PHASE"), _to_bool(defaults.get("new_dialog_per_phase"), True))
     smart_forgetting = _to_bool(os.getenv("SMART_FORGETTING"), _to_bool(defaults.get("smart_forgetting"), True))
     context_window_turns = int(os.getenv("CONTEXT_WINDOW_TURNS", defaults.get("context_window_turns", 6)))
     phase_memory_limit = int(os.getenv("PHASE_MEMORY_LIMIT", defaults.get("phase_memory_limit", 2)))
+    context_token_budget = int(os.getenv("CONTEXT_TOKEN_BUDGET", defaults.get("context_token_budget", 0)))
+    incremental_dialog = _to_bool(os.getenv("INCREMENTAL_DIALOG"), _to_bool(defaults.get("incremental_dialog"), False))
+    incremental_dialog_max_tokens = int(
+        os.getenv("INCREMENTAL_DIALOG_MAX_TOKENS", defaults.get("incremental_dialog_max_tokens", 12000))
+    )
+    retrieval_top_k = int(os.getenv("RETRIEVAL_TOP_K", defaults.get("retrieval_top_k", 0)))
+    retrieval_snippet_tokens = int(os.getenv("RETRIEVAL_SNIPPET_TOKENS", defaults.get("retrieval_snippet_tokens", 120)))
+    summary_memory_enabled = _to_bool(
+        os.getenv("SUMMARY_MEMORY_ENABLED"), _to_bool(defaults.get("summary_memory_enabled"), False)
+    )
+    summary_chunk_turns = int(os.getenv("SUMMARY_CHUNK_TURNS", defaults.get("summary_chunk_turns", 4)))
+    context_budgets = defaults.get("context_token_budgets") or {}
+    context_pinned_speakers = _parse_name_list(
+        os.getenv("CONTEXT_PINNED_SPEAKERS", defaults.get("context_pinned_speakers", ["human_stakeholder"]))
+    )
     max_turns_per_phase = int(os.getenv("MAX_TURNS_PER_PHASE", defaults.get("max_turns_per_phase", 16)))
     global_max_turns = int(os.getenv("GLOBAL_MAX_TURNS", defaults.get("global_max_turns", 140)))
+    response_cache_enabled = _to_bool(
+        os.getenv("RESPONSE_CACHE_ENABLED"),
+        _to_bool(defaults.get("response_cache_enabled"), deterministic_mode),
+    )
+    response_cache_memory_entries = int(
+        os.getenv("RESPONSE_CACHE_MEMORY_ENTRIES", defaults.get("response_cache_memory_entries", 256))
+    )
+    response_cache_disk_entries = int(
+        os.getenv("RESPONSE_CACHE_DISK_ENTRIES", defaults.get("response_cache_disk_entries", 5000))
+    )
+    response_cache_ttl_seconds = float(
+        os.getenv("RESPONSE_CACHE_TTL_SECONDS", defaults.get("response_cache_ttl_seconds", 604800))
+    )
+
+    http_pool_max_connections = int(
+        os.getenv("HTTP_POOL_MAX_CONNECTIONS", defaults.get("http_pool_max_connections", 20))
+    )
+    http_pool_max_keepalive = int(os.getenv("HTTP_POOL_MAX_KEEPALIVE", defaults.get("http_pool_max_keepalive", 10)))
+    http_keepalive_expiry_seconds = float(
+        os.getenv("HTTP_KEEPALIVE_EXPIRY_SECONDS", defaults.get("http_keepalive_expiry_seconds", 30))
+    )
+    http2_enabled = _to_bool(os.getenv("HTTP2_ENABLED"), _to_bool(defaults.get("http2_enabled"), True))
+    circuit_failure_threshold = int(
+        os.getenv("CIRCUIT_FAILURE_THRESHOLD", defaults.get("circuit_failure_threshold", 3))
+    )
+    circuit_error_rate_threshold = float(
+        os.getenv("CIRCUIT_ERROR_RATE_THRESHOLD", defaults.get("circuit_error_rate_threshold", 0.5))
+    )
+    circuit_min_samples = int(os.getenv("CIRCUIT_MIN_SAMPLES", defaults.get("circuit_min_samples", 4)))
+    circuit_cooldown_seconds = float(
+        os.getenv("CIRCUIT_COOLDOWN_SECONDS", defaults.get("circuit_cooldown_seconds", 30))
+    )
+    health_window_seconds = float(os.getenv("HEALTH_WINDOW_SECONDS", defaults.get("health_window_seconds", 120)))
+    hedge_enabled = _to_bool(os.getenv("HEDGE_ENABLED"), _to_bool(defaults.get("hedge_enabled"), False))
+    hedge_percentile = float(os.getenv("HEDGE_PERCENTILE", defaults.get("hedge_percentile", 0.9)))
+    hedge_min_samples = int(os.getenv("HEDGE_MIN_SAMPLES", defaults.get("hedge_min_samples", 8)))
+    streaming_enabled = _to_bool(os.getenv("STREAMING_ENABLED"), _to_bool(defaults.get("streaming_enabled"), False))
+    budget_phase_soft_tokens = int(os.getenv("BUDGET_PHASE_SOFT_TOKENS", defaults.get("budget_phase_soft_tokens", 0)))
+    budget_phase_hard_tokens = int(os.getenv("BUDGET_PHASE_HARD_TOKENS", defaults.get("budget_phase_hard_tokens", 0)))
+    budget_phase_soft_cost_usd = float(
+        os.getenv("BUDGET_PHASE_SOFT_COST_USD", defaults.get("budget_phase_soft_cost_usd", 0))
+    )
+    budget_phase_hard_cost_usd = float(
+        os.getenv("BUDGET_PHASE_HARD_COST_USD", defaults.get("budget_phase_hard_cost_usd", 0))
+    )
+    budget_meeting_soft_tokens = int(
+        os.getenv("BUDGET_MEETING_SOFT_TOKENS", defaults.get("budget_meeting_soft_tokens", 0))
+    )
+    budget_meeting_hard_tokens = int(
+        os.getenv("BUDGET_MEETING_HARD_TOKENS", defaults.get("budget_meeting_hard_tokens", 0))
+    )
+    budget_meeting_soft_cost_usd = float(
+        os.getenv("BUDGET_MEETING_SOFT_COST_USD", defaults.get("budget_meeting_soft_cost_usd", 0))
+    )
+    budget_meeting_hard_cost_usd = float(
+        os.getenv("BUDGET_MEETING_HARD_COST_USD", defaults.get("budget_meeting_hard_cost_usd", 0))
+    )
+    background_persistence = _to_bool(
+        os.getenv("BACKGROUND_PERSISTENCE"), _to_bool(defaults.get("background_persistence"), True)
+    )
+    journal_fsync_events = int(os.getenv("JOURNAL_FSYNC_EVENTS", defaults.get("journal_fsync_events", 64)))
+    journal_snapshot_events = int(os.getenv("JOURNAL_SNAPSHOT_EVENTS", defaults.get("journal_snapshot_events", 400)))
+    checkpoint_encoding = str(os.getenv("CHECKPOINT_ENCODING", defaults.get("checkpoint_encoding", "json"))).strip().lower()
+    if checkpoint_encoding not in {"json", "msgpack"}:
+        checkpoint_encoding = "json"
+    checkpoint_compression = str(
+        os.getenv("CHECKPOINT_COMPRESSION", defaults.get("checkpoint_compression", "none"))
+    ).strip().lower()
+    if checkpoint_compression not in {"none", "gzip", "zstd"}:
+        checkpoint_compression = "none"
+    checkpoint_keep_per_project = int(
+        os.getenv("CHECKPOINT_KEEP_PER_PROJECT", defaults.get("checkpoint_keep_per_project", 0))
+    )
+    checkpoint_max_age_days = int(os.getenv("CHECKPOINT_MAX_AGE_DAYS", defaults.get("checkpoint_max_age_days", 0)))
+    batch_max_workers = int(os.getenv("BATCH_MAX_WORKERS", defaults.get("batch_max_workers", 0)))
+    cassette_mode = str(os.getenv("CASSETTE_MODE", defaults.get("cassette_mode", "off"))).strip().lower()
+    if cassette_mode not in {"off", "record", "replay"}:
+        raise ValueError("CASSETTE_MODE must be 'off', 'record' or 'replay'.")
+    cassette_path_raw = os.getenv("CASSETTE_PATH", defaults.get("cassette_path", "") or "").strip()
+    cassette_strict = _to_bool(os.getenv("CASSETTE_STRICT"), _to_bool(defaults.get("cassette_strict"), False))
 
     output_dir = root / os.getenv("OUTPUT_DIR", defaults.get("output_dir", "output"))
     logs_dir = root / os.getenv("LOGS_DIR", defaults.get("logs_dir", "logs"))
@@ -127,12 +305,18 @@ def load_settings() -> RuntimeSettings:
     for name in provider_chain:
         cfg = providers[name]
         key_env = cfg.get("api_key_env", "OPENAI_API_KEY")
+        rate_limits = cfg.get("rate_limits") or {}
         provider_settings[name] = ProviderSettings(
             name=name,
             vendor=cfg.get("vendor", "unknown"),
             base_url=cfg.get("base_url", ""),
             api_key=os.getenv(key_env, ""),
             model_map=cfg.get("models", {}),
+            requests_per_minute=max(0.0, float(rate_limits.get("requests_per_minute", 0) or 0)),
+            tokens_per_minute=max(0.0, float(rate_limits.get("tokens_per_minute", 0) or 0)),
+            economy_model=str(cfg.get("economy_model", "") or ""),
+            pricing=_parse_pricing(cfg.get("pricing")),
+            options=dict(cfg.get("options") or {}),
         )
 
     return RuntimeSettings(
@@ -144,10 +328,21 @@ def load_settings() -> RuntimeSettings:
         timeout_seconds=timeout_seconds,
         retry_attempts=max(1, retry_attempts),
         retry_backoff_seconds=max(0.1, retry_backoff_seconds),
+        retry_backoff_max_seconds=max(0.1, retry_backoff_max_seconds),
         new_dialog_per_phase=new_dialog_per_phase,
         smart_forgetting=smart_forgetting,
         context_window_turns=max(2, context_window_turns),
         phase_memory_limit=max(0, phase_memory_limit),
+        context_token_budget=max(0, context_token_budget),
+        context_role_token_budgets=_parse_token_budgets(context_budgets.get("roles")),
+        context_model_token_budgets=_parse_token_budgets(context_budgets.get("models")),
+        context_pinned_speakers=tuple(context_pinned_speakers),
+        incremental_dialog=incremental_dialog,
+        incremental_dialog_max_tokens=max(1000, incremental_dialog_max_tokens),
+        retrieval_top_k=max(0, retrieval_top_k),
+        retrieval_snippet_tokens=max(16, retrieval_snippet_tokens),
+        summary_memory_enabled=summary_memory_enabled,
+        summary_chunk_turns=max(1, summary_chunk_turns),
         max_turns_per_phase=max_turns_per_phase,
         global_max_turns=global_max_turns,
         output_dir=output_dir,
@@ -157,4 +352,40 @@ def load_settings() -> RuntimeSettings:
         api_key=api_key,
         providers=provider_settings,
         provider_chain=provider_chain,
+        response_cache_enabled=response_cache_enabled,
+        response_cache_memory_entries=max(1, response_cache_memory_entries),
+        response_cache_disk_entries=max(0, response_cache_disk_entries),
+        response_cache_ttl_seconds=max(0.0, response_cache_ttl_seconds),
+        http_pool_max_connections=max(1, http_pool_max_connections),
+        http_pool_max_keepalive=max(0, http_pool_max_keepalive),
+        http_keepalive_expiry_seconds=max(0.0, http_keepalive_expiry_seconds),
+        http2_enabled=http2_enabled,
+        circuit_failure_threshold=max(1, circuit_failure_threshold),
+        circuit_error_rate_threshold=min(1.0, max(0.0, circuit_error_rate_threshold)),
+        circuit_min_samples=max(1, circuit_min_samples),
+        circuit_cooldown_seconds=max(0.0, circuit_cooldown_seconds),
+        health_window_seconds=max(1.0, health_window_seconds),
+        hedge_enabled=hedge_enabled,
+        hedge_percentile=min(0.99, max(0.5, hedge_percentile)),
+        hedge_min_samples=max(1, hedge_min_samples),
+        streaming_enabled=streaming_enabled,
+        budget_phase_soft_tokens=max(0, budget_phase_soft_tokens),
+        budget_phase_hard_tokens=max(0, budget_phase_hard_tokens),
+        budget_phase_soft_cost_usd=max(0.0, budget_phase_soft_cost_usd),
+        budget_phase_hard_cost_usd=max(0.0, budget_phase_hard_cost_usd),
+        budget_meeting_soft_tokens=max(0, budget_meeting_soft_tokens),
+        budget_meeting_hard_tokens=max(0, budget_meeting_hard_tokens),
+        budget_meeting_soft_cost_usd=max(0.0, budget_meeting_soft_cost_usd),
+        budget_meeting_hard_cost_usd=max(0.0, budget_meeting_hard_cost_usd),
+        background_persistence=background_persistence,
+        journal_fsync_events=max(1, journal_fsync_events),
+        journal_snapshot_events=max(1, journal_snapshot_events),
+        checkpoint_encoding=checkpoint_encoding,
+        checkpoint_compression=checkpoint_compression,
+        checkpoint_keep_per_project=max(0, checkpoint_keep_per_project),
+        checkpoint_max_age_days=max(0, checkpoint_max_age_days),
+        batch_max_workers=max(0, batch_max_workers),
+        cassette_mode=cassette_mode,
+        cassette_path=root / cassette_path_raw if cassette_path_raw else None,
+        cassette_strict=cassette_strict,
     )
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import queue
+import sys
 import time
 from abc import ABC, abstractmethod
+from collections import deque
 from datetime import datetime
+from pathlib import Path
+
+from providers.cassette import KIND_PROMPT_TEXT, KIND_PROMPT_YES_NO, Cassette
 
 
 class InteractionChannel(ABC):
@@ -18,11 +24,51 @@ class InteractionChannel(ABC):
     def prompt_yes_no(self, prompt: str) -> bool:
         raise NotImplementedError
 
+    def begin_busy(self, label: str) -> None:
+        return None
+
+    def end_busy(self) -> None:
+        return None
+
+    def interrupt_requested(self) -> bool:
+        return False
+
+    @property
+    def supports_streaming(self) -> bool:
+        return False
+
+    def display_stream(self, speaker: str, chunk: str) -> None:
+        return None
+
+    def end_stream(self, speaker: str) -> None:
+        return None
+
 
 class CLIChannel(InteractionChannel):
+    def __init__(self) -> None:
+        self._stream_speaker: str | None = None
+
     def display(self, message: str) -> None:
         print(message)
 
+    @property
+    def supports_streaming(self) -> bool:
+        return True
+
+    def display_stream(self, speaker: str, chunk: str) -> None:
+        # Called from the provider worker thread; stdout writes are safe there.
+        if self._stream_speaker != speaker:
+            sys.stdout.write(f"\n[{speaker}] ")
+            self._stream_speaker = speaker
+        sys.stdout.write(chunk)
+        sys.stdout.flush()
+
+    def end_stream(self, speaker: str) -> None:
+        if self._stream_speaker is not None:
+            sys.stdout.write("\n")
+            sys.stdout.flush()
+        self._stream_speaker = None
+
     def prompt_text(self, prompt: str, allow_interrupt: bool = False) -> str:
         value = input(prompt).strip()
         if allow_interrupt and value.lower() == "/interrupt":
@@ -39,6 +85,110 @@ class CLIChannel(InteractionChannel):
             print("Please answer 'y' or 'n'.")
 
 
+class HeadlessChannel(InteractionChannel):
+    DEFAULT_ANSWER = "No further input from the stakeholder; proceed with the team's best judgement."
+
+    def __init__(
+        self,
+        label: str = "",
+        approve_phases: bool = True,
+        default_answer: str = DEFAULT_ANSWER,
+        answers: list[str] | None = None,
+        approvals: list[bool] | None = None,
+        log_path: Path | None = None,
+    ) -> None:
+        # Used by runs in worker processes, where nobody is attached to stdin. Scripted answers and
+        # approvals are used in order; once they run out, the policy (approve_phases, default_answer) applies.
+        self._prefix = f"[{label}] " if label else ""
+        self.approve_phases = approve_phases
+        self.default_answer = default_answer
+        self._answers = deque(answers or [])
+        self._approvals = deque(approvals or [])
+        self._log = None
+        if log_path is not None:
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            self._log = log_path.open("a", encoding="utf-8", buffering=1)
+
+    def display(self, message: str) -> None:
+        for line in message.splitlines() or [""]:
+            if self._log is not None:
+                self._log.write(f"{line}\n")
+            else:
+                print(f"{self._prefix}{line}", flush=True)
+
+    def prompt_text(self, prompt: str, allow_interrupt: bool = False) -> str:
+        value = self._answers.popleft() if self._answers else self.default_answer
+        self.display(f"{prompt}{value}")
+        if allow_interrupt and value.lower() == "/interrupt":
+            raise KeyboardInterrupt("Scripted interrupt.")
+        return value
+
+    def prompt_yes_no(self, prompt: str) -> bool:
+        value = self._approvals.popleft() if self._approvals else self.approve_phases
+        self.display(f"{prompt}{'y' if value else 'n'}")
+        return value
+
+    def close(self) -> None:
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+
+class CassetteChannel(InteractionChannel):
+    def __init__(self, inner: InteractionChannel, cassette: Cassette) -> None:
+        self._inner = inner
+        self._cassette = cassette
+
+    def display(self, message: str) -> None:
+        self._inner.display(message)
+
+    def prompt_text(self, prompt: str, allow_interrupt: bool = False) -> str:
+        if self._cassette.replaying:
+            value = str(self._cassette.replay_answer(KIND_PROMPT_TEXT, prompt))
+            self._inner.display(f"{prompt}{value}")
+            if allow_interrupt and value.lower() == "/interrupt":
+                raise KeyboardInterrupt("Human interrupted the meeting.")
+            return value
+        try:
+            value = self._inner.prompt_text(prompt, allow_interrupt=allow_interrupt)
+        except KeyboardInterrupt:
+            if allow_interrupt:
+                self._cassette.record_answer(KIND_PROMPT_TEXT, prompt, "/interrupt")
+            raise
+        if self._cassette.recording:
+            self._cassette.record_answer(KIND_PROMPT_TEXT, prompt, value)
+        return value
+
+    def prompt_yes_no(self, prompt: str) -> bool:
+        if self._cassette.replaying:
+            value = bool(self._cassette.replay_answer(KIND_PROMPT_YES_NO, prompt))
+            self._inner.display(f"{prompt}{'y' if value else 'n'}")
+            return value
+        value = self._inner.prompt_yes_no(prompt)
+        if self._cassette.recording:
+            self._cassette.record_answer(KIND_PROMPT_YES_NO, prompt, value)
+        return value
+
+    def begin_busy(self, label: str) -> None:
+        self._inner.begin_busy(label)
+
+    def end_busy(self) -> None:
+        self._inner.end_busy()
+
+    def interrupt_requested(self) -> bool:
+        return self._inner.interrupt_requested()
+
+    @property
+    def supports_streaming(self) -> bool:
+        return self._inner.supports_streaming
+
+    def display_stream(self, speaker: str, chunk: str) -> None:
+        self._inner.display_stream(speaker, chunk)
+
+    def end_stream(self, speaker: str) -> None:
+        self._inner.end_stream(speaker)
+
+
 class MinimalUIChannel(InteractionChannel):
     def __init__(self) -> None:
         try:
@@ -275,6 +425,10 @@ class MinimalUIChannel(InteractionChannel):
         self._status.pack(fill=tk.X, side=tk.BOTTOM)
 
         self._pending_response: str | None = None
+        self._busy = False
+        self._interrupt_pending = False
+        self._stream_queue: queue.SimpleQueue[tuple[str, str]] = queue.SimpleQueue()
+        self._stream_speaker: str | None = None
         self._allow_interrupt = False
         self._expecting_yes_no = False
         self._waiting_for_input = False
@@ -324,9 +478,14 @@ class MinimalUIChannel(InteractionChannel):
         self._entry.delete("1.0", self._tk.END)
 
     def _queue_response(self, response: str) -> None:
+        normalized = response.strip()
+        if self._busy and normalized.lower() == "/interrupt":
+            self._interrupt_pending = True
+            self._interrupt_button.configure(state=self._tk.DISABLED)
+            self._set_status("Interrupt requested; cancelling current request")
+            return
         if not self._waiting_for_input or self._closed:
             return
-        normalized = response.strip()
         if normalized.lower() == "/interrupt" and not self._allow_interrupt:
             return
         self._pending_response = normalized
@@ -346,10 +505,30 @@ class MinimalUIChannel(InteractionChannel):
             return
         self._queue_response(value)
 
+    def _drain_stream(self) -> None:
+        chunks: list[str] = []
+        while True:
+            try:
+                speaker, chunk = self._stream_queue.get_nowait()
+            except queue.Empty:
+                break
+            if self._stream_speaker != speaker:
+                timestamp = datetime.now().strftime("%H:%M:%S")
+                chunks.append(f"[{timestamp}] [{speaker}] ")
+                self._stream_speaker = speaker
+            chunks.append(chunk)
+        if not chunks:
+            return
+        self._log.configure(state=self._tk.NORMAL)
+        self._log.insert(self._tk.END, "".join(chunks))
+        self._log.see(self._tk.END)
+        self._log.configure(state=self._tk.DISABLED)
+
     def _process_events(self) -> None:
         if self._closed:
             return
         try:
+            self._drain_stream()
             self._root.update_idletasks()
             self._root.update()
         except self._tk.TclError:
@@ -361,6 +540,45 @@ class MinimalUIChannel(InteractionChannel):
         self._append_log(message)
         self._process_events()
 
+    def begin_busy(self, label: str) -> None:
+        if self._closed:
+            return
+        self._busy = True
+        self._interrupt_pending = False
+        self._interrupt_button.configure(state=self._tk.NORMAL)
+        self._set_status(label)
+        self._process_events()
+
+    def end_busy(self) -> None:
+        self._busy = False
+        if self._closed:
+            return
+        self._interrupt_button.configure(state=self._tk.DISABLED)
+        self._set_status("Ready")
+
+    def interrupt_requested(self) -> bool:
+        self._process_events()
+        return self._closed or self._interrupt_pending
+
+    @property
+    def supports_streaming(self) -> bool:
+        return not self._closed
+
+    def display_stream(self, speaker: str, chunk: str) -> None:
+        # Tk is not thread-safe: chunks arrive on the provider worker thread and are
+        # rendered by the main thread the next time it processes events.
+        self._stream_queue.put((speaker, chunk))
+
+    def end_stream(self, speaker: str) -> None:
+        if self._closed:
+            return
+        self._process_events()
+        if self._stream_speaker is not None:
+            self._log.configure(state=self._tk.NORMAL)
+            self._log.insert(self._tk.END, "\n")
+            self._log.configure(state=self._tk.DISABLED)
+        self._stream_speaker = None
+
     def prompt_text(self, prompt: str, allow_interrupt: bool = False) -> str:
         if self._closed:
             raise KeyboardInterrupt("UI closed by user.")
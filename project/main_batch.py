@@ -0,0 +1,48 @@
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+from config.settings import load_settings
+from orchestration.batch_runner import BatchJobResult, load_batch_queue, run_batch, write_batch_report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Plan many projects from a YAML or JSONL queue without prompts.")
+    parser.add_argument("queue", help="Queue file (.yaml/.yml or .jsonl) with project name and description records.")
+    parser.add_argument(
+        "--out",
+        help="Batch directory; rerunning into the same directory skips completed jobs "
+        "(default: OUTPUT_DIR/batches/<queue>_<timestamp>).",
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Concurrent meetings (default: BATCH_MAX_WORKERS).")
+    parser.add_argument("--rerun", action="store_true", help="Run completed jobs again instead of skipping them.")
+    args = parser.parse_args()
+
+    settings = load_settings()
+    queue_path = Path(args.queue)
+    jobs = load_batch_queue(queue_path)
+    if not jobs:
+        parser.error(f"No jobs found in {queue_path}.")
+    if args.out:
+        batch_dir = Path(args.out).resolve()
+    else:
+        stamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        batch_dir = settings.output_dir / "batches" / f"{queue_path.stem}_{stamp}"
+    workers = args.workers if args.workers is not None else settings.batch_max_workers
+
+    print(f"Running {len(jobs)} job(s) from {queue_path} into {batch_dir}")
+    done = 0
+
+    def report(result: BatchJobResult, reused: bool) -> None:
+        nonlocal done
+        done += 1
+        print(f"[{done}/{len(jobs)}] {result.describe()}{' (already done)' if reused else ''}", flush=True)
+
+    results = run_batch(jobs, batch_dir, max_workers=workers, rerun_completed=args.rerun, on_result=report)
+    markdown_path, json_path = write_batch_report(results, batch_dir, queue_path)
+    print(f"Batch report: {markdown_path}")
+    print(f"Structured JSON: {json_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import argparse
+from pathlib import Path
+
+from config.settings import load_settings
+from orchestration.branching import BranchSpec, compare_branches, run_branches
+from orchestration.checkpoint_catalog import CheckpointCatalog
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fork a saved meeting into parallel what-if branches.")
+    parser.add_argument("checkpoint", nargs="?", help="Checkpoint or journal file (default: latest in the catalog).")
+    parser.add_argument("--phase", type=int, required=True, help="Phase number (1-based) the branches start from.")
+    parser.add_argument(
+        "--branch",
+        action="append",
+        required=True,
+        metavar="NAME=DIRECTION",
+        help="Branch name and the what-if direction given to the team; repeat for each branch.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="Worker processes (default: one per branch, up to the CPU count).",
+    )
+    args = parser.parse_args()
+
+    settings = load_settings()
+    if args.checkpoint:
+        checkpoint = Path(args.checkpoint)
+    else:
+        catalog = CheckpointCatalog(settings.output_dir)
+        catalog.refresh()
+        entries = catalog.entries()
+        if not entries:
+            parser.error("No checkpoints found; pass a checkpoint file.")
+        checkpoint = catalog.path_for(entries[0])
+
+    specs = [BranchSpec.parse(value) for value in args.branch]
+    print(f"Branching {checkpoint} at phase {args.phase} into: {', '.join(spec.name for spec in specs)}")
+    results = run_branches(checkpoint, args.phase - 1, specs, max_workers=args.workers)
+    for result in results:
+        print(f"  {result.describe()}")
+    markdown_path, json_path = compare_branches(checkpoint, results, settings.output_dir)
+    print(f"Branch comparison: {markdown_path}")
+    print(f"Structured JSON: {json_path}")
+
+
+if __name__ == "__main__":
+    main()
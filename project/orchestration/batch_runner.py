@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable
+
+import yaml
+
+from config.settings import load_settings
+from interaction.channel import HeadlessChannel
+from orchestration.persistence import write_text_durably
+from orchestration.waterfall_controller import WaterfallController
+
+JOB_RESULT_FILENAME = "job_result.json"
+STATUS_COMPLETED = "completed"
+STATUS_INCOMPLETE = "incomplete"
+STATUS_INTERRUPTED = "interrupted"
+STATUS_FAILED = "failed"
+
+
+@dataclass
+class BatchJob:
+    job_id: str
+    project_name: str
+    project_description: str
+    language: str = ""
+    approve_phases: bool = True
+    default_answer: str = HeadlessChannel.DEFAULT_ANSWER
+    answers: list[str] = field(default_factory=list)
+    approvals: list[bool] = field(default_factory=list)
+
+    @classmethod
+    def from_json(cls, payload: dict[str, Any], index: int) -> "BatchJob":
+        project_name = str(payload.get("project_name") or payload.get("name") or "").strip()
+        project_description = str(payload.get("project_description") or payload.get("description") or "").strip()
+        if not project_name or not project_description:
+            raise ValueError(f"Queue record {index} needs a project name and description.")
+        return cls(
+            job_id=WaterfallController._slugify(str(payload.get("id") or f"{index:03d}_{project_name}")),
+            project_name=project_name,
+            project_description=project_description,
+            language=str(payload.get("language", "")).strip().lower(),
+            approve_phases=bool(payload.get("approve_phases", True)),
+            default_answer=str(payload.get("default_answer") or HeadlessChannel.DEFAULT_ANSWER),
+            answers=[str(answer) for answer in payload.get("answers", []) or []],
+            approvals=[bool(approval) for approval in payload.get("approvals", []) or []],
+        )
+
+
+@dataclass
+class BatchJobResult:
+    job_id: str
+    project_name: str
+    status: str
+    total_turns: int = 0
+    approved_phases: int = 0
+    phase_count: int = 0
+    duration_seconds: float = 0.0
+    usage: dict[str, Any] = field(default_factory=dict)
+    outputs: dict[str, str] = field(default_factory=dict)
+    error: str = ""
+    finished_utc: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+
+    def describe(self) -> str:
+        if self.status == STATUS_FAILED:
+            return f"{self.job_id}: {self.status} ({self.error})"
+        return (
+            f"{self.job_id}: {self.status} | {self.approved_phases}/{self.phase_count} phases approved "
+            f"| {self.total_turns} turns | {self.duration_seconds:.1f}s"
+        )
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "project_name": self.project_name,
+            "status": self.status,
+            "total_turns": self.total_turns,
+            "approved_phases": self.approved_phases,
+            "phase_count": self.phase_count,
+            "duration_seconds": round(self.duration_seconds, 3),
+            "usage": self.usage,
+            "outputs": dict(self.outputs),
+            "error": self.error,
+            "finished_utc": self.finished_utc,
+        }
+
+    @classmethod
+    def from_json(cls, payload: dict[str, Any]) -> "BatchJobResult":
+        return cls(
+            job_id=str(payload.get("job_id", "")),
+            project_name=str(payload.get("project_name", "")),
+            status=str(payload.get("status", STATUS_FAILED)),
+            total_turns=int(payload.get("total_turns", 0)),
+            approved_phases=int(payload.get("approved_phases", 0)),
+            phase_count=int(payload.get("phase_count", 0)),
+            duration_seconds=float(payload.get("duration_seconds", 0.0)),
+            usage=dict(payload.get("usage") or {}),
+            outputs={str(name): str(path) for name, path in (payload.get("outputs") or {}).items()},
+            error=str(payload.get("error", "")),
+            finished_utc=str(payload.get("finished_utc", "")),
+        )
+
+
+def load_batch_queue(path: Path) -> list[BatchJob]:
+    text = path.read_text(encoding="utf-8")
+    defaults: dict[str, Any] = {}
+    if path.suffix == ".jsonl":
+        records = [json.loads(line) for line in text.splitlines() if line.strip() and not line.lstrip().startswith("#")]
+    else:
+        payload = yaml.safe_load(text) or []
+        if isinstance(payload, dict):
+            # A mapping form lets shared answer policy sit under `defaults` next to the `jobs` list.
+            defaults = dict(payload.get("defaults") or {})
+            payload = payload.get("jobs") or []
+        records = payload if isinstance(payload, list) else []
+    jobs = [
+        BatchJob.from_json({**defaults, **record}, index)
+        for index, record in enumerate(records, start=1)
+        if isinstance(record, dict)
+    ]
+    job_ids = [job.job_id for job in jobs]
+    duplicates = sorted({job_id for job_id in job_ids if job_ids.count(job_id) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate job ids in {path}: {', '.join(duplicates)}")
+    return jobs
+
+
+def _run_job(job: BatchJob, job_dir: Path) -> BatchJobResult:
+    # Runs in a worker process. Every job gets its own output directory, so checkpoints, catalog,
+    # exports and logs of concurrent jobs never touch the same files.
+    started = time.perf_counter()
+    channel = HeadlessChannel(
+        approve_phases=job.approve_phases,
+        default_answer=job.default_answer,
+        answers=job.answers,
+        approvals=job.approvals,
+        log_path=job_dir / "console.log",
+    )
+    try:
+        settings = load_settings()
+        settings = replace(
+            settings,
+            output_dir=job_dir,
+            logs_dir=job_dir / "logs",
+            meeting_language=job.language or settings.meeting_language,
+        )
+        controller = WaterfallController(channel=channel, settings=settings)
+        state = controller.run(controller.new_state(job.project_name, job.project_description))
+    except Exception as exc:
+        result = BatchJobResult(
+            job_id=job.job_id,
+            project_name=job.project_name,
+            status=STATUS_FAILED,
+            duration_seconds=time.perf_counter() - started,
+            error=f"{type(exc).__name__}: {exc}",
+        )
+    else:
+        if state.is_fully_approved():
+            status = STATUS_COMPLETED
+        else:
+            status = STATUS_INTERRUPTED if state.interrupted else STATUS_INCOMPLETE
+        result = BatchJobResult(
+            job_id=job.job_id,
+            project_name=job.project_name,
+            status=status,
+            total_turns=state.total_turns,
+            approved_phases=sum(1 for phase_state in state.phase_states.values() if phase_state.approved_by_human),
+            phase_count=len(state.phases),
+            duration_seconds=time.perf_counter() - started,
+            usage=state.usage_totals().to_json(),
+            outputs={name: str(path) for name, path in controller.outputs.items()},
+        )
+    finally:
+        channel.close()
+    write_text_durably(job_dir / JOB_RESULT_FILENAME, json.dumps(result.to_json(), indent=2, ensure_ascii=False))
+    return result
+
+
+def _previous_result(job_dir: Path) -> BatchJobResult | None:
+    try:
+        return BatchJobResult.from_json(json.loads((job_dir / JOB_RESULT_FILENAME).read_text(encoding="utf-8")))
+    except (OSError, ValueError):
+        return None
+
+
+def run_batch(
+    jobs: list[BatchJob],
+    batch_dir: Path,
+    max_workers: int = 0,
+    rerun_completed: bool = False,
+    on_result: Callable[[BatchJobResult, bool], None] | None = None,
+) -> list[BatchJobResult]:
+    results: dict[str, BatchJobResult] = {}
+    pending: list[BatchJob] = []
+    for job in jobs:
+        previous = None if rerun_completed else _previous_result(batch_dir / job.job_id)
+        # Rerunning a queue into the same directory only picks up jobs that did not complete.
+        if previous is not None and previous.status == STATUS_COMPLETED:
+            results[job.job_id] = previous
+            if on_result is not None:
+                on_result(previous, True)
+        else:
+            pending.append(job)
+
+    if pending:
+        workers = max_workers if max_workers > 0 else os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=min(workers, len(pending))) as pool:
+            futures = {pool.submit(_run_job, job, batch_dir / job.job_id): job for job in pending}
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    result = future.result()
+                except Exception as exc:
+                    # The worker process itself died; the job gets a failed result instead of aborting the batch.
+                    result = BatchJobResult(
+                        job_id=job.job_id,
+                        project_name=job.project_name,
+                        status=STATUS_FAILED,
+                        error=f"{type(exc).__name__}: {exc}",
+                    )
+                results[job.job_id] = result
+                if on_result is not None:
+                    on_result(result, False)
+    return [results[job.job_id] for job in jobs]
+
+
+def write_batch_report(results: list[BatchJobResult], batch_dir: Path, queue_path: Path) -> tuple[Path, Path]:
+    counts: dict[str, int] = {}
+    for result in results:
+        counts[result.status] = counts.get(result.status, 0) + 1
+    total_tokens = sum(int(result.usage.get("total_tokens", 0)) for result in results)
+    total_cost = sum(float(result.usage.get("cost_usd", 0.0)) for result in results)
+    total_seconds = sum(result.duration_seconds for result in results)
+
+    payload = {
+        "queue": str(queue_path),
+        "generated_utc": datetime.utcnow().isoformat(),
+        "jobs": len(results),
+        "status_counts": counts,
+        "total_tokens": total_tokens,
+        "total_cost_usd": round(total_cost, 6),
+        "total_job_seconds": round(total_seconds, 3),
+        "results": [result.to_json() for result in results],
+    }
+    lines = [
+        f"# Batch Report: {queue_path.name}",
+        "",
+        f"Jobs: {len(results)} | " + " | ".join(f"{status}: {count}" for status, count in sorted(counts.items())),
+        f"Tokens: {total_tokens} | Cost, USD: {total_cost:.4f} | Job time: {total_seconds:.1f}s",
+        "",
+        "| Job | Project | Status | Phases approved | Turns | Tokens | Cost, USD | Time, s | Plan |",
+        "|---|---|---|---|---|---|---|---|---|",
+    ]
+    for result in results:
+        plan = result.outputs.get("markdown", "")
+        plan_cell = os.path.relpath(plan, batch_dir) if plan else result.error
+        project_cell = result.project_name.replace("|", "\\|")
+        plan_cell = plan_cell.replace("|", "\\|")
+        lines.append(
+            f"| {result.job_id} | {project_cell} | {result.status} "
+            f"| {result.approved_phases}/{result.phase_count} | {result.total_turns} "
+            f"| {int(result.usage.get('total_tokens', 0))} | {float(result.usage.get('cost_usd', 0.0)):.4f} "
+            f"| {result.duration_seconds:.1f} | {plan_cell} |"
+        )
+    lines.append("")
+
+    md_path = write_text_durably(batch_dir / "batch_report.md", "\n".join(lines))
+    json_path = write_text_durably(batch_dir / "batch_report.json", json.dumps(payload, indent=2, ensure_ascii=False))
+    return md_path, json_path
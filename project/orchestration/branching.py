@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from interaction.channel import HeadlessChannel
+from orchestration.checkpoint_catalog import CheckpointCatalog, load_checkpoint
+from orchestration.meeting_state import MeetingState
+from orchestration.waterfall_controller import WaterfallController
+from output.exporter import ProjectPlanExporter
+
+
+@dataclass(frozen=True)
+class BranchSpec:
+    name: str
+    direction: str = ""
+
+    @classmethod
+    def parse(cls, value: str) -> "BranchSpec":
+        name, _, direction = value.partition("=")
+        return cls(name=name.strip(), direction=direction.strip())
+
+
+@dataclass
+class BranchResult:
+    name: str
+    outputs: dict[str, Path] = field(default_factory=dict)
+    total_turns: int = 0
+    fully_approved: bool = False
+    error: str = ""
+
+    @property
+    def journal(self) -> Path | None:
+        return self.outputs.get("journal")
+
+    def describe(self) -> str:
+        if self.error:
+            return f"{self.name}: failed ({self.error})"
+        status = "approved" if self.fully_approved else "incomplete"
+        return f"{self.name}: {status} | {self.total_turns} turns | {self.journal}"
+
+
+def _run_branch(checkpoint: Path, phase_index: int, spec: BranchSpec) -> BranchResult:
+    # Runs in a worker process. Only the checkpoint path crosses the process boundary; the worker
+    # loads it lazily, so shared phases before the branch point are never decoded there.
+    try:
+        state = load_checkpoint(checkpoint).branch(phase_index, spec.name, spec.direction)
+        controller = WaterfallController(channel=HeadlessChannel(label=spec.name))
+        final_state = controller.run(state)
+    except Exception as exc:
+        return BranchResult(name=spec.name, error=f"{type(exc).__name__}: {exc}")
+    return BranchResult(
+        name=spec.name,
+        outputs=dict(controller.outputs),
+        total_turns=final_state.total_turns,
+        fully_approved=final_state.is_fully_approved(),
+    )
+
+
+def run_branches(
+    checkpoint: Path,
+    phase_index: int,
+    specs: list[BranchSpec],
+    max_workers: int = 0,
+) -> list[BranchResult]:
+    names = [spec.name for spec in specs]
+    if not specs or any(not name for name in names) or len(set(names)) != len(names):
+        raise ValueError("Branches need distinct, non-empty names.")
+    # Fails fast on a bad phase index or a name clash before any worker starts.
+    parent = load_checkpoint(checkpoint)
+    for spec in specs:
+        parent.branch(phase_index, spec.name)
+
+    workers = max_workers if max_workers > 0 else min(len(specs), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_run_branch, checkpoint, phase_index, spec) for spec in specs]
+        return [future.result() for future in futures]
+
+
+def compare_branches(checkpoint: Path, results: list[BranchResult], output_dir: Path) -> tuple[Path, Path]:
+    # Workers update the shared catalog concurrently, so it is re-indexed from the files on disk.
+    CheckpointCatalog(output_dir).refresh()
+    states: list[MeetingState] = [load_checkpoint(checkpoint)]
+    states.extend(load_checkpoint(result.journal) for result in results if result.journal is not None)
+    return ProjectPlanExporter(output_dir).export_branch_comparison(states)
@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from orchestration.journal import JOURNAL_SUFFIX, journal_sidecars, sidecar_sizes
+from orchestration.meeting_state import MeetingState
+from orchestration.persistence import PersistenceWriter, write_text_durably
+
+CATALOG_FILENAME = "catalog.json"
+CATALOG_VERSION = 1
+CHECKPOINT_PATTERNS = (f"meeting_journal_*{JOURNAL_SUFFIX}", "meeting_checkpoint_*.json")
+LEGACY_EXPORT_PATTERN = "project_development_*.json"
+
+
+@dataclass
+class CatalogEntry:
+    file: str
+    project: str
+    phase: str
+    phase_index: int
+    phase_count: int
+    reason: str
+    total_turns: int
+    created_utc: str
+    updated_utc: str
+    size_bytes: int = 0
+    interrupted: bool = False
+    approved_phases: int = 0
+    phase_turns: dict[str, int] = field(default_factory=dict)
+    branch: str = ""
+    parent_branch: str = ""
+
+    @classmethod
+    def from_state(cls, file: str, state: MeetingState, reason: str, created_utc: str = "") -> "CatalogEntry":
+        now = datetime.utcnow().isoformat()
+        return cls(
+            file=file,
+            project=state.project_name,
+            phase=state.current_phase,
+            phase_index=state.current_phase_index,
+            phase_count=len(state.phases),
+            reason=reason,
+            total_turns=state.total_turns,
+            created_utc=created_utc or now,
+            updated_utc=now,
+            interrupted=state.interrupted,
+            approved_phases=sum(1 for phase_state in state.phase_states.values() if phase_state.approved_by_human),
+            phase_turns={name: phase_state.turn_count for name, phase_state in state.phase_states.items()},
+            branch=state.branch_name if state.lineage else "",
+            parent_branch=state.lineage[-1].parent if state.lineage else "",
+        )
+
+    def describe(self) -> str:
+        stamp = self.updated_utc[:16].replace("T", " ")
+        project = f"{self.project} [{self.branch} <- {self.parent_branch}]" if self.branch else self.project
+        return (
+            f"{project} | phase {self.phase_index + 1}/{self.phase_count} {self.phase} | {self.reason} "
+            f"| {self.total_turns} turns | {self.approved_phases} approved | {stamp} UTC "
+            f"| {self.size_bytes / 1024:.0f} KB"
+        )
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "file": self.file,
+            "project": self.project,
+            "phase": self.phase,
+            "phase_index": self.phase_index,
+            "phase_count": self.phase_count,
+            "reason": self.reason,
+            "total_turns": self.total_turns,
+            "created_utc": self.created_utc,
+            "updated_utc": self.updated_utc,
+            "size_bytes": self.size_bytes,
+            "interrupted": self.interrupted,
+            "approved_phases": self.approved_phases,
+            "phase_turns": dict(self.phase_turns),
+            "branch": self.branch,
+            "parent_branch": self.parent_branch,
+        }
+
+    @classmethod
+    def from_json(cls, payload: dict[str, Any]) -> "CatalogEntry":
+        phase_turns = payload.get("phase_turns", {})
+        return cls(
+            file=str(payload["file"]),
+            project=str(payload.get("project", "Untitled Project")),
+            phase=str(payload.get("phase", "")),
+            phase_index=int(payload.get("phase_index", 0)),
+            phase_count=int(payload.get("phase_count", 0)),
+            reason=str(payload.get("reason", "")),
+            total_turns=int(payload.get("total_turns", 0)),
+            created_utc=str(payload.get("created_utc", "")),
+            updated_utc=str(payload.get("updated_utc", "")),
+            size_bytes=int(payload.get("size_bytes", 0)),
+            interrupted=bool(payload.get("interrupted", False)),
+            approved_phases=int(payload.get("approved_phases", 0)),
+            phase_turns={str(name): int(turns) for name, turns in phase_turns.items()}
+            if isinstance(phase_turns, dict)
+            else {},
+            branch=str(payload.get("branch", "")),
+            parent_branch=str(payload.get("parent_branch", "")),
+        )
+
+
+def load_checkpoint(path: Path) -> MeetingState:
+    if path.suffix == JOURNAL_SUFFIX:
+        return MeetingState.from_journal(path)
+    with path.open("r", encoding="utf-8") as handle:
+        return MeetingState.from_json(json.load(handle))
+
+
+class CheckpointCatalog:
+    def __init__(self, output_dir: Path, writer: PersistenceWriter | None = None) -> None:
+        # Entry files are relative to the output directory, so legacy plan exports can be listed too.
+        self.output_dir = output_dir
+        self.checkpoint_dir = output_dir / "checkpoints"
+        self.path = self.checkpoint_dir / CATALOG_FILENAME
+        self._writer = writer
+        self._entries: dict[str, CatalogEntry] = {}
+        self._loaded = False
+        # Files recorded since the last catalog write; only these are measured when it is written.
+        self._unsized: set[str] = set()
+        self._lock = threading.Lock()
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return
+        if not isinstance(payload, dict) or payload.get("version") != CATALOG_VERSION:
+            return
+        for raw in payload.get("entries", []):
+            if isinstance(raw, dict) and raw.get("file"):
+                entry = CatalogEntry.from_json(raw)
+                self._entries[entry.file] = entry
+
+    def _scan(self) -> list[str]:
+        # Directory listing only; nothing is stat'ed or opened for files the catalog already knows.
+        names = [
+            f"checkpoints/{path.name}"
+            for pattern in CHECKPOINT_PATTERNS
+            for path in self.checkpoint_dir.glob(pattern)
+        ]
+        if not names:
+            names = [path.name for path in self.output_dir.glob(LEGACY_EXPORT_PATTERN)]
+        return names
+
+    def _index_file(self, file: str) -> CatalogEntry | None:
+        path = self.output_dir / file
+        try:
+            state = load_checkpoint(path)
+            stat = path.stat()
+        except Exception:
+            return None
+        modified = datetime.utcfromtimestamp(stat.st_mtime).isoformat()
+        entry = CatalogEntry.from_state(file, state, reason="indexed", created_utc=modified)
+        entry.updated_utc = modified
+        entry.size_bytes = stat.st_size + sum(sidecar.stat().st_size for sidecar in journal_sidecars(path))
+        return entry
+
+    def refresh(self) -> tuple[int, int]:
+        self._load()
+        on_disk = set(self._scan())
+        dropped = [file for file in self._entries if file not in on_disk]
+        for file in dropped:
+            del self._entries[file]
+        indexed = 0
+        for file in sorted(on_disk - self._entries.keys()):
+            entry = self._index_file(file)
+            if entry is not None:
+                self._entries[file] = entry
+                indexed += 1
+        if dropped or indexed:
+            self.save()
+        return indexed, len(dropped)
+
+    def entries(self) -> list[CatalogEntry]:
+        self._load()
+        return sorted(self._entries.values(), key=lambda entry: entry.updated_utc, reverse=True)
+
+    def path_for(self, entry: CatalogEntry) -> Path:
+        return self.output_dir / entry.file
+
+    def record(self, path: Path, state: MeetingState, reason: str) -> CatalogEntry:
+        self._load()
+        file = path.relative_to(self.output_dir).as_posix()
+        previous = self._entries.get(file)
+        entry = CatalogEntry.from_state(file, state, reason, created_utc=previous.created_utc if previous else "")
+        entry.size_bytes = previous.size_bytes if previous else 0
+        self._entries[file] = entry
+        with self._lock:
+            self._unsized.add(file)
+        self.save()
+        return entry
+
+    def apply_retention(self, keep_per_project: int, max_age_days: int, protect: set[Path]) -> list[Path]:
+        self._load()
+        protected = {path.relative_to(self.output_dir).as_posix() for path in protect}
+        cutoff = (datetime.utcnow() - timedelta(days=max_age_days)).isoformat() if max_age_days > 0 else ""
+        kept_per_project: dict[str, int] = {}
+        removed: list[Path] = []
+        for entry in self.entries():
+            if not entry.file.startswith("checkpoints/"):
+                continue
+            kept = kept_per_project.get(entry.project, 0)
+            expired = bool(cutoff) and entry.updated_utc < cutoff
+            over_limit = keep_per_project > 0 and kept >= keep_per_project
+            if entry.file in protected or not (expired or over_limit):
+                kept_per_project[entry.project] = kept + 1
+                continue
+            path = self.path_for(entry)
+            try:
+                for sidecar in journal_sidecars(path):
+                    sidecar.unlink(missing_ok=True)
+                path.unlink(missing_ok=True)
+            except OSError:
+                continue
+            del self._entries[entry.file]
+            removed.append(path)
+        if removed:
+            self.save()
+        return removed
+
+    def save(self) -> None:
+        entries = [entry.to_json() for entry in self.entries()]
+
+        def write() -> Path:
+            # Sizes of recorded files are read when the catalog is written, after the queued checkpoint
+            # writes have landed. Every other entry keeps its stored size; refresh() indexes new files.
+            with self._lock:
+                # A file recorded after this job's snapshot was taken is left for the next write.
+                unsized = self._unsized & {raw["file"] for raw in entries}
+                self._unsized -= unsized
+            sidecars = sidecar_sizes(self.checkpoint_dir) if unsized else {}
+            for raw in entries:
+                if raw["file"] not in unsized:
+                    continue
+                path = self.output_dir / raw["file"]
+                try:
+                    raw["size_bytes"] = os.path.getsize(path) + sidecars.get(path.name, 0)
+                except OSError:
+                    continue
+                entry = self._entries.get(raw["file"])
+                if entry is not None:
+                    entry.size_bytes = raw["size_bytes"]
+            payload = {"version": CATALOG_VERSION, "entries": entries}
+            return write_text_durably(self.path, json.dumps(payload, ensure_ascii=False, indent=2))
+
+        if self._writer is None:
+            write()
+        else:
+            self._writer.submit(write, key=f"catalog:{self.path}")
@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+from typing import Any
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+FORMAT_MAGIC = b"MCKP"
+FORMAT_VERSION = 1
+ENCODINGS = ("json", "msgpack")
+COMPRESSIONS = ("none", "gzip", "zstd")
+
+# Strings shorter than this are cheaper inline than as a reference.
+BLOB_MIN_CHARS = 48
+BLOB_KEY = "$blob"
+TURN_KEY = "$turn"
+RAW_KEY = "$raw"
+ROWS_KEY = "$rows"
+DERIVED_KEYS = ("usage_summary",)
+
+
+def encoding_available(encoding: str) -> bool:
+    return encoding == "json" or (encoding == "msgpack" and msgpack is not None)
+
+
+def compression_available(compression: str) -> bool:
+    return compression in {"none", "gzip"} or (compression == "zstd" and zstandard is not None)
+
+
+def parse_turn_payload(content: str) -> dict[str, Any] | None:
+    text = content.strip()
+    start = text.find("{")
+    end = text.rfind("}")
+    if start == -1 or end <= start:
+        return None
+    try:
+        payload = json.loads(text[start : end + 1])
+    except json.JSONDecodeError:
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def _turn_contents(payload: dict[str, Any]) -> list[tuple[int, str]]:
+    columns = payload.get("transcript_columns")
+    if isinstance(columns, dict):
+        return [(int(turn), str(content)) for turn, content in zip(columns.get("turn", []), columns.get("content", []))]
+    return [(int(row["turn"]), str(row.get("content", ""))) for row in payload.get("transcript", [])]
+
+
+def _digest(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=12).hexdigest()
+
+
+class _Packer:
+    def __init__(self) -> None:
+        self.blobs: dict[str, str] = {}
+
+    def value(self, value: Any) -> Any:
+        if isinstance(value, str):
+            if len(value) < BLOB_MIN_CHARS:
+                return value
+            key = _digest(value)
+            self.blobs.setdefault(key, value)
+            return {BLOB_KEY: key}
+        if isinstance(value, list):
+            columns = self._columns(value)
+            if columns is not None:
+                # Uniform records (transcript rows, usage records) are stored column names once, values per row.
+                return {ROWS_KEY: list(columns), "data": [[self.value(item[key]) for key in columns] for item in value]}
+            return [self.value(item) for item in value]
+        if isinstance(value, dict):
+            packed = {str(key): self.value(item) for key, item in value.items()}
+            # Agent payloads could contain a key that looks like a reference marker; those are wrapped.
+            if any(str(key).startswith("$") for key in value):
+                return {RAW_KEY: packed}
+            return packed
+        return value
+
+    @staticmethod
+    def _columns(value: list[Any]) -> tuple[str, ...] | None:
+        if len(value) < 2 or not isinstance(value[0], dict):
+            return None
+        columns = tuple(value[0])
+        if any(not isinstance(key, str) or key.startswith("$") for key in columns):
+            return None
+        for item in value:
+            if not isinstance(item, dict) or tuple(item) != columns:
+                return None
+        return columns
+
+
+def _unpack_value(value: Any, blobs: dict[str, str]) -> Any:
+    if isinstance(value, list):
+        return [_unpack_value(item, blobs) for item in value]
+    if isinstance(value, dict):
+        if BLOB_KEY in value and len(value) == 1:
+            return blobs[value[BLOB_KEY]]
+        if ROWS_KEY in value and len(value) == 2:
+            columns = value[ROWS_KEY]
+            return [
+                {key: _unpack_value(item, blobs) for key, item in zip(columns, row)} for row in value["data"]
+            ]
+        if RAW_KEY in value and len(value) == 1:
+            value = value[RAW_KEY]
+        return {key: _unpack_value(item, blobs) for key, item in value.items()}
+    return value
+
+
+def _split_sections(payload: dict[str, Any], eager_phases: set[str]) -> dict[str, dict[str, Any]]:
+    columns = payload.get("transcript_columns")
+    if not isinstance(columns, dict) or not columns.get("turn"):
+        return {}
+    names = columns["phases"]
+    phase_of_row = [names[index] for index in columns["phase"]]
+    newest_turn: dict[str, int] = {}
+    for turn, phase in zip(columns["turn"], phase_of_row):
+        newest_turn[phase] = max(newest_turn.get(phase, turn), turn)
+    eager_turns = [turn for turn, phase in zip(columns["turn"], phase_of_row) if phase in eager_phases]
+    cutoff = min(eager_turns) if eager_turns else None
+    # Only phases entirely older than the eager ones are split out, so the loaded transcript stays a suffix.
+    deferred = {
+        phase
+        for phase in names
+        if phase not in eager_phases and (cutoff is None or newest_turn.get(phase, 0) < cutoff)
+    }
+    if not deferred:
+        return {}
+    row_keys = [key for key in columns if key not in {"phases", "speakers"}]
+    rows_by_phase: dict[str, list[int]] = {}
+    for row, phase in enumerate(phase_of_row):
+        rows_by_phase.setdefault(phase if phase in deferred else "", []).append(row)
+
+    def subset(rows: list[int]) -> dict[str, Any]:
+        return {
+            "phases": names,
+            "speakers": columns["speakers"],
+            **{key: [columns[key][row] for row in rows] for key in row_keys},
+        }
+
+    phase_states = dict(payload.get("phase_states", {}))
+    sections: dict[str, dict[str, Any]] = {}
+    for phase in deferred:
+        phase_payload = dict(phase_states.get(phase, {}))
+        sections[phase] = {
+            "transcript_columns": subset(rows_by_phase[phase]),
+            "phase_states": {phase: {"raw_contributions": phase_payload.get("raw_contributions", [])}},
+        }
+        phase_payload["raw_contributions"] = []
+        phase_states[phase] = phase_payload
+    payload["phase_states"] = phase_states
+    payload["transcript_columns"] = subset(rows_by_phase.get("", []))
+    return sections
+
+
+def pack_state(payload: dict[str, Any], eager_phases: set[str] | None = None) -> dict[str, Any]:
+    payload = dict(payload)
+    # Sections still encoded in the state are passed through untouched.
+    sections: dict[str, str] = dict(payload.pop("deferred_sections", None) or {})
+    if eager_phases is not None:
+        for phase, section in _split_sections(payload, eager_phases).items():
+            sections[phase] = json.dumps(pack_state(section), ensure_ascii=False, separators=(",", ":"))
+    packer = _Packer()
+    # A contribution is the parsed JSON of its agent turn, so it is stored as a reference to that turn.
+    turn_by_payload: dict[str, int] = {}
+    for turn, content in _turn_contents(payload):
+        parsed = parse_turn_payload(content)
+        if parsed is not None:
+            turn_by_payload.setdefault(json.dumps(parsed, sort_keys=True, ensure_ascii=False), turn)
+
+    state: dict[str, Any] = {}
+    for key, value in payload.items():
+        if key in DERIVED_KEYS:
+            continue
+        if key == "phase_states":
+            phases: dict[str, Any] = {}
+            for phase, phase_payload in value.items():
+                packed_phase = {
+                    name: packer.value(item) for name, item in phase_payload.items() if name != "raw_contributions"
+                }
+                contributions = []
+                for contribution in phase_payload.get("raw_contributions", []):
+                    turn = turn_by_payload.get(json.dumps(contribution, sort_keys=True, ensure_ascii=False))
+                    contributions.append({TURN_KEY: turn} if turn is not None else packer.value(contribution))
+                packed_phase["raw_contributions"] = contributions
+                phases[phase] = packed_phase
+            state[key] = phases
+        else:
+            state[key] = packer.value(value)
+    packed = {"format": FORMAT_VERSION, "blobs": packer.blobs, "state": state}
+    if sections:
+        packed["sections"] = sections
+    return packed
+
+
+def unpack_state(packed: dict[str, Any]) -> dict[str, Any]:
+    blobs = packed.get("blobs", {})
+    payload = {key: _unpack_value(value, blobs) for key, value in packed.get("state", {}).items()}
+    contents = dict(_turn_contents(payload))
+    for phase_payload in payload.get("phase_states", {}).values():
+        contributions = []
+        for contribution in phase_payload.get("raw_contributions", []):
+            if isinstance(contribution, dict) and TURN_KEY in contribution and len(contribution) == 1:
+                contribution = parse_turn_payload(contents.get(int(contribution[TURN_KEY]), "")) or {}
+            contributions.append(contribution)
+        phase_payload["raw_contributions"] = contributions
+    if packed.get("sections"):
+        payload["deferred_sections"] = dict(packed["sections"])
+    return payload
+
+
+def unpack_section(text: str) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    payload = unpack_state(json.loads(text))
+    contributions = [
+        contribution
+        for phase_payload in payload.get("phase_states", {}).values()
+        for contribution in phase_payload.get("raw_contributions", [])
+    ]
+    return payload.get("transcript_columns", {}), contributions
+
+
+def encode_checkpoint(
+    payload: dict[str, Any],
+    encoding: str = "json",
+    compression: str = "none",
+    eager_phases: set[str] | None = None,
+) -> bytes:
+    if not encoding_available(encoding):
+        raise RuntimeError(f"Checkpoint encoding '{encoding}' is not available (install the msgpack package).")
+    if not compression_available(compression):
+        raise RuntimeError(f"Checkpoint compression '{compression}' is not available (install the zstandard package).")
+    packed = pack_state(payload, eager_phases)
+    if encoding == "msgpack":
+        body = msgpack.packb(packed, use_bin_type=True)
+    else:
+        body = json.dumps(packed, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if compression == "gzip":
+        body = gzip.compress(body, compresslevel=6)
+    elif compression == "zstd":
+        body = zstandard.ZstdCompressor(level=6).compress(body)
+    header = FORMAT_MAGIC + bytes([FORMAT_VERSION, ENCODINGS.index(encoding), COMPRESSIONS.index(compression)])
+    return header + body
+
+
+def is_encoded_checkpoint(data: bytes) -> bool:
+    return data[: len(FORMAT_MAGIC)] == FORMAT_MAGIC
+
+
+def decode_checkpoint(data: bytes) -> dict[str, Any]:
+    if not is_encoded_checkpoint(data):
+        raise ValueError("Not an encoded meeting checkpoint.")
+    offset = len(FORMAT_MAGIC)
+    version, encoding_id, compression_id = data[offset], data[offset + 1], data[offset + 2]
+    if version > FORMAT_VERSION or encoding_id >= len(ENCODINGS) or compression_id >= len(COMPRESSIONS):
+        raise ValueError(f"Unsupported checkpoint format (version {version}).")
+    encoding = ENCODINGS[encoding_id]
+    compression = COMPRESSIONS[compression_id]
+    if not encoding_available(encoding) or not compression_available(compression):
+        raise RuntimeError(f"Reading this checkpoint requires {encoding}/{compression} support to be installed.")
+
+    body = data[offset + 3 :]
+    if compression == "gzip":
+        body = gzip.decompress(body)
+    elif compression == "zstd":
+        body = zstandard.ZstdDecompressor().decompress(body)
+    if encoding == "msgpack":
+        packed = msgpack.unpackb(body, raw=False, strict_map_key=False)
+    else:
+        packed = json.loads(body.decode("utf-8"))
+    return unpack_state(packed)
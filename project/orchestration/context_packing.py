@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterable
+
+from providers.tokens import MESSAGE_OVERHEAD_TOKENS, estimate_tokens, truncate_to_tokens
+
+if TYPE_CHECKING:
+    from config.settings import RuntimeSettings
+    from orchestration.meeting_state import TranscriptEntry
+
+MEMORY_SHARE = 0.25
+PINNED_SHARE = 0.5
+RETRIEVAL_SHARE = 0.25
+
+
+@dataclass(frozen=True)
+class ContextBudget:
+    default_tokens: int = 0
+    role_tokens: dict[str, int] = field(default_factory=dict)
+    model_tokens: dict[str, int] = field(default_factory=dict)
+    pinned_speakers: frozenset[str] = frozenset()
+
+    def tokens_for(self, role: str, model: str) -> int:
+        if self.default_tokens <= 0:
+            return 0
+        limits = [limit for limit in (self.role_tokens.get(role, 0), self.model_tokens.get(model, 0)) if limit > 0]
+        return min(limits) if limits else self.default_tokens
+
+
+@dataclass
+class PackedContext:
+    messages: list[dict[str, str]]
+    tokens: int
+    budget: int
+    turns: list[int]
+
+
+def build_context_budget(settings: RuntimeSettings) -> ContextBudget:
+    return ContextBudget(
+        default_tokens=settings.context_token_budget,
+        role_tokens=dict(settings.context_role_token_budgets),
+        model_tokens=dict(settings.context_model_token_budgets),
+        pinned_speakers=frozenset(settings.context_pinned_speakers),
+    )
+
+
+def _message(content: str) -> dict[str, str]:
+    return {"role": "user", "content": content}
+
+
+def pack_context(
+    recent: Iterable[TranscriptEntry],
+    memory: str,
+    budget_tokens: int,
+    pinned: Iterable[TranscriptEntry] = (),
+) -> PackedContext:
+    # Both entry streams run newest first and are only consumed until the budget is spent, so lazily
+    # loaded history is decoded no further back than the packed context reaches.
+    recent = iter(recent)
+    remaining = budget_tokens
+    memory_message: dict[str, str] | None = None
+    if memory:
+        memory_cap = max(MESSAGE_OVERHEAD_TOKENS + 1, int(budget_tokens * MEMORY_SHARE))
+        memory_text = truncate_to_tokens(memory, memory_cap - MESSAGE_OVERHEAD_TOKENS)
+        if memory_text:
+            memory_message = _message(memory_text)
+            remaining -= estimate_tokens(memory_text) + MESSAGE_OVERHEAD_TOKENS
+
+    selected: dict[int, str] = {}
+    newest = next(recent, None) if remaining > MESSAGE_OVERHEAD_TOKENS else None
+    if newest is not None:
+        # The newest turn is what the speaker reacts to, so it is kept even when it has to be cut down.
+        if newest.token_estimate <= remaining:
+            selected[newest.turn] = newest.context_line
+            remaining -= newest.token_estimate
+        else:
+            selected[newest.turn] = truncate_to_tokens(newest.context_line, remaining - MESSAGE_OVERHEAD_TOKENS)
+            remaining = 0
+
+    pinned_left = min(remaining, int(budget_tokens * PINNED_SHARE))
+    for entry in pinned:
+        if pinned_left <= MESSAGE_OVERHEAD_TOKENS:
+            break
+        if entry.turn in selected or entry.token_estimate > pinned_left:
+            continue
+        selected[entry.turn] = entry.context_line
+        pinned_left -= entry.token_estimate
+        remaining -= entry.token_estimate
+
+    for entry in recent:
+        if entry.turn in selected:
+            continue
+        if entry.token_estimate > remaining:
+            break
+        selected[entry.turn] = entry.context_line
+        remaining -= entry.token_estimate
+
+    messages = [memory_message] if memory_message else []
+    messages.extend(_message(selected[turn]) for turn in sorted(selected))
+    return PackedContext(
+        messages=messages,
+        tokens=budget_tokens - remaining,
+        budget=budget_tokens,
+        turns=sorted(selected),
+    )
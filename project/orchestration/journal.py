@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterator
+
+from orchestration.checkpoint_format import decode_checkpoint, encode_checkpoint, pack_state, unpack_state
+from orchestration.persistence import write_bytes_durably
+
+if TYPE_CHECKING:
+    from orchestration.meeting_state import MeetingState
+    from orchestration.persistence import PersistenceWriter
+
+JOURNAL_VERSION = 2
+JOURNAL_SUFFIX = ".jsonl"
+SNAPSHOT_SUFFIX = ".ckpt"
+
+EVENT_SNAPSHOT = "snapshot"
+EVENT_CHECKPOINT = "checkpoint"
+
+
+def encode_event(event: dict[str, Any]) -> str:
+    return json.dumps(event, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def read_journal_events(path: Path) -> Iterator[dict[str, Any]]:
+    with path.open("r", encoding="utf-8") as handle:
+        lines = handle.readlines()
+    for number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            # Only a torn final line from a crash mid-write is tolerated.
+            if number == len(lines):
+                return
+            raise ValueError(f"Corrupt journal event at {path}:{number}") from None
+        if isinstance(event, dict):
+            yield event
+
+
+def journal_sidecars(path: Path) -> list[Path]:
+    return sorted(path.parent.glob(f"{path.name}.*{SNAPSHOT_SUFFIX}"))
+
+
+def sidecar_sizes(directory: Path) -> dict[str, int]:
+    # One directory listing for all journals, keyed by journal file name.
+    sizes: dict[str, int] = {}
+    try:
+        with os.scandir(directory) as listing:
+            for item in listing:
+                if not item.name.endswith(SNAPSHOT_SUFFIX):
+                    continue
+                journal_name = item.name.rsplit(".", 2)[0]
+                sizes[journal_name] = sizes.get(journal_name, 0) + item.stat().st_size
+    except OSError:
+        pass
+    return sizes
+
+
+def snapshot_state_payload(event: dict[str, Any], directory: Path) -> dict[str, Any]:
+    if "packed" in event:
+        return unpack_state(dict(event["packed"]))
+    if "file" in event:
+        return decode_checkpoint((directory / str(event["file"])).read_bytes())
+    # Version 1 journals stored the plain to_json() payload.
+    return dict(event.get("state") or {})
+
+
+def _fsync_directory(path: Path) -> None:
+    if os.name != "posix":
+        return
+    descriptor = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+
+class MeetingJournal:
+    def __init__(
+        self,
+        path: Path,
+        fsync_every: int = 64,
+        snapshot_every: int = 400,
+        writer: PersistenceWriter | None = None,
+        encoding: str = "json",
+        compression: str = "none",
+    ) -> None:
+        self.path = path
+        self.fsync_every = max(1, fsync_every)
+        self.snapshot_every = max(1, snapshot_every)
+        self.events_written = 0
+        self.bytes_written = 0
+        self._writer = writer
+        self.encoding = encoding
+        self.compression = compression
+        self._snapshots = 0
+        self._handle: Any = None
+        self._state: MeetingState | None = None
+        self._unsynced = 0
+        self._since_snapshot = 0
+
+    def _run(self, action: Callable[[], None], key: str | None = None) -> None:
+        # File I/O happens on the writer thread when there is one. Jobs run in submission order,
+        # so appends always land after the snapshot they follow.
+        if self._writer is None:
+            action()
+        else:
+            self._writer.submit(action, key=key)
+
+    def open(self, state: MeetingState) -> None:
+        self._state = state
+        self.compact()
+        state.attach_journal(self.append)
+
+    def append(self, event: dict[str, Any]) -> None:
+        if self._state is None:
+            return
+        # Encoding on the caller's thread freezes the event before the state can change again.
+        line = encode_event(event)
+        self._run(lambda: self._write(line))
+        self.events_written += 1
+        self._unsynced += 1
+        self._since_snapshot += 1
+        if self._unsynced >= self.fsync_every:
+            self.sync()
+
+    def _write(self, line: str) -> None:
+        if self._handle is None:
+            return
+        self._handle.write(line)
+        self._handle.flush()
+        self.bytes_written += len(line)
+
+    def sync(self) -> None:
+        if self._state is None or not self._unsynced:
+            return
+        self._run(self._fsync)
+        self._unsynced = 0
+
+    def _fsync(self) -> None:
+        if self._handle is not None:
+            os.fsync(self._handle.fileno())
+
+    def checkpoint(self, reason: str) -> None:
+        self.append({"e": EVENT_CHECKPOINT, "reason": reason, "ts": datetime.utcnow().isoformat()})
+        if self._since_snapshot >= self.snapshot_every:
+            self.compact(reason)
+        else:
+            self.sync()
+
+    def compact(self, reason: str = "") -> None:
+        if self._state is None:
+            return
+        header = {"e": EVENT_SNAPSHOT, "v": JOURNAL_VERSION, "ts": datetime.utcnow().isoformat(), "reason": reason}
+        payload = self._state.to_json(columnar=True)
+        eager_phases = self._state.eager_phases()
+        self._run(lambda: self._write_snapshot(header, payload, eager_phases), key=f"journal-snapshot:{self.path}")
+        self._unsynced = 0
+        self._since_snapshot = 0
+
+    def _write_snapshot(self, header: dict[str, Any], payload: dict[str, Any], eager_phases: set[str]) -> None:
+        if self._handle is not None:
+            self._handle.close()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        previous_sidecars = journal_sidecars(self.path)
+        if self.encoding == "json" and self.compression == "none":
+            snapshot = {**header, "packed": pack_state(payload, eager_phases)}
+        else:
+            # Binary or compressed snapshots live next to the journal; the event lines stay plain JSONL.
+            self._snapshots += 1
+            sidecar = self.path.with_name(f"{self.path.name}.{self._snapshots:04d}{SNAPSHOT_SUFFIX}")
+            data = encode_checkpoint(payload, self.encoding, self.compression, eager_phases)
+            write_bytes_durably(sidecar, data)
+            self.bytes_written += len(data)
+            snapshot = {**header, "file": sidecar.name}
+        temp_path = self.path.with_name(self.path.name + ".tmp")
+        line = encode_event(snapshot)
+        with temp_path.open("w", encoding="utf-8") as handle:
+            handle.write(line)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_path, self.path)
+        _fsync_directory(self.path.parent)
+        self.bytes_written += len(line)
+        self._handle = self.path.open("a", encoding="utf-8")
+        current = snapshot.get("file")
+        for stale in previous_sidecars:
+            if stale.name != current:
+                stale.unlink(missing_ok=True)
+
+    def _close_handle(self) -> None:
+        if self._handle is None:
+            return
+        os.fsync(self._handle.fileno())
+        self._handle.close()
+        self._handle = None
+
+    def close(self) -> None:
+        if self._state is None:
+            return
+        self._state.attach_journal(None)
+        self._state = None
+        self._run(self._close_handle)
+        if self._writer is not None:
+            self._writer.flush()
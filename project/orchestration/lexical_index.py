@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+STOPWORDS = frozenset(
+    """
+    a an and are as at be by for from has have in is it its of on or that the this to was were will with
+    role phase none null true false
+    и в во на по с со к ко о об от до за для не но что как это из у же ли бы или а то
+    """.split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    return [
+        token
+        for token in (match.group(0).lower() for match in _TOKEN_PATTERN.finditer(text))
+        if len(token) > 1 and token not in STOPWORDS and not token.isdigit()
+    ]
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    doc_id: str
+    label: str
+    text: str
+    score: float
+
+
+class BM25Index:
+    def __init__(self, k1: float = 1.5, b: float = 0.75) -> None:
+        self.k1 = k1
+        self.b = b
+        self._postings: dict[str, dict[str, int]] = {}
+        self._lengths: dict[str, int] = {}
+        self._docs: dict[str, tuple[str, str]] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def add(self, doc_id: str, text: str, label: str = "") -> None:
+        if doc_id in self._docs:
+            self.remove(doc_id)
+        terms = Counter(tokenize(text))
+        if not terms:
+            return
+        for term, frequency in terms.items():
+            self._postings.setdefault(term, {})[doc_id] = frequency
+        length = sum(terms.values())
+        self._lengths[doc_id] = length
+        self._total_length += length
+        self._docs[doc_id] = (label, text)
+
+    def remove(self, doc_id: str) -> None:
+        if doc_id not in self._docs:
+            return
+        _, text = self._docs.pop(doc_id)
+        for term in set(tokenize(text)):
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(doc_id, None)
+            if not postings:
+                del self._postings[term]
+        self._total_length -= self._lengths.pop(doc_id, 0)
+
+    def text(self, doc_id: str) -> str | None:
+        doc = self._docs.get(doc_id)
+        return doc[1] if doc else None
+
+    def search(self, query: str, k: int, accept: Callable[[str], bool] | None = None) -> list[SearchHit]:
+        if k <= 0 or not self._docs:
+            return []
+        doc_count = len(self._docs)
+        average_length = self._total_length / doc_count
+        scores: dict[str, float] = {}
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, frequency in postings.items():
+                norm = self.k1 * (1 - self.b + self.b * self._lengths[doc_id] / average_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (self.k1 + 1) / (frequency + norm)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        hits: list[SearchHit] = []
+        for doc_id, score in ranked:
+            if accept is not None and not accept(doc_id):
+                continue
+            label, text = self._docs[doc_id]
+            hits.append(SearchHit(doc_id=doc_id, label=label, text=text, score=score))
+            if len(hits) >= k:
+                break
+        return hits
+
+
+def iter_artifact_items(payload: Any, path: str = "") -> Iterator[tuple[str, str]]:
+    if isinstance(payload, dict):
+        for key, value in payload.items():
+            yield from iter_artifact_items(value, f"{path}/{key}" if path else str(key))
+    elif isinstance(payload, list):
+        for index, value in enumerate(payload):
+            yield from iter_artifact_items(value, f"{path}[{index}]")
+    elif payload is not None and str(payload).strip():
+        yield path, str(payload).strip()
@@ -1,23 +1,126 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from datetime import datetime
+import bisect
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
 
-from orchestration.phase_artifacts import build_phase_artifact
+from orchestration.checkpoint_format import unpack_section
+from orchestration.journal import EVENT_SNAPSHOT, read_journal_events, snapshot_state_payload
+from orchestration.lexical_index import BM25Index, SearchHit, iter_artifact_items
+from orchestration.persistence import PersistenceWriter, write_text_durably
+from orchestration.phase_artifacts import PhaseArtifactBuilder
+from orchestration.summary_memory import PhaseSummary, SummaryMemory
+from orchestration.usage_ledger import UsageRecord, UsageTotals
+from providers.tokens import MESSAGE_OVERHEAD_TOKENS, estimate_tokens
+from providers.usage import CallUsage
 
+RECENT_RING_SIZE = 16
+MAIN_BRANCH = "main"
 
-@dataclass
+# Anchored to the wall clock once, so turn timestamps never go backwards within a run.
+_WALL_CLOCK_OFFSET = time.time() - time.monotonic()
+
+
+def wall_clock_now() -> float:
+    return _WALL_CLOCK_OFFSET + time.monotonic()
+
+
+def format_utc(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).replace(tzinfo=None).isoformat()
+
+
+def parse_utc(text: str) -> float:
+    moment = datetime.fromisoformat(text)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+def _parse_utc_or_now(text: Any) -> float:
+    try:
+        return parse_utc(str(text))
+    except (TypeError, ValueError):
+        return wall_clock_now()
+
+
+@dataclass(slots=True)
 class TranscriptEntry:
     turn: int
     phase: str
     speaker: str
     content: str
-    timestamp_utc: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    created_at: float = field(default_factory=wall_clock_now)
+    _token_estimate: int | None = field(default=None, init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        # Long meetings repeat a handful of phase and speaker names thousands of times.
+        self.phase = sys.intern(self.phase)
+        self.speaker = sys.intern(self.speaker)
 
-@dataclass
+    @property
+    def timestamp_utc(self) -> str:
+        return format_utc(self.created_at)
+
+    @property
+    def context_line(self) -> str:
+        return f"{self.speaker}: {self.content}"
+
+    @property
+    def token_estimate(self) -> int:
+        if self._token_estimate is None:
+            self._token_estimate = estimate_tokens(self.context_line) + MESSAGE_OVERHEAD_TOKENS
+        return self._token_estimate
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "turn": self.turn,
+            "phase": self.phase,
+            "speaker": self.speaker,
+            "content": self.content,
+            "timestamp_utc": self.timestamp_utc,
+        }
+
+
+def transcript_columns(entries: list[TranscriptEntry]) -> dict[str, Any]:
+    phases: dict[str, int] = {}
+    speakers: dict[str, int] = {}
+    columns: dict[str, list[Any]] = {"turn": [], "phase": [], "speaker": [], "created_at": [], "content": []}
+    for entry in entries:
+        columns["turn"].append(entry.turn)
+        columns["phase"].append(phases.setdefault(entry.phase, len(phases)))
+        columns["speaker"].append(speakers.setdefault(entry.speaker, len(speakers)))
+        columns["created_at"].append(entry.created_at)
+        columns["content"].append(entry.content)
+    return {"phases": list(phases), "speakers": list(speakers), **columns}
+
+
+def entries_from_columns(payload: dict[str, Any]) -> list[TranscriptEntry]:
+    phases = [str(name) for name in payload.get("phases", [])]
+    speakers = [str(name) for name in payload.get("speakers", [])]
+    return [
+        TranscriptEntry(
+            turn=int(turn),
+            phase=phases[phase],
+            speaker=speakers[speaker],
+            content=str(content),
+            created_at=float(created_at),
+        )
+        for turn, phase, speaker, created_at, content in zip(
+            payload.get("turn", []),
+            payload.get("phase", []),
+            payload.get("speaker", []),
+            payload.get("created_at", []),
+            payload.get("content", []),
+        )
+    ]
+
+
+@dataclass(slots=True)
 class PhaseState:
     name: str
     max_turns: int = 0
@@ -28,6 +131,69 @@ class PhaseState:
     draft_artifact: dict[str, Any] = field(default_factory=dict)
     artifact: dict[str, Any] = field(default_factory=dict)
     approved_by_human: bool = False
+    _builder: PhaseArtifactBuilder | None = field(default=None, init=False, repr=False, compare=False)
+
+    def add_contribution(self, contribution: dict[str, Any]) -> None:
+        if self._builder is None or self._builder.count != len(self.raw_contributions):
+            # Restored or replayed phases rebuild the builder once from their stored contributions.
+            self._builder = PhaseArtifactBuilder.from_contributions(self.name, self.raw_contributions)
+        self.raw_contributions.append(contribution)
+        self.draft_artifact = self._builder.apply(contribution)
+
+
+@dataclass
+class BranchPoint:
+    name: str
+    parent: str
+    phase: str
+    phase_index: int
+    turn: int
+    direction: str = ""
+    created_utc: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "parent": self.parent,
+            "phase": self.phase,
+            "phase_index": self.phase_index,
+            "turn": self.turn,
+            "direction": self.direction,
+            "created_utc": self.created_utc,
+        }
+
+    @classmethod
+    def from_json(cls, payload: dict[str, Any]) -> "BranchPoint":
+        return cls(
+            name=str(payload.get("name", "")),
+            parent=str(payload.get("parent", MAIN_BRANCH)),
+            phase=str(payload.get("phase", "")),
+            phase_index=int(payload.get("phase_index", 0)),
+            turn=int(payload.get("turn", 0)),
+            direction=str(payload.get("direction", "")),
+            created_utc=str(payload.get("created_utc", "")),
+        )
+
+
+class TranscriptIndex:
+    def __init__(self) -> None:
+        self.by_phase: dict[str, list[TranscriptEntry]] = {}
+        self.by_phase_speaker: dict[tuple[str, str], list[TranscriptEntry]] = {}
+        self.spoken: dict[str, set[str]] = {}
+        self.recent: dict[str, deque[TranscriptEntry]] = {}
+
+    def add(self, entry: TranscriptEntry) -> None:
+        self.by_phase.setdefault(entry.phase, []).append(entry)
+        self.by_phase_speaker.setdefault((entry.phase, entry.speaker), []).append(entry)
+        self.spoken.setdefault(entry.phase, set()).add(entry.speaker)
+        self.recent.setdefault(entry.phase, deque(maxlen=RECENT_RING_SIZE)).append(entry)
+
+    @classmethod
+    def build(cls, entries: list[TranscriptEntry]) -> "TranscriptIndex":
+        index = cls()
+        for entry in entries:
+            index.add(entry)
+        return index
 
 
 @dataclass
@@ -41,14 +207,194 @@ class MeetingState:
     current_phase_index: int = 0
     total_turns: int = 0
     interrupted: bool = False
-    transcript: list[TranscriptEntry] = field(default_factory=list)
+    _transcript: list[TranscriptEntry] = field(default_factory=list, init=False, repr=False)
     phase_states: dict[str, PhaseState] = field(default_factory=dict)
+    usage: list[UsageRecord] = field(default_factory=list)
+    summary_memory: SummaryMemory = field(default_factory=SummaryMemory)
     session_started_utc: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    lineage: list[BranchPoint] = field(default_factory=list)
+    _index: TranscriptIndex = field(default_factory=TranscriptIndex, init=False, repr=False, compare=False)
+    _lexical: BM25Index | None = field(default=None, init=False, repr=False, compare=False)
+    _artifact_docs: dict[str, dict[str, str]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _journal: Callable[[dict[str, Any]], None] | None = field(default=None, init=False, repr=False, compare=False)
+    # Encoded transcript and contributions of phases not loaded yet, keyed by phase.
+    _deferred: dict[str, str] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         self.phase_states = {
             name: PhaseState(name=name, max_turns=self.max_turns_per_phase) for name in self.phases
         }
+        self.rebuild_transcript_index()
+
+    @property
+    def transcript(self) -> list[TranscriptEntry]:
+        self.load_all_sections()
+        return self._transcript
+
+    @transcript.setter
+    def transcript(self, entries: list[TranscriptEntry]) -> None:
+        self._transcript = entries
+
+    @property
+    def branch_name(self) -> str:
+        return self.lineage[-1].name if self.lineage else MAIN_BRANCH
+
+    @property
+    def deferred_phases(self) -> list[str]:
+        return [phase for phase in self.phases if phase in self._deferred]
+
+    def eager_phases(self) -> set[str]:
+        # Phases a resumed meeting touches right away: the current one and the one the last turn was spoken in.
+        phases = {self.current_phase}
+        if self._transcript:
+            phases.add(self._transcript[-1].phase)
+        return phases
+
+    def _load_section(self, phase: str) -> None:
+        encoded = self._deferred.pop(phase, None)
+        if encoded is None:
+            return
+        columns, contributions = unpack_section(encoded)
+        entries = entries_from_columns(columns)
+        self.phase_states[phase].raw_contributions = contributions
+        self._transcript = sorted([*self._transcript, *entries], key=lambda entry: entry.turn)
+        for entry in entries:
+            self._index.add(entry)
+            if self._lexical is not None:
+                self._index_entry(entry)
+
+    def load_all_sections(self) -> None:
+        for phase in self.deferred_phases:
+            self._load_section(phase)
+
+    def iter_transcript_reversed(self) -> Iterator[TranscriptEntry]:
+        # Phases follow each other in turn order, so an entry is yielded only once every deferred phase after its
+        # own is loaded. Loads (here or by a caller between yields) rebuild the list, and the walk then resumes
+        # below the last turn it yielded: a section loaded out of order can land anywhere under the loaded tail.
+        rank = {phase: position for position, phase in enumerate(self.phases)}
+        transcript = self._transcript
+        index = len(transcript) - 1
+        last_turn: int | None = None
+        while True:
+            if transcript is not self._transcript:
+                transcript = self._transcript
+                if last_turn is None:
+                    index = len(transcript) - 1
+                else:
+                    index = bisect.bisect_left(transcript, last_turn, key=lambda entry: entry.turn) - 1
+            newest_deferred = self.deferred_phases[-1] if self._deferred else None
+            if index < 0:
+                if newest_deferred is None:
+                    return
+                self._load_section(newest_deferred)
+                continue
+            entry = transcript[index]
+            if newest_deferred is not None and rank[newest_deferred] > rank.get(entry.phase, -1):
+                self._load_section(newest_deferred)
+                continue
+            index -= 1
+            last_turn = entry.turn
+            yield entry
+
+    def latest_entries(self, limit: int) -> list[TranscriptEntry]:
+        latest: list[TranscriptEntry] = []
+        if limit <= 0:
+            return latest
+        for entry in self.iter_transcript_reversed():
+            latest.append(entry)
+            if len(latest) >= limit:
+                break
+        latest.reverse()
+        return latest
+
+    def attach_journal(self, listener: Callable[[dict[str, Any]], None] | None) -> None:
+        self._journal = listener
+
+    def _emit(self, event: dict[str, Any]) -> None:
+        if self._journal is not None:
+            self._journal(event)
+
+    def rebuild_transcript_index(self) -> None:
+        self._index = TranscriptIndex.build(self._transcript)
+        # The lexical index is built on the first search, so loading a checkpoint never tokenizes the transcript.
+        self._lexical = None
+        self._artifact_docs = {}
+
+    def _ensure_lexical_index(self) -> BM25Index:
+        if self._lexical is None:
+            # Only loaded turns are indexed; _load_section adds a deferred phase's turns when it is decoded, while
+            # artifact items and summaries of every phase are searchable from the start.
+            self._lexical = BM25Index()
+            for entry in self._transcript:
+                self._index_entry(entry)
+            for phase in self.phases:
+                self._index_phase_artifacts(phase)
+        return self._lexical
+
+    def _index_entry(self, entry: TranscriptEntry) -> None:
+        # Facilitator turns are routing JSON; their phase summaries are indexed with the artifact instead.
+        if self._lexical is None or entry.speaker == "facilitator":
+            return
+        self._lexical.add(f"turn:{entry.turn}", entry.content, label=f"{entry.phase} / {entry.speaker}")
+
+    def _index_phase_artifacts(self, phase: str) -> None:
+        if self._lexical is None:
+            return
+        phase_state = self.phase_states[phase]
+        label = f"{phase} / artifact"
+        items = {
+            f"artifact:{phase}:{path}": text for path, text in iter_artifact_items(phase_state.draft_artifact)
+        }
+        summary = str(phase_state.artifact.get("summary", "")).strip()
+        if summary:
+            items[f"artifact:{phase}:summary"] = summary
+
+        indexed = self._artifact_docs.get(phase, {})
+        for doc_id in indexed.keys() - items.keys():
+            self._lexical.remove(doc_id)
+        for doc_id, text in items.items():
+            if indexed.get(doc_id) != text:
+                self._lexical.add(doc_id, text, label=label)
+        self._artifact_docs[phase] = items
+
+    def search_context(self, query: str, limit: int, exclude_turns: set[int] | None = None) -> list[SearchHit]:
+        exclude_turns = exclude_turns or set()
+
+        def accept(doc_id: str) -> bool:
+            return not doc_id.startswith("turn:") or int(doc_id[5:]) not in exclude_turns
+
+        return self._ensure_lexical_index().search(query, limit, accept=accept)
+
+    def phase_entries(self, phase: str) -> list[TranscriptEntry]:
+        self._load_section(phase)
+        return self._index.by_phase.get(phase, [])
+
+    def speaker_entries(self, phase: str, speaker: str) -> list[TranscriptEntry]:
+        self._load_section(phase)
+        return self._index.by_phase_speaker.get((phase, speaker), [])
+
+    def spoken_roles(self, phase: str) -> set[str]:
+        self._load_section(phase)
+        return self._index.spoken.get(phase, set())
+
+    def recent_entries(self, phase: str, limit: int, exclude: frozenset[str] = frozenset()) -> list[TranscriptEntry]:
+        if limit <= 0:
+            return []
+        self._load_section(phase)
+        ring = self._index.recent.get(phase, ())
+        if not exclude and limit <= len(ring):
+            return list(ring)[-limit:]
+        recent: list[TranscriptEntry] = []
+        # The ring covers the usual lookback; long runs of excluded speakers fall back to the phase list.
+        source = ring if len(ring) < RECENT_RING_SIZE else self.phase_entries(phase)
+        for entry in reversed(source):
+            if entry.speaker in exclude:
+                continue
+            recent.append(entry)
+            if len(recent) >= limit:
+                break
+        recent.reverse()
+        return recent
 
     @property
     def current_phase(self) -> str:
@@ -58,9 +404,56 @@ class MeetingState:
         self.total_turns += 1
         phase = self.current_phase
         self.phase_states[phase].turn_count += 1
-        self.transcript.append(
-            TranscriptEntry(turn=self.total_turns, phase=phase, speaker=speaker, content=content)
+        entry = TranscriptEntry(turn=self.total_turns, phase=phase, speaker=speaker, content=content)
+        self._transcript.append(entry)
+        self._index.add(entry)
+        self._index_entry(entry)
+        self._emit({"e": "turn", "speaker": speaker, "content": content, "t": entry.created_at})
+
+    def record_usage(
+        self,
+        speaker: str,
+        call: CallUsage,
+        cost_usd: float,
+        phase: str | None = None,
+        superseded: bool = False,
+    ) -> UsageRecord:
+        record = UsageRecord(
+            turn=self.total_turns,
+            phase=phase or self.current_phase,
+            speaker=speaker,
+            provider=call.provider,
+            model=call.model,
+            prompt_tokens=call.prompt_tokens,
+            completion_tokens=call.completion_tokens,
+            latency_seconds=call.latency_seconds,
+            retries=call.retries,
+            cached=call.cached,
+            cost_usd=cost_usd,
+            superseded=superseded,
         )
+        self.usage.append(record)
+        self._emit({"e": "usage", "record": record.to_json()})
+        return record
+
+    def usage_totals(self, phase: str | None = None) -> UsageTotals:
+        if phase is None:
+            return UsageTotals.of(self.usage)
+        return UsageTotals.of(record for record in self.usage if record.phase == phase and not record.superseded)
+
+    def usage_summary(self) -> dict[str, Any]:
+        def grouped(key: Callable[[UsageRecord], str]) -> dict[str, Any]:
+            groups: dict[str, UsageTotals] = {}
+            for record in self.usage:
+                groups.setdefault(key(record), UsageTotals()).add(record)
+            return {name: totals.to_json() for name, totals in groups.items()}
+
+        return {
+            "meeting": self.usage_totals().to_json(),
+            "by_phase": grouped(lambda record: record.phase),
+            "by_speaker": grouped(lambda record: record.speaker),
+            "by_model": grouped(lambda record: f"{record.provider}/{record.model}"),
+        }
 
     def can_continue_phase(self) -> bool:
         phase_state = self.phase_states[self.current_phase]
@@ -74,6 +467,7 @@ class MeetingState:
             return False
         phase_state.max_turns += extra_turns
         phase_state.extension_count += 1
+        self._emit({"e": "extend", "extra_turns": extra_turns, "max_extensions": max_extensions})
         return True
 
     def can_continue_meeting(self) -> bool:
@@ -83,26 +477,41 @@ class MeetingState:
         phase_state = self.phase_states[self.current_phase]
         phase_state.converged = True
         phase_state.artifact = artifact
+        self._index_phase_artifacts(self.current_phase)
+        self._emit({"e": "converged", "artifact": artifact})
 
     def update_phase_draft(self, contribution: dict[str, Any]) -> None:
         if not contribution:
             return
         phase_state = self.phase_states[self.current_phase]
-        phase_state.raw_contributions.append(contribution)
-        phase_state.draft_artifact = build_phase_artifact(
-            self.current_phase,
-            phase_state.raw_contributions,
-        )
+        phase_state.add_contribution(contribution)
+        self._index_phase_artifacts(self.current_phase)
+        self._emit({"e": "draft", "contribution": contribution})
 
     def approve_current_phase(self, approved: bool) -> None:
         self.phase_states[self.current_phase].approved_by_human = approved
+        self._emit({"e": "approved", "approved": approved})
+
+    def reopen_current_phase(self) -> None:
+        self.phase_states[self.current_phase].converged = False
+        self._emit({"e": "reopen"})
 
     def transition_to_next_phase(self) -> bool:
         if self.current_phase_index + 1 >= len(self.phases):
             return False
         self.current_phase_index += 1
+        self._emit({"e": "transition"})
         return True
 
+    def set_phase_summary(self, phase: str, summary: PhaseSummary) -> None:
+        self.summary_memory.phases[phase] = summary
+        self._emit({"e": "phase_summary", "phase": phase, "summary": summary.to_json()})
+
+    def set_meeting_summary(self, text: str, phases: list[str]) -> None:
+        self.summary_memory.meeting = text
+        self.summary_memory.meeting_phases = list(phases)
+        self._emit({"e": "meeting_summary", "text": text, "phases": list(phases)})
+
     def is_fully_approved(self) -> bool:
         return all(
             phase_state.converged and phase_state.approved_by_human
@@ -114,18 +523,80 @@ class MeetingState:
             raise ValueError(f"Invalid phase index: {phase_index}")
 
         keep_phases = set(self.phases[:phase_index])
-        self.transcript = [entry for entry in self.transcript if entry.phase in keep_phases]
+        # Discarded phases are dropped without being decoded; kept entries are renumbered, so those are loaded.
+        for phase_name in self.phases[phase_index:]:
+            self._deferred.pop(phase_name, None)
+        self.load_all_sections()
+        self._transcript = [entry for entry in self._transcript if entry.phase in keep_phases]
 
         self.total_turns = 0
-        for entry in self.transcript:
+        for entry in self._transcript:
             self.total_turns += 1
             entry.turn = self.total_turns
 
         for phase_name in self.phases[phase_index:]:
             self.phase_states[phase_name] = PhaseState(name=phase_name, max_turns=self.max_turns_per_phase)
+        self.rebuild_transcript_index()
+
+        self.summary_memory.retain(keep_phases)
+
+        # Spend on discarded phases still counts toward the meeting budget, not the rerun phase budget.
+        for record in self.usage:
+            if record.phase not in keep_phases:
+                record.superseded = True
 
         self.current_phase_index = phase_index
         self.interrupted = False
+        self._emit({"e": "resume", "phase_index": phase_index})
+
+    def branch(self, phase_index: int, name: str, direction: str = "") -> "MeetingState":
+        if phase_index < 0 or phase_index >= len(self.phases):
+            raise ValueError(f"Invalid phase index: {phase_index}")
+        if not name.strip() or name == self.branch_name:
+            raise ValueError(f"Invalid branch name: {name!r}")
+
+        keep_phases = self.phases[:phase_index]
+        kept = set(keep_phases)
+        branch = MeetingState(
+            project_name=self.project_name,
+            project_description=self.project_description,
+            meeting_language=self.meeting_language,
+            phases=list(self.phases),
+            max_turns_per_phase=self.max_turns_per_phase,
+            global_max_turns=self.global_max_turns,
+            current_phase_index=phase_index,
+            session_started_utc=self.session_started_utc,
+        )
+        # Copy-on-write: phases before the branch point are never mutated again, so their transcript
+        # entries, contributions, artifacts and still-encoded sections are shared with the parent.
+        # Turn numbers already run 1..N over those phases, so no entry needs renumbering.
+        for phase_name in keep_phases:
+            branch.phase_states[phase_name] = replace(self.phase_states[phase_name])
+        branch._deferred = {phase_name: encoded for phase_name, encoded in self._deferred.items() if phase_name in kept}
+        branch._transcript = [entry for entry in self._transcript if entry.phase in kept]
+        branch.total_turns = sum(self.phase_states[phase_name].turn_count for phase_name in keep_phases)
+        branch.rebuild_transcript_index()
+        branch.usage = [replace(record) for record in self.usage if record.phase in kept]
+        branch.summary_memory = SummaryMemory.from_json(self.summary_memory.to_json())
+        branch.summary_memory.retain(kept)
+        branch.lineage = [
+            *self.lineage,
+            BranchPoint(
+                name=name,
+                parent=self.branch_name,
+                phase=self.phases[phase_index],
+                phase_index=phase_index,
+                turn=branch.total_turns,
+                direction=direction,
+            ),
+        ]
+        if direction:
+            branch.add_transcript("human_stakeholder", f"What-if direction for this branch ({name}): {direction}")
+        return branch
+
+    def mark_interrupted(self) -> None:
+        self.interrupted = True
+        self._emit({"e": "interrupted"})
 
     @classmethod
     def from_json(cls, payload: dict[str, Any]) -> "MeetingState":
@@ -170,7 +641,10 @@ class MeetingState:
 
         transcript_payload = payload.get("transcript", [])
         restored_transcript: list[TranscriptEntry] = []
-        if isinstance(transcript_payload, list):
+        columns_payload = payload.get("transcript_columns")
+        if isinstance(columns_payload, dict):
+            restored_transcript = entries_from_columns(columns_payload)
+        elif isinstance(transcript_payload, list):
             for index, row in enumerate(transcript_payload, start=1):
                 if not isinstance(row, dict):
                     continue
@@ -180,10 +654,28 @@ class MeetingState:
                         phase=str(row.get("phase", state.current_phase)),
                         speaker=str(row.get("speaker", "unknown")),
                         content=str(row.get("content", "")),
-                        timestamp_utc=str(row.get("timestamp_utc", datetime.utcnow().isoformat())),
+                        created_at=_parse_utc_or_now(row.get("timestamp_utc")),
                     )
                 )
         state.transcript = restored_transcript
+        deferred_payload = payload.get("deferred_sections", {})
+        if isinstance(deferred_payload, dict):
+            state._deferred = {
+                str(phase): str(encoded) for phase, encoded in deferred_payload.items() if phase in state.phase_states
+            }
+        state.rebuild_transcript_index()
+
+        usage_payload = payload.get("usage", [])
+        if isinstance(usage_payload, list):
+            state.usage = [UsageRecord.from_json(row) for row in usage_payload if isinstance(row, dict)]
+
+        summary_payload = payload.get("summary_memory", {})
+        if isinstance(summary_payload, dict):
+            state.summary_memory = SummaryMemory.from_json(summary_payload)
+
+        lineage_payload = payload.get("lineage", [])
+        if isinstance(lineage_payload, list):
+            state.lineage = [BranchPoint.from_json(row) for row in lineage_payload if isinstance(row, dict)]
 
         if state.current_phase_index < 0 or state.current_phase_index >= len(state.phases):
             state.current_phase_index = 0
@@ -193,7 +685,58 @@ class MeetingState:
 
         return state
 
-    def to_json(self) -> dict[str, Any]:
+    def apply_event(self, event: dict[str, Any]) -> None:
+        kind = event.get("e")
+        if kind == "turn":
+            self.add_transcript(str(event.get("speaker", "unknown")), str(event.get("content", "")))
+            if event.get("t") is not None:
+                self._transcript[-1].created_at = float(event["t"])
+            elif event.get("ts"):
+                self._transcript[-1].created_at = _parse_utc_or_now(event["ts"])
+        elif kind == "draft":
+            self.update_phase_draft(dict(event.get("contribution") or {}))
+        elif kind == "converged":
+            self.mark_phase_converged(dict(event.get("artifact") or {}))
+        elif kind == "approved":
+            self.approve_current_phase(bool(event.get("approved")))
+        elif kind == "reopen":
+            self.reopen_current_phase()
+        elif kind == "transition":
+            self.transition_to_next_phase()
+        elif kind == "extend":
+            self.extend_current_phase_turn_limit(int(event.get("extra_turns", 0)), int(event.get("max_extensions", 3)))
+        elif kind == "usage":
+            self.usage.append(UsageRecord.from_json(dict(event.get("record") or {})))
+        elif kind == "phase_summary":
+            self.set_phase_summary(str(event.get("phase", "")), PhaseSummary.from_json(dict(event.get("summary") or {})))
+        elif kind == "meeting_summary":
+            self.set_meeting_summary(str(event.get("text", "")), [str(name) for name in event.get("phases", [])])
+        elif kind == "interrupted":
+            self.mark_interrupted()
+        elif kind == "resume":
+            self.resume_from_phase(int(event.get("phase_index", 0)))
+
+    @classmethod
+    def from_journal(cls, path: Path) -> "MeetingState":
+        state: MeetingState | None = None
+        for event in read_journal_events(path):
+            if event.get("e") == EVENT_SNAPSHOT:
+                state = cls.from_json(snapshot_state_payload(event, path.parent))
+            elif state is not None:
+                state.apply_event(event)
+        if state is None:
+            raise ValueError(f"Journal {path} does not start with a snapshot.")
+        return state
+
+    def to_json(self, columnar: bool = False) -> dict[str, Any]:
+        if columnar:
+            # Snapshot form: deferred phases are passed through still encoded instead of being loaded.
+            transcript: dict[str, Any] = {
+                "transcript_columns": transcript_columns(self._transcript),
+                "deferred_sections": dict(self._deferred),
+            }
+        else:
+            transcript = {"transcript": [entry.to_json() for entry in self.transcript]}
         return {
             "project_name": self.project_name,
             "project_description": self.project_description,
@@ -213,23 +756,40 @@ class MeetingState:
                     "extension_count": state.extension_count,
                     "converged": state.converged,
                     "approved_by_human": state.approved_by_human,
-                    "raw_contributions": state.raw_contributions,
+                    "raw_contributions": list(state.raw_contributions),
                     "draft_artifact": state.draft_artifact,
                     "artifact": state.artifact,
                 }
                 for phase, state in self.phase_states.items()
             },
-            "transcript": [entry.__dict__ for entry in self.transcript],
+            **transcript,
+            "summary_memory": self.summary_memory.to_json(),
+            "lineage": [point.to_json() for point in self.lineage],
+            "usage": [record.to_json() for record in self.usage],
+            "usage_summary": self.usage_summary(),
         }
 
 
-def write_transcript_log(meeting_state: MeetingState, logs_dir: Path) -> Path:
+def write_transcript_log(
+    meeting_state: MeetingState,
+    logs_dir: Path,
+    writer: PersistenceWriter | None = None,
+    name_suffix: str = "",
+) -> Path:
     stamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    path = logs_dir / f"meeting_transcript_{stamp}.log"
-    with path.open("w", encoding="utf-8") as handle:
-        for entry in meeting_state.transcript:
-            handle.write(
-                f"[{entry.timestamp_utc}] TURN {entry.turn} | {entry.phase} | {entry.speaker}\n"
-            )
-            handle.write(f"{entry.content}\n\n")
+    name = f"meeting_transcript_{name_suffix}_{stamp}" if name_suffix else f"meeting_transcript_{stamp}"
+    path = logs_dir / f"{name}.log"
+    # Entries are never modified once appended, so a copy of the list is a stable snapshot.
+    entries = list(meeting_state.transcript)
+
+    def write() -> Path:
+        text = "".join(
+            f"[{entry.timestamp_utc}] TURN {entry.turn} | {entry.phase} | {entry.speaker}\n{entry.content}\n\n"
+            for entry in entries
+        )
+        return write_text_durably(path, text)
+
+    if writer is None:
+        return write()
+    writer.submit(write)
     return path
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+
+def _write_durably(path: Path, data: str | bytes) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Per-process temp name: branch workers share the checkpoint catalog file.
+    temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    handle = temp_path.open("wb") if isinstance(data, bytes) else temp_path.open("w", encoding="utf-8")
+    with handle:
+        handle.write(data)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(temp_path, path)
+    return path
+
+
+def write_text_durably(path: Path, text: str) -> Path:
+    return _write_durably(path, text)
+
+
+def write_bytes_durably(path: Path, data: bytes) -> Path:
+    return _write_durably(path, data)
+
+
+@dataclass
+class _WriteJob:
+    action: Callable[[], Any]
+    key: str | None
+    future: Future[Any] = field(default_factory=Future)
+    superseded: list[Future[Any]] = field(default_factory=list)
+
+
+class PersistenceWriter:
+    def __init__(self, name: str = "persistence-writer") -> None:
+        self._jobs: deque[_WriteJob] = deque()
+        self._keyed: dict[str, _WriteJob] = {}
+        self._condition = threading.Condition()
+        self._busy = False
+        self._closed = False
+        self.jobs_done = 0
+        self.coalesced = 0
+        self.errors: list[str] = []
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, action: Callable[[], Any], key: str | None = None) -> Future[Any]:
+        job = _WriteJob(action=action, key=key)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Persistence writer is closed.")
+            previous = self._keyed.get(key) if key else None
+            if previous is not None:
+                # A newer snapshot makes the pending one redundant. It is re-queued at the end so that
+                # unkeyed jobs submitted in between (journal appends) still run before it.
+                self._jobs.remove(previous)
+                job.superseded = [*previous.superseded, previous.future]
+                self.coalesced += 1
+            self._jobs.append(job)
+            if key:
+                self._keyed[key] = job
+            self._condition.notify_all()
+        return job.future
+
+    def pending(self) -> int:
+        with self._condition:
+            return len(self._jobs) + (1 if self._busy else 0)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._jobs and not self._closed:
+                    self._condition.wait()
+                if not self._jobs:
+                    return
+                job = self._jobs.popleft()
+                if job.key and self._keyed.get(job.key) is job:
+                    del self._keyed[job.key]
+                self._busy = True
+            futures = [*job.superseded, job.future]
+            try:
+                result = job.action()
+            except Exception as exc:
+                with self._condition:
+                    self.errors.append(str(exc))
+                for future in futures:
+                    future.set_exception(exc)
+            else:
+                for future in futures:
+                    future.set_result(result)
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self.jobs_done += 1
+                    self._condition.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._jobs and not self._busy, timeout)
+
+    def close(self, timeout: float | None = None) -> bool:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def summary(self) -> str:
+        return f"jobs={self.jobs_done}, coalesced={self.coalesced}, errors={len(self.errors)}"
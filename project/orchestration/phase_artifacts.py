@@ -65,140 +65,160 @@ def _as_list(value: Any) -> list[str]:
     return [str(value)]
 
 
-def _latest_by_role(contributions: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
-    result: dict[str, dict[str, Any]] = {}
-    for payload in contributions:
-        role = str(payload.get("role", "unknown"))
-        result[role] = payload
-    return result
+# Each artifact field merges these (role, payload key) sources, in order, from the latest contribution of each role.
+# A tuple of roles means the first role that has contributed is used.
+PHASE_FIELD_SOURCES: dict[str, dict[str, list[tuple[str | tuple[str, ...], str]]]] = {
+    "Requirements Gathering": {
+        "functional_requirements": [("business_analyst", "requirements")],
+        "non_functional_requirements": [
+            ("business_analyst", "non_functional_requirements"),
+            ("security_specialist", "security_controls"),
+        ],
+        "constraints": [("business_analyst", "constraints")],
+        "formatted_specification": [
+            (("document_monitor", "document_formatter"), "formatted_specification"),
+            (("document_monitor", "document_formatter"), "document_sections"),
+        ],
+        "coverage_good": [(("document_monitor", "document_formatter"), "coverage_good")],
+        "coverage_gaps": [(("document_monitor", "document_formatter"), "coverage_gaps")],
+        "open_questions": [
+            ("business_analyst", "clarifications"),
+            ("product_manager", "open_risks"),
+            (("document_monitor", "document_formatter"), "coverage_gaps"),
+        ],
+        "stakeholders": [("product_manager", "insights")],
+        "success_criteria": [("product_manager", "decisions")],
+    },
+    "System Design": {
+        "architecture_overview": [("architect", "architecture_points")],
+        "component_boundaries": [("architect", "architecture_points"), ("frontend_engineer", "frontend_plan")],
+        "integration_strategy": [
+            ("architect", "architecture_points"),
+            ("backend_engineer", "dependencies"),
+            ("devops_engineer", "controls"),
+        ],
+        "data_flows": [("architect", "architecture_points"), ("backend_engineer", "backend_plan")],
+        "security_architecture": [("security_specialist", "security_controls"), ("security_specialist", "threats")],
+        "design_risks": [
+            ("architect", "risks"),
+            ("backend_engineer", "risks"),
+            ("frontend_engineer", "risks"),
+            ("devops_engineer", "risks"),
+        ],
+    },
+    "Implementation Planning": {
+        "work_breakdown": [("backend_engineer", "backend_plan"), ("frontend_engineer", "frontend_plan")],
+        "timeline_milestones": [("product_manager", "decisions")],
+        "resource_plan": [("devops_engineer", "controls"), ("product_manager", "insights")],
+        "dependency_plan": [("backend_engineer", "dependencies"), ("frontend_engineer", "dependencies")],
+        "raci_outline": [("product_manager", "decisions")],
+        "change_control": [("devops_engineer", "controls")],
+    },
+    "Testing Strategy": {
+        "test_levels": [("qa_engineer", "test_strategy")],
+        "acceptance_criteria": [("qa_engineer", "quality_gates")],
+        "quality_gates": [("qa_engineer", "quality_gates")],
+        "test_data_strategy": [("qa_engineer", "test_strategy")],
+        "defect_management": [("qa_engineer", "risks"), ("security_specialist", "risks")],
+    },
+    "Deployment Planning": {
+        "environment_strategy": [("devops_engineer", "devops_plan")],
+        "release_strategy": [("devops_engineer", "controls")],
+        "rollback_plan": [("devops_engineer", "controls"), ("devops_engineer", "risks")],
+        "observability_plan": [("devops_engineer", "controls")],
+        "operational_readiness": [("security_specialist", "security_controls"), ("devops_engineer", "devops_plan")],
+    },
+    "Maintenance Strategy": {
+        "support_model": [("devops_engineer", "devops_plan"), ("product_manager", "insights")],
+        "incident_response": [("devops_engineer", "controls"), ("qa_engineer", "quality_gates")],
+        "sla_slo": [("product_manager", "decisions"), ("qa_engineer", "quality_gates")],
+        "continuous_improvement": [("product_manager", "open_risks"), ("qa_engineer", "risks")],
+        "monitoring_governance": [("devops_engineer", "controls")],
+    },
+}
 
 
-def _merge_values(*values: Any) -> list[str]:
+def _merge_lists(lists: list[list[str]]) -> list[str]:
     merged: list[str] = []
     seen: set[str] = set()
-    for value in values:
-        for item in _as_list(value):
+    for items in lists:
+        for item in items:
             if item not in seen:
                 seen.add(item)
                 merged.append(item)
     return merged
 
 
+class PhaseArtifactBuilder:
+    def __init__(self, phase_name: str) -> None:
+        self.phase_name = phase_name
+        self.schema_fields = PHASE_ARTIFACT_SCHEMAS.get(phase_name, [])
+        self.field_sources = PHASE_FIELD_SOURCES.get(phase_name, {})
+        self.count = 0
+        self._latest: dict[str, dict[str, Any]] = {}
+        self._last: dict[str, Any] = {}
+        # Normalized item lists per (role, key) of each role's latest contribution, and the merged fields.
+        self._source_items: dict[tuple[str, str], list[str]] = {}
+        self._fields: dict[str, list[str]] = {name: [] for name in self.field_sources}
+        self._fields_by_role: dict[str, list[str]] = {}
+        for name, sources in self.field_sources.items():
+            for roles, _ in sources:
+                for role in (roles,) if isinstance(roles, str) else roles:
+                    dependents = self._fields_by_role.setdefault(role, [])
+                    if name not in dependents:
+                        dependents.append(name)
+
+    @classmethod
+    def from_contributions(cls, phase_name: str, contributions: list[dict[str, Any]]) -> "PhaseArtifactBuilder":
+        builder = cls(phase_name)
+        for payload in contributions:
+            builder.apply(payload)
+        return builder
+
+    def _resolve_role(self, roles: str | tuple[str, ...]) -> str | None:
+        if isinstance(roles, str):
+            return roles
+        for role in roles:
+            if role in self._latest:
+                return role
+        return None
+
+    def _source(self, roles: str | tuple[str, ...], key: str) -> list[str]:
+        role = self._resolve_role(roles)
+        if role is None:
+            return []
+        cached = self._source_items.get((role, key))
+        if cached is None:
+            cached = _as_list(self._latest.get(role, {}).get(key))
+            self._source_items[(role, key)] = cached
+        return cached
+
+    def apply(self, payload: dict[str, Any]) -> dict[str, Any]:
+        role = str(payload.get("role", "unknown"))
+        self.count += 1
+        self._last = payload
+        self._latest[role] = payload
+        for key in [key for key in self._source_items if key[0] == role]:
+            del self._source_items[key]
+        # Only fields fed by this role change; the other merged lists are reused as they are.
+        for name in self._fields_by_role.get(role, []):
+            self._fields[name] = _merge_lists([self._source(roles, key) for roles, key in self.field_sources[name]])
+        return self.artifact()
+
+    def artifact(self) -> dict[str, Any]:
+        artifact: dict[str, Any] = {
+            "phase": self.phase_name,
+            "schema_fields": self.schema_fields,
+            "contribution_count": self.count,
+        }
+        if self.field_sources:
+            artifact.update(self._fields)
+        else:
+            artifact["raw"] = self._last
+        for field in self.schema_fields:
+            artifact.setdefault(field, [])
+        return artifact
+
+
 def build_phase_artifact(phase_name: str, contributions: list[dict[str, Any]]) -> dict[str, Any]:
-    schema_fields = PHASE_ARTIFACT_SCHEMAS.get(phase_name, [])
-    latest = _latest_by_role(contributions)
-
-    artifact: dict[str, Any] = {
-        "phase": phase_name,
-        "schema_fields": schema_fields,
-        "contribution_count": len(contributions),
-    }
-
-    if phase_name == "Requirements Gathering":
-        ba = latest.get("business_analyst", {})
-        monitor = latest.get("document_monitor", latest.get("document_formatter", {}))
-        pm = latest.get("product_manager", {})
-        sec = latest.get("security_specialist", {})
-        artifact.update(
-            {
-                "functional_requirements": _merge_values(ba.get("requirements")),
-                "non_functional_requirements": _merge_values(
-                    ba.get("non_functional_requirements"), sec.get("security_controls")
-                ),
-                "constraints": _merge_values(ba.get("constraints")),
-                "formatted_specification": _merge_values(
-                    monitor.get("formatted_specification"), monitor.get("document_sections")
-                ),
-                "coverage_good": _merge_values(monitor.get("coverage_good")),
-                "coverage_gaps": _merge_values(monitor.get("coverage_gaps")),
-                "open_questions": _merge_values(ba.get("clarifications"), pm.get("open_risks"), monitor.get("coverage_gaps")),
-                "stakeholders": _merge_values(pm.get("insights")),
-                "success_criteria": _merge_values(pm.get("decisions")),
-            }
-        )
-
-    elif phase_name == "System Design":
-        architect = latest.get("architect", {})
-        backend = latest.get("backend_engineer", {})
-        frontend = latest.get("frontend_engineer", {})
-        devops = latest.get("devops_engineer", {})
-        sec = latest.get("security_specialist", {})
-        artifact.update(
-            {
-                "architecture_overview": _merge_values(architect.get("architecture_points")),
-                "component_boundaries": _merge_values(
-                    architect.get("architecture_points"), frontend.get("frontend_plan")
-                ),
-                "integration_strategy": _merge_values(
-                    architect.get("architecture_points"), backend.get("dependencies"), devops.get("controls")
-                ),
-                "data_flows": _merge_values(architect.get("architecture_points"), backend.get("backend_plan")),
-                "security_architecture": _merge_values(sec.get("security_controls"), sec.get("threats")),
-                "design_risks": _merge_values(
-                    architect.get("risks"), backend.get("risks"), frontend.get("risks"), devops.get("risks")
-                ),
-            }
-        )
-
-    elif phase_name == "Implementation Planning":
-        backend = latest.get("backend_engineer", {})
-        frontend = latest.get("frontend_engineer", {})
-        devops = latest.get("devops_engineer", {})
-        pm = latest.get("product_manager", {})
-        artifact.update(
-            {
-                "work_breakdown": _merge_values(backend.get("backend_plan"), frontend.get("frontend_plan")),
-                "timeline_milestones": _merge_values(pm.get("decisions")),
-                "resource_plan": _merge_values(devops.get("controls"), pm.get("insights")),
-                "dependency_plan": _merge_values(backend.get("dependencies"), frontend.get("dependencies")),
-                "raci_outline": _merge_values(pm.get("decisions")),
-                "change_control": _merge_values(devops.get("controls")),
-            }
-        )
-
-    elif phase_name == "Testing Strategy":
-        qa = latest.get("qa_engineer", {})
-        sec = latest.get("security_specialist", {})
-        artifact.update(
-            {
-                "test_levels": _merge_values(qa.get("test_strategy")),
-                "acceptance_criteria": _merge_values(qa.get("quality_gates")),
-                "quality_gates": _merge_values(qa.get("quality_gates")),
-                "test_data_strategy": _merge_values(qa.get("test_strategy")),
-                "defect_management": _merge_values(qa.get("risks"), sec.get("risks")),
-            }
-        )
-
-    elif phase_name == "Deployment Planning":
-        devops = latest.get("devops_engineer", {})
-        sec = latest.get("security_specialist", {})
-        artifact.update(
-            {
-                "environment_strategy": _merge_values(devops.get("devops_plan")),
-                "release_strategy": _merge_values(devops.get("controls")),
-                "rollback_plan": _merge_values(devops.get("controls"), devops.get("risks")),
-                "observability_plan": _merge_values(devops.get("controls")),
-                "operational_readiness": _merge_values(sec.get("security_controls"), devops.get("devops_plan")),
-            }
-        )
-
-    elif phase_name == "Maintenance Strategy":
-        pm = latest.get("product_manager", {})
-        qa = latest.get("qa_engineer", {})
-        devops = latest.get("devops_engineer", {})
-        artifact.update(
-            {
-                "support_model": _merge_values(devops.get("devops_plan"), pm.get("insights")),
-                "incident_response": _merge_values(devops.get("controls"), qa.get("quality_gates")),
-                "sla_slo": _merge_values(pm.get("decisions"), qa.get("quality_gates")),
-                "continuous_improvement": _merge_values(pm.get("open_risks"), qa.get("risks")),
-                "monitoring_governance": _merge_values(devops.get("controls")),
-            }
-        )
-
-    else:
-        artifact["raw"] = contributions[-1] if contributions else {}
-
-    for field in schema_fields:
-        artifact.setdefault(field, [])
-    return artifact
+    return PhaseArtifactBuilder.from_contributions(phase_name, contributions).artifact()
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any
+
+from providers.tokens import truncate_to_tokens
+
+if TYPE_CHECKING:
+    from agents.base_agent import AgentTurn
+    from agents.summarizer import SummarizerAgent
+    from orchestration.meeting_state import MeetingState
+
+TURN_LINE_MAX_TOKENS = 600
+
+
+@dataclass
+class PhaseSummary:
+    text: str = ""
+    covered_turn: int = 0
+    final: bool = False
+
+    def to_json(self) -> dict[str, Any]:
+        return {"text": self.text, "covered_turn": self.covered_turn, "final": self.final}
+
+    @classmethod
+    def from_json(cls, payload: dict[str, Any]) -> "PhaseSummary":
+        return cls(
+            text=str(payload.get("text", "")),
+            covered_turn=int(payload.get("covered_turn", 0)),
+            final=bool(payload.get("final", False)),
+        )
+
+
+@dataclass
+class SummaryMemory:
+    phases: dict[str, PhaseSummary] = field(default_factory=dict)
+    meeting: str = ""
+    meeting_phases: list[str] = field(default_factory=list)
+
+    def retain(self, keep_phases: set[str]) -> None:
+        self.phases = {name: summary for name, summary in self.phases.items() if name in keep_phases}
+        if any(name not in keep_phases for name in self.meeting_phases):
+            # The meeting summary cannot be unfolded, so kept phases fall back to their own summaries.
+            self.meeting = ""
+            self.meeting_phases = []
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "phases": {name: summary.to_json() for name, summary in self.phases.items()},
+            "meeting": self.meeting,
+            "meeting_phases": list(self.meeting_phases),
+        }
+
+    @classmethod
+    def from_json(cls, payload: dict[str, Any]) -> "SummaryMemory":
+        phases_payload = payload.get("phases", {})
+        return cls(
+            phases={
+                str(name): PhaseSummary.from_json(raw)
+                for name, raw in (phases_payload.items() if isinstance(phases_payload, dict) else [])
+                if isinstance(raw, dict)
+            },
+            meeting=str(payload.get("meeting", "")),
+            meeting_phases=[str(name) for name in payload.get("meeting_phases", []) or []],
+        )
+
+
+@dataclass
+class _FoldResult:
+    phase: str
+    turn: AgentTurn | None = None
+    phase_summary: PhaseSummary | None = None
+    meeting: str | None = None
+    meeting_phases: list[str] | None = None
+    error: str = ""
+
+
+class RollingSummarizer:
+    def __init__(self, agent: SummarizerAgent, keep_recent_turns: int, chunk_turns: int) -> None:
+        self.agent = agent
+        self.keep_recent_turns = max(0, keep_recent_turns)
+        self.chunk_turns = max(1, chunk_turns)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="summary-memory")
+        self._pending: list[Future[_FoldResult]] = []
+        self._lock = threading.Lock()
+        # Jobs run one at a time on the worker, so each folds onto the result of the previous one.
+        self._latest: dict[str, PhaseSummary] = {}
+        self._latest_meeting: tuple[str, list[str]] | None = None
+        self._scheduled_through: dict[str, int] = {}
+
+    def _seed(self, state: MeetingState, phase: str) -> None:
+        with self._lock:
+            if phase not in self._latest:
+                self._latest[phase] = replace(state.summary_memory.phases.get(phase, PhaseSummary()))
+            if self._latest_meeting is None:
+                memory = state.summary_memory
+                self._latest_meeting = (memory.meeting, list(memory.meeting_phases))
+            self._scheduled_through.setdefault(phase, self._latest[phase].covered_turn)
+
+    @staticmethod
+    def _turn_lines(state: MeetingState, phase: str, after_turn: int, through_turn: int) -> list[str]:
+        return [
+            truncate_to_tokens(entry.context_line, TURN_LINE_MAX_TOKENS)
+            for entry in state.phase_entries(phase)
+            if after_turn < entry.turn <= through_turn
+        ]
+
+    def _fold_turns(self, phase: str, turn_lines: list[str], through_turn: int, final: bool) -> _FoldResult:
+        with self._lock:
+            previous = self._latest[phase]
+        try:
+            turn = self.agent.fold_turns(phase, previous.text, turn_lines) if turn_lines else None
+        except Exception as exc:
+            return _FoldResult(phase=phase, error=str(exc))
+        summary = PhaseSummary(text=turn.content if turn else previous.text, covered_turn=through_turn, final=final)
+        with self._lock:
+            self._latest[phase] = summary
+        return _FoldResult(phase=phase, turn=turn, phase_summary=summary)
+
+    def _fold_phase(self, phase: str) -> _FoldResult:
+        with self._lock:
+            phase_text = self._latest[phase].text
+            meeting, meeting_phases = self._latest_meeting or ("", [])
+        if not phase_text or phase in meeting_phases:
+            return _FoldResult(phase=phase)
+        try:
+            turn = self.agent.fold_phase(phase, meeting, phase_text)
+        except Exception as exc:
+            return _FoldResult(phase=phase, error=str(exc))
+        folded = (turn.content, [*meeting_phases, phase])
+        with self._lock:
+            self._latest_meeting = folded
+        return _FoldResult(phase=phase, turn=turn, meeting=folded[0], meeting_phases=folded[1])
+
+    def schedule(self, state: MeetingState) -> None:
+        phase = state.current_phase
+        self._seed(state, phase)
+        entries = state.phase_entries(phase)
+        if len(entries) <= self.keep_recent_turns:
+            return
+        evicted_through = entries[len(entries) - self.keep_recent_turns - 1].turn
+        after_turn = self._scheduled_through[phase]
+        turn_lines = self._turn_lines(state, phase, after_turn, evicted_through)
+        if len(turn_lines) < self.chunk_turns:
+            return
+        self._scheduled_through[phase] = evicted_through
+        self._pending.append(self._executor.submit(self._fold_turns, phase, turn_lines, evicted_through, False))
+
+    def finalize_phase(self, state: MeetingState, phase: str) -> None:
+        self._seed(state, phase)
+        entries = state.phase_entries(phase)
+        through_turn = entries[-1].turn if entries else self._scheduled_through[phase]
+        turn_lines = self._turn_lines(state, phase, self._scheduled_through[phase], through_turn)
+        artifact_summary = str(state.phase_states[phase].artifact.get("summary", "")).strip()
+        if artifact_summary:
+            turn_lines.append(f"facilitator (approved phase summary): {artifact_summary}")
+        self._scheduled_through[phase] = through_turn
+        self._pending.append(self._executor.submit(self._fold_turns, phase, turn_lines, through_turn, True))
+        self._pending.append(self._executor.submit(self._fold_phase, phase))
+
+    def apply(self, state: MeetingState, wait: bool = False) -> tuple[list[AgentTurn], list[str]]:
+        turns: list[AgentTurn] = []
+        errors: list[str] = []
+        while self._pending and (wait or self._pending[0].done()):
+            result = self._pending.pop(0).result()
+            if result.turn is not None:
+                turns.append(result.turn)
+            if result.error:
+                errors.append(f"{result.phase}: {result.error}")
+                with self._lock:
+                    self._scheduled_through[result.phase] = self._latest[result.phase].covered_turn
+                continue
+            if result.phase_summary is not None:
+                state.set_phase_summary(result.phase, result.phase_summary)
+            if result.meeting is not None:
+                state.set_meeting_summary(result.meeting, list(result.meeting_phases or []))
+        return turns, errors
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
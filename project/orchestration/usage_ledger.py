@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Iterable
+
+from config.settings import RuntimeSettings
+
+BUDGET_OK = "ok"
+BUDGET_SOFT = "soft"
+BUDGET_HARD = "hard"
+
+
+class BudgetExceededError(RuntimeError):
+    pass
+
+
+@dataclass
+class UsageRecord:
+    turn: int
+    phase: str
+    speaker: str
+    provider: str
+    model: str
+    prompt_tokens: int
+    completion_tokens: int
+    latency_seconds: float
+    retries: int = 0
+    cached: bool = False
+    cost_usd: float = 0.0
+    superseded: bool = False
+    timestamp_utc: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    @classmethod
+    def from_json(cls, row: dict[str, Any]) -> "UsageRecord":
+        return cls(
+            turn=int(row.get("turn", 0)),
+            phase=str(row.get("phase", "")),
+            speaker=str(row.get("speaker", "unknown")),
+            provider=str(row.get("provider", "")),
+            model=str(row.get("model", "")),
+            prompt_tokens=int(row.get("prompt_tokens", 0)),
+            completion_tokens=int(row.get("completion_tokens", 0)),
+            latency_seconds=float(row.get("latency_seconds", 0.0)),
+            retries=int(row.get("retries", 0)),
+            cached=bool(row.get("cached", False)),
+            cost_usd=float(row.get("cost_usd", 0.0)),
+            superseded=bool(row.get("superseded", False)),
+            timestamp_utc=str(row.get("timestamp_utc", datetime.utcnow().isoformat())),
+        )
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "turn": self.turn,
+            "phase": self.phase,
+            "speaker": self.speaker,
+            "provider": self.provider,
+            "model": self.model,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "latency_seconds": round(self.latency_seconds, 3),
+            "retries": self.retries,
+            "cached": self.cached,
+            "cost_usd": round(self.cost_usd, 6),
+            "superseded": self.superseded,
+            "timestamp_utc": self.timestamp_utc,
+        }
+
+
+@dataclass
+class UsageTotals:
+    calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    latency_seconds: float = 0.0
+    retries: int = 0
+    cached_calls: int = 0
+    cost_usd: float = 0.0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    def add(self, record: UsageRecord) -> None:
+        self.calls += 1
+        self.prompt_tokens += record.prompt_tokens
+        self.completion_tokens += record.completion_tokens
+        self.latency_seconds += record.latency_seconds
+        self.retries += record.retries
+        self.cached_calls += 1 if record.cached else 0
+        self.cost_usd += record.cost_usd
+
+    @classmethod
+    def of(cls, records: Iterable[UsageRecord]) -> "UsageTotals":
+        totals = cls()
+        for record in records:
+            totals.add(record)
+        return totals
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.total_tokens,
+            "latency_seconds": round(self.latency_seconds, 3),
+            "retries": self.retries,
+            "cached_calls": self.cached_calls,
+            "cost_usd": round(self.cost_usd, 6),
+        }
+
+    def summary(self) -> str:
+        return (
+            f"calls={self.calls} tokens={self.total_tokens} "
+            f"(prompt={self.prompt_tokens}, completion={self.completion_tokens}) "
+            f"cost~${self.cost_usd:.4f} latency={self.latency_seconds:.1f}s "
+            f"retries={self.retries} cached={self.cached_calls}"
+        )
+
+
+@dataclass(frozen=True)
+class BudgetLimits:
+    soft_tokens: int = 0
+    hard_tokens: int = 0
+    soft_cost_usd: float = 0.0
+    hard_cost_usd: float = 0.0
+
+    def status(self, totals: UsageTotals) -> str:
+        if (self.hard_tokens and totals.total_tokens >= self.hard_tokens) or (
+            self.hard_cost_usd and totals.cost_usd >= self.hard_cost_usd
+        ):
+            return BUDGET_HARD
+        if (self.soft_tokens and totals.total_tokens >= self.soft_tokens) or (
+            self.soft_cost_usd and totals.cost_usd >= self.soft_cost_usd
+        ):
+            return BUDGET_SOFT
+        return BUDGET_OK
+
+
+@dataclass(frozen=True)
+class BudgetPolicy:
+    phase: BudgetLimits = BudgetLimits()
+    meeting: BudgetLimits = BudgetLimits()
+
+
+def build_budget_policy(settings: RuntimeSettings) -> BudgetPolicy:
+    return BudgetPolicy(
+        phase=BudgetLimits(
+            soft_tokens=settings.budget_phase_soft_tokens,
+            hard_tokens=settings.budget_phase_hard_tokens,
+            soft_cost_usd=settings.budget_phase_soft_cost_usd,
+            hard_cost_usd=settings.budget_phase_hard_cost_usd,
+        ),
+        meeting=BudgetLimits(
+            soft_tokens=settings.budget_meeting_soft_tokens,
+            hard_tokens=settings.budget_meeting_hard_tokens,
+            soft_cost_usd=settings.budget_meeting_soft_cost_usd,
+            hard_cost_usd=settings.budget_meeting_hard_cost_usd,
+        ),
+    )
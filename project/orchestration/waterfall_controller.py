@@ -1,31 +1,44 @@
 from __future__ import annotations
 
 import json
+import os
 import re
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 from agents.architect import ArchitectAgent
 from agents.backend_engineer import BackendEngineerAgent
-from agents.base_agent import BaseProjectAgent
+from agents.base_agent import AgentTurn, BaseProjectAgent
 from agents.business_analyst import BusinessAnalystAgent
 from agents.devops_engineer import DevOpsEngineerAgent
-from project.agents.document_monitor import DocumentMonitorAgent
+from agents.document_monitor import DocumentMonitorAgent
 from agents.facilitator import FacilitatorAgent
 from agents.frontend_engineer import FrontendEngineerAgent
 from agents.human_stakeholder import HumanStakeholderProxy
 from agents.product_manager import ProductManagerAgent
 from agents.qa_engineer import QAEngineerAgent
 from agents.security_specialist import SecuritySpecialistAgent
+from agents.summarizer import SummarizerAgent
 from agents.ux_designer import UXDesignerAgent
-from config.settings import load_settings
-from interaction.channel import CLIChannel, InteractionChannel
-from orchestration.meeting_state import MeetingState, write_transcript_log
+from config.settings import RuntimeSettings, load_settings
+from interaction.channel import CassetteChannel, CLIChannel, InteractionChannel
+from orchestration.checkpoint_catalog import CheckpointCatalog, load_checkpoint
+from orchestration.checkpoint_format import compression_available, encoding_available
+from orchestration.journal import JOURNAL_SUFFIX, MeetingJournal
+from orchestration.persistence import PersistenceWriter
+from orchestration.context_packing import RETRIEVAL_SHARE, build_context_budget, pack_context
+from orchestration.meeting_state import MeetingState, TranscriptEntry, write_transcript_log
 from orchestration.phase_manager import PhaseManager
+from orchestration.summary_memory import RollingSummarizer
+from orchestration.usage_ledger import BUDGET_HARD, BUDGET_SOFT, BudgetExceededError, build_budget_policy
 from output.exporter import ProjectPlanExporter
 from prompts.phase_prompts import phase_context_prompt
+from providers.aio import await_interruptible, run_coroutine
+from providers.cassette import CassetteExhaustedError, CassetteMismatchError
 from providers.llm_provider import provider_factory
+from providers.tokens import MESSAGE_OVERHEAD_TOKENS, estimate_messages_tokens, truncate_to_tokens
 
 
 class WaterfallController:
@@ -50,12 +63,23 @@ class WaterfallController:
         "document_monitor": "document_monitor",
     }
 
-    def __init__(self, channel: InteractionChannel | None = None) -> None:
-        self.settings = load_settings()
+    def __init__(self, channel: InteractionChannel | None = None, settings: RuntimeSettings | None = None) -> None:
+        self.settings = settings or load_settings()
         self.phase_manager = PhaseManager()
         self.provider = provider_factory(self.settings)
         self.channel = channel or CLIChannel()
+        self.cassette = self.provider.cassette
+        if self.cassette is not None:
+            self.channel = CassetteChannel(self.channel, self.cassette)
         self.language = self.settings.meeting_language
+        self.budget = build_budget_policy(self.settings)
+        self.context_budget = build_context_budget(self.settings)
+        self._economy_mode = False
+        self.journal: MeetingJournal | None = None
+        self.persistence: PersistenceWriter | None = None
+        self.catalog = CheckpointCatalog(self.settings.output_dir)
+        self._resumed_from: Path | None = None
+        self.outputs: dict[str, Path] = {}
 
         self.facilitator = FacilitatorAgent(self.provider, language=self.language)
         self.human = HumanStakeholderProxy(channel=self.channel)
@@ -71,23 +95,86 @@ class WaterfallController:
             "ux_designer": UXDesignerAgent(self.provider, language=self.language),
             "security_specialist": SecuritySpecialistAgent(self.provider, language=self.language),
         }
+        self.summarizer: RollingSummarizer | None = None
+        if self.settings.summary_memory_enabled:
+            self.summarizer = RollingSummarizer(
+                SummarizerAgent(self.provider, language=self.language),
+                keep_recent_turns=self.settings.context_window_turns,
+                chunk_turns=self.settings.summary_chunk_turns,
+            )
+        # Replays and deterministic runs need summaries at fixed points, not whenever the worker finishes.
+        self._summary_sync = self.settings.deterministic_mode or self.cassette is not None
 
-    def run(self) -> None:
+    def run(self, state: MeetingState | None = None) -> MeetingState:
         self.channel.display("=== Waterfall Kickoff Multi-Agent Simulator ===")
-        state = self._initialize_or_resume_state()
+        started = time.perf_counter()
+        if self.settings.background_persistence:
+            self.persistence = PersistenceWriter()
+        self.catalog = CheckpointCatalog(self.settings.output_dir, writer=self.persistence)
+        # A state handed in by the caller (a branch or batch job) skips the prompts, and retention is left
+        # to that caller: sibling runs may still be writing checkpoints for the same project.
+        prepared = state is not None
+        if state is None:
+            state = self._initialize_or_resume_state()
+        self.journal = MeetingJournal(
+            self._journal_path(state),
+            fsync_every=self.settings.journal_fsync_events,
+            snapshot_every=self.settings.journal_snapshot_events,
+            writer=self.persistence,
+            **self._checkpoint_codec(),
+        )
+        self.journal.open(state)
         self._save_phase_checkpoint(state, reason="session_start")
+        if not prepared:
+            self._apply_checkpoint_retention()
 
         try:
             self._run_phases(state)
         except KeyboardInterrupt:
-            state.interrupted = True
+            state.mark_interrupted()
             self.channel.display("\nMeeting interrupted by user.")
             self._save_phase_checkpoint(state, reason="interrupted")
+        except BudgetExceededError as exc:
+            self.channel.display(f"\n[Budget] {exc}")
+            self._save_phase_checkpoint(state, reason="budget_exhausted")
+        except (CassetteExhaustedError, CassetteMismatchError) as exc:
+            state.mark_interrupted()
+            self.channel.display(f"\n[Cassette] Replay stopped: {exc}")
+            self._save_phase_checkpoint(state, reason="replay_stopped")
+        finally:
+            if self.summarizer is not None:
+                if not state.interrupted:
+                    self._update_summary_memory(state, wait=True)
+                self.summarizer.shutdown()
+            self.journal.close()
+
+        try:
+            self._finish_meeting(state, started)
+        finally:
+            if self.persistence is not None:
+                # Durable flush: every queued checkpoint and export reaches disk before run() returns.
+                self.persistence.close()
+                for error in self.persistence.errors:
+                    self.channel.display(f"[Persistence] Write failed: {error}")
+        return state
 
+    def _finish_meeting(self, state: MeetingState, started: float) -> None:
         exporter = ProjectPlanExporter(self.settings.output_dir)
         finalized = state.is_fully_approved()
-        markdown_path, json_path = exporter.export(state, finalized=finalized)
-        log_path = write_transcript_log(state, self.settings.logs_dir)
+        name_suffix = self._slugify(state.branch_name) if state.lineage else ""
+        markdown_path, json_path = exporter.export(
+            state,
+            finalized=finalized,
+            writer=self.persistence,
+            name_suffix=name_suffix,
+        )
+        log_path = write_transcript_log(state, self.settings.logs_dir, writer=self.persistence, name_suffix=name_suffix)
+        self.outputs = {
+            "markdown": markdown_path,
+            "json": json_path,
+            "transcript": log_path,
+            "journal": self.journal.path,
+        }
 
         self.channel.display("\n=== Meeting completed ===")
         if not finalized:
@@ -96,6 +183,31 @@ class WaterfallController:
         self.channel.display(f"Markdown plan: {markdown_path}")
         self.channel.display(f"Structured JSON: {json_path}")
         self.channel.display(f"Transcript log: {log_path}")
+        self.channel.display(f"LLM usage (estimated): {state.usage_totals().summary()}")
+        self.channel.display(f"Provider health: {self.provider.health.summary()}")
+        if self.settings.hedge_enabled:
+            hedging_agents = [self.facilitator, *self.agents.values()]
+            if self.summarizer is not None:
+                hedging_agents.append(self.summarizer.agent)
+            fired = sum(agent.hedges_fired for agent in hedging_agents)
+            won = sum(agent.hedges_won for agent in hedging_agents)
+            self.channel.display(f"Hedged requests: {fired} fired, {won} answered first by the backup provider")
+        if self.provider.response_cache is not None:
+            self.channel.display(f"LLM response cache: {self.provider.response_cache.summary()}")
+        if self.cassette is not None:
+            self._report_cassette(state, time.perf_counter() - started)
+
+    def _report_cassette(self, state: MeetingState, elapsed_seconds: float) -> None:
+        self.channel.display(f"Cassette: {self.cassette.summary()}")
+        turns = ", ".join(
+            f"{name}={phase_state.turn_count}{'' if phase_state.converged else ' (not converged)'}"
+            for name, phase_state in state.phase_states.items()
+            if phase_state.turn_count
+        )
+        self.channel.display(f"Run wall-clock: {elapsed_seconds:.2f}s | turns to convergence: {turns or 'none'}")
+        report_path = self.cassette.write_mismatch_report()
+        if report_path is not None:
+            self.channel.display(f"Cassette mismatches written to: {report_path}")
 
     def _run_phases(self, state: MeetingState) -> None:
         while state.can_continue_meeting():
@@ -115,12 +227,15 @@ class WaterfallController:
             approved = self._request_human_approval(phase_name)
             state.approve_current_phase(approved)
             if not approved:
-                state.phase_states[phase_name].converged = False
+                state.reopen_current_phase()
                 self.channel.display(f"Phase '{phase_name}' rejected. Continuing discussion in same phase.")
                 self._save_phase_checkpoint(state, reason="phase_rejected")
                 continue
 
             self._print_phase_recap(state, phase_name)
+            if self.summarizer is not None:
+                self.summarizer.finalize_phase(state, phase_name)
+                self._update_summary_memory(state)
             self._save_phase_checkpoint(state, reason="phase_approved")
 
             if not state.transition_to_next_phase():
@@ -129,6 +244,12 @@ class WaterfallController:
 
     def _run_single_phase(self, state: MeetingState) -> bool:
         while state.can_continue_meeting() and state.can_continue_phase():
+            # One fsync per turn bounds crash loss to the turn in progress.
+            self.journal.sync()
+            self._enforce_budget(state)
+            if self.summarizer is not None:
+                self.summarizer.schedule(state)
+                self._update_summary_memory(state)
             facilitator_decision = self._facilitator_decision(state)
             readiness_score = int(facilitator_decision.get("readiness_score", 0))
 
@@ -188,14 +309,18 @@ class WaterfallController:
                     selected_speaker = self.phase_manager.fallback_role_for_phase(state.current_phase)
 
                 agent = self.agents[selected_speaker]
-                context_messages = self._build_context_messages(state)
-                agent_turn = agent.respond(
+                context_messages, through_turn, continue_dialog = self._dialog_context(state, agent, query=instruction)
+                agent_turn = self._respond_interruptible(
+                    agent,
                     phase=state.current_phase,
                     facilitator_instruction=instruction,
                     context_messages=context_messages,
+                    through_turn=through_turn,
+                    continue_dialog=continue_dialog,
                 )
-                self._print_role_turn(agent_turn.role, agent_turn.content)
+                self._print_role_turn(agent_turn.role, agent_turn.content, streamed=agent_turn.streamed)
                 state.add_transcript(agent_turn.role, agent_turn.content)
+                self._record_usage(state, agent_turn)
                 parsed_agent_payload = self._safe_parse_json(agent_turn.content)
                 if parsed_agent_payload:
                     state.update_phase_draft(parsed_agent_payload)
@@ -209,6 +334,7 @@ class WaterfallController:
                     "document": phase_state.draft_artifact,
                 }
                 state.mark_phase_converged(artifact)
+                self.journal.sync()
                 self.channel.display(f"Convergence detected for phase '{state.current_phase}'.")
                 self.channel.display(f"Phase summary: {artifact['summary']}")
                 return True
@@ -256,63 +382,75 @@ class WaterfallController:
         path.mkdir(parents=True, exist_ok=True)
         return path
 
-    def _save_phase_checkpoint(self, state: MeetingState, reason: str) -> Path:
-        stamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        phase_no = state.current_phase_index + 1
-        filename = (
-            f"meeting_checkpoint_{self._slugify(state.project_name)}_"
-            f"p{phase_no:02d}_{reason}_{stamp}.json"
-        )
-        path = self._checkpoint_dir() / filename
-        payload = state.to_json()
-        payload["checkpoint_reason"] = reason
-        payload["checkpoint_created_utc"] = datetime.utcnow().isoformat()
-        with path.open("w", encoding="utf-8") as handle:
-            json.dump(payload, handle, ensure_ascii=False, indent=2)
-        self.channel.display(f"[Checkpoint] Saved: {path}")
-        return path
+    def _journal_path(self, state: MeetingState) -> Path:
+        # Sessions of one project started in the same second (batch or branch workers) must not share a journal,
+        # since each snapshot replaces the whole file.
+        stamp = f"{datetime.utcnow().strftime('%Y%m%d_%H%M%S_%f')}_{os.getpid()}"
+        name = self._slugify(state.project_name)
+        if state.lineage:
+            name = f"{name}_{self._slugify(state.branch_name)}"
+        return self._checkpoint_dir() / f"meeting_journal_{name}_{stamp}{JOURNAL_SUFFIX}"
+
+    def _checkpoint_codec(self) -> dict[str, str]:
+        encoding = self.settings.checkpoint_encoding
+        compression = self.settings.checkpoint_compression
+        if not encoding_available(encoding):
+            self.channel.display(f"[Checkpoint] '{encoding}' encoding needs the msgpack package; using json.")
+            encoding = "json"
+        if not compression_available(compression):
+            self.channel.display(f"[Checkpoint] '{compression}' compression needs the zstandard package; using gzip.")
+            compression = "gzip"
+        return {"encoding": encoding, "compression": compression}
 
-    def _list_checkpoint_files(self) -> list[Path]:
-        checkpoint_paths = sorted(
-            self._checkpoint_dir().glob("meeting_checkpoint_*.json"),
-            key=lambda item: item.stat().st_mtime,
-            reverse=True,
+    def _save_phase_checkpoint(self, state: MeetingState, reason: str) -> Path:
+        self.journal.checkpoint(reason)
+        self.catalog.record(self.journal.path, state, reason)
+        self.channel.display(
+            f"[Checkpoint] {reason} (phase {state.current_phase_index + 1}, turn {state.total_turns}): "
+            f"{self.journal.path}"
         )
-        if checkpoint_paths:
-            return checkpoint_paths
+        return self.journal.path
 
-        legacy = sorted(
-            self.settings.output_dir.glob("project_development_*.json"),
-            key=lambda item: item.stat().st_mtime,
-            reverse=True,
-        )
-        return legacy
+    def _apply_checkpoint_retention(self) -> None:
+        keep = self.settings.checkpoint_keep_per_project
+        max_age_days = self.settings.checkpoint_max_age_days
+        if keep <= 0 and max_age_days <= 0:
+            return
+        protect = {self.journal.path}
+        if self._resumed_from is not None:
+            protect.add(self._resumed_from)
+        removed = self.catalog.apply_retention(keep, max_age_days, protect)
+        if removed:
+            self.channel.display(f"[Checkpoint] Retention removed {len(removed)} old checkpoint file(s).")
 
     def _pick_checkpoint_file(self) -> Path | None:
-        checkpoints = self._list_checkpoint_files()
-        if not checkpoints:
+        indexed, dropped = self.catalog.refresh()
+        if indexed or dropped:
+            self.channel.display(f"[Checkpoint] Catalog updated: {indexed} indexed, {dropped} missing removed.")
+        entries = self.catalog.entries()
+        if not entries:
             self.channel.display("No checkpoints found; starting a new meeting.")
             return None
 
         self.channel.display("Available checkpoints:")
-        preview = checkpoints[:12]
-        for index, path in enumerate(preview, start=1):
-            self.channel.display(f"  {index}. {path.name}")
+        preview = entries[:12]
+        for index, entry in enumerate(preview, start=1):
+            self.channel.display(f"  {index}. {entry.describe()}")
 
         raw_choice = self.channel.prompt_text(
             f"Select checkpoint number (1-{len(preview)}) or press Enter for latest: "
         ).strip()
         if not raw_choice:
-            return preview[0]
+            return self.catalog.path_for(preview[0])
         try:
             chosen = int(raw_choice)
         except ValueError:
             self.channel.display("Invalid selection; using latest checkpoint.")
-            return preview[0]
+            return self.catalog.path_for(preview[0])
         if chosen < 1 or chosen > len(preview):
             self.channel.display("Selection out of range; using latest checkpoint.")
-            return preview[0]
-        return preview[chosen - 1]
+            return self.catalog.path_for(preview[0])
+        return self.catalog.path_for(preview[chosen - 1])
 
     def _prompt_resume_phase(self, state: MeetingState) -> int:
         self.channel.display("Phases available for resume:")
@@ -345,10 +483,9 @@ class WaterfallController:
             selected = self._pick_checkpoint_file()
             if selected is not None:
                 try:
-                    with selected.open("r", encoding="utf-8") as handle:
-                        payload = json.load(handle)
-                    state = MeetingState.from_json(payload)
+                    state = load_checkpoint(selected)
                     state.interrupted = False
+                    self._resumed_from = selected
                     self.channel.display(f"Loaded checkpoint: {selected}")
                     phase_index = self._prompt_resume_phase(state)
                     if phase_index != state.current_phase_index:
@@ -360,6 +497,9 @@ class WaterfallController:
 
         project_name = self.channel.prompt_text("Project name: ").strip() or "Untitled Project"
         project_description = self.channel.prompt_text("Initial project description: ").strip()
+        return self.new_state(project_name, project_description)
+
+    def new_state(self, project_name: str, project_description: str) -> MeetingState:
         state = MeetingState(
             project_name=project_name,
             project_description=project_description,
@@ -376,8 +516,7 @@ class WaterfallController:
         if not required_roles:
             return []
 
-        phase_entries = [entry for entry in state.transcript if entry.phase == state.current_phase]
-        spoken_roles = {entry.speaker for entry in phase_entries if entry.speaker not in {"facilitator", "human_stakeholder"}}
+        spoken_roles = state.spoken_roles(state.current_phase)
         return [role for role in required_roles if role not in spoken_roles]
 
     @staticmethod
@@ -414,16 +553,25 @@ class WaterfallController:
 
     def _facilitator_decision(self, state: MeetingState) -> dict[str, Any]:
         phase = state.current_phase
-        phase_prompt = phase_context_prompt(phase, language=self.language)
         allowed_roles = self.phase_manager.allowed_roles_for_phase(phase)
-        if self.settings.smart_forgetting:
-            phase_transcript = [entry for entry in state.transcript if entry.phase == phase]
-            last_turns = phase_transcript[-8:]
-        else:
-            last_turns = state.transcript[-8:]
-        transcript_window = "\n".join(
-            f"{entry.speaker}: {entry.content}" for entry in last_turns
+        latest_entries = state.latest_entries(1)
+        latest = latest_entries[0].content if latest_entries else state.project_description
+        context_messages, through_turn, continue_dialog = self._dialog_context(
+            state, self.facilitator, query=f"{phase}\n{latest}"
         )
+        if continue_dialog:
+            # The phase prompt and the new turns are already in the facilitator's dialog.
+            phase_prompt = f"Phase: {phase}"
+            transcript_window = ""
+        else:
+            phase_prompt = phase_context_prompt(phase, language=self.language)
+            if self.settings.smart_forgetting:
+                last_turns = state.recent_entries(phase, 8)
+            else:
+                last_turns = state.latest_entries(8)
+            transcript_window = "Recent transcript:\n" + "\n".join(
+                f"{entry.speaker}: {entry.content}" for entry in last_turns
+            )
 
         instruction = (
             f"{phase_prompt}\n"
@@ -433,27 +581,126 @@ class WaterfallController:
             "Select selected_speaker ONLY from allowed speakers above (or human_stakeholder).\n"
             "Use your reasoning to decide next speaker and whether the phase is converged.\n"
             "Provide readiness_score (0-100) indicating how close this phase is to converged and review-ready.\n"
-            "Recent transcript:\n"
             f"{transcript_window}"
         )
-        context_messages = self._build_context_messages(state)
-        result = self.facilitator.respond(
+        result = self._respond_interruptible(
+            self.facilitator,
             phase=phase,
             facilitator_instruction=instruction,
             context_messages=context_messages,
+            through_turn=through_turn,
+            continue_dialog=continue_dialog,
         )
         state.add_transcript("facilitator", result.content)
+        self._record_usage(state, result)
 
         parsed = self._safe_parse_json(result.content)
         if "readiness_score" not in parsed:
             parsed["readiness_score"] = self._estimate_readiness(parsed, state)
-        self._print_facilitator_turn(parsed, result.content)
+        self._print_facilitator_turn(parsed, result.content, streamed=result.streamed)
         if "selected_speaker" not in parsed:
             parsed["selected_speaker"] = self.phase_manager.fallback_role_for_phase(phase)
         if "instruction" not in parsed:
             parsed["instruction"] = "Provide concise phase contribution for convergence."
         return parsed
 
+    def _respond_interruptible(
+        self,
+        agent: BaseProjectAgent,
+        phase: str,
+        facilitator_instruction: str,
+        context_messages: list[dict[str, str]],
+        through_turn: int | None = None,
+        continue_dialog: bool = False,
+    ) -> AgentTurn:
+        on_chunk = None
+        if self.channel.supports_streaming:
+
+            def on_chunk(chunk: str) -> None:
+                self.channel.display_stream(agent.role, chunk)
+
+        self.channel.begin_busy(f"Waiting for {agent.role}...")
+        try:
+            interrupted, turn = run_coroutine(
+                await_interruptible(
+                    agent.arespond(
+                        phase,
+                        facilitator_instruction,
+                        context_messages,
+                        on_chunk=on_chunk,
+                        through_turn=through_turn,
+                        continue_dialog=continue_dialog,
+                    ),
+                    self.channel.interrupt_requested,
+                )
+            )
+        finally:
+            self.channel.end_busy()
+            if on_chunk is not None:
+                self.channel.end_stream(agent.role)
+        if interrupted or turn is None:
+            raise KeyboardInterrupt("Human interrupted the meeting.")
+        return turn
+
+    def _update_summary_memory(self, state: MeetingState, wait: bool = False) -> None:
+        turns, errors = self.summarizer.apply(state, wait=wait or self._summary_sync)
+        for turn in turns:
+            self._record_usage(state, turn)
+        for error in errors:
+            self.channel.display(f"[Memory] Summary update failed for {error}")
+
+    def _record_usage(self, state: MeetingState, turn: AgentTurn) -> None:
+        if turn.usage is None:
+            return
+        cost = 0.0 if turn.usage.cached else self.provider.estimate_cost(
+            turn.usage.provider,
+            turn.usage.model,
+            turn.usage.prompt_tokens,
+            turn.usage.completion_tokens,
+        )
+        state.record_usage(turn.role, turn.usage, cost, phase=turn.phase)
+        # Cancelled hedge requests are billed but produced nothing: they count toward the meeting budget only.
+        for loss in turn.hedge_losses:
+            loss_cost = self.provider.estimate_cost(loss.provider, loss.model, loss.prompt_tokens, 0)
+            state.record_usage(turn.role, loss, loss_cost, phase=turn.phase, superseded=True)
+
+    def _set_economy_mode(self, enabled: bool) -> None:
+        if enabled == self._economy_mode:
+            return
+        self._economy_mode = enabled
+        self.facilitator.set_economy_mode(enabled)
+        for agent in self.agents.values():
+            agent.set_economy_mode(enabled)
+
+    def _enforce_budget(self, state: MeetingState) -> None:
+        phase = state.current_phase
+        meeting_totals = state.usage_totals()
+        phase_totals = state.usage_totals(phase)
+        meeting_status = self.budget.meeting.status(meeting_totals)
+        phase_status = self.budget.phase.status(phase_totals)
+
+        if meeting_status == BUDGET_HARD:
+            raise BudgetExceededError(
+                f"Meeting hard budget reached ({meeting_totals.total_tokens} tokens, "
+                f"~${meeting_totals.cost_usd:.4f}). Stopping; resume from the checkpoint after raising the limit."
+            )
+        if phase_status == BUDGET_HARD:
+            raise BudgetExceededError(
+                f"Phase '{phase}' hard budget reached ({phase_totals.total_tokens} tokens, "
+                f"~${phase_totals.cost_usd:.4f}). Stopping; resume from the checkpoint after raising the limit."
+            )
+
+        economy = BUDGET_SOFT in {meeting_status, phase_status}
+        if economy and not self._economy_mode:
+            self.channel.display(
+                f"[Budget] Soft limit reached (phase: {phase_totals.total_tokens} tokens ~${phase_totals.cost_usd:.4f}, "
+                f"meeting: {meeting_totals.total_tokens} tokens ~${meeting_totals.cost_usd:.4f}); "
+                "switching roles to economy models."
+            )
+        elif not economy and self._economy_mode:
+            self.channel.display("[Budget] Back under soft limits; restoring configured models.")
+        self._set_economy_mode(economy)
+
     @staticmethod
     def _safe_parse_json(raw_text: str) -> dict[str, Any]:
         raw_text = raw_text.strip()
@@ -499,23 +746,136 @@ class WaterfallController:
             + "\n".join(memory_lines)
         )
 
-    def _build_context_messages(self, state: MeetingState) -> list[dict[str, str]]:
-        if self.settings.smart_forgetting:
-            phase_entries = [entry for entry in state.transcript if entry.phase == state.current_phase]
-            window = phase_entries[-self.settings.context_window_turns :]
-        else:
-            window = state.transcript[-max(10, self.settings.context_window_turns) :]
-
-        messages: list[dict[str, str]] = []
-        memory = self._compact_phase_memory(state)
-        if memory:
-            messages.append({"role": "user", "content": memory})
-        messages.extend(
-            {"role": "user", "content": f"{entry.speaker}: {entry.content}"}
-            for entry in window
+    def _summary_memory_context(self, state: MeetingState) -> str:
+        if self.settings.phase_memory_limit <= 0:
+            return ""
+
+        memory = state.summary_memory
+        lines: list[str] = []
+        if memory.meeting:
+            lines.append(f"Meeting so far ({', '.join(memory.meeting_phases)}): {memory.meeting}")
+        for phase_name in state.phases[: state.current_phase_index]:
+            summary = memory.phases.get(phase_name)
+            if phase_name not in memory.meeting_phases and summary is not None and summary.text:
+                lines.append(f"- {phase_name}: {summary.text}")
+        current = memory.phases.get(state.current_phase)
+        if current is not None and current.text:
+            lines.append(f"Earlier in {state.current_phase}: {current.text}")
+
+        if not lines:
+            return ""
+        return (
+            "Rolling memory of earlier discussion (for continuity only, do not restate verbatim):\n"
+            + "\n".join(lines)
         )
+
+    def _retrieved_context(self, state: MeetingState, query: str, exclude_turns: set[int]) -> str:
+        if self.settings.retrieval_top_k <= 0 or not query.strip():
+            return ""
+        hits = state.search_context(query, self.settings.retrieval_top_k, exclude_turns=exclude_turns)
+        if not hits:
+            return ""
+        snippets = [
+            f"- [{hit.label}] {truncate_to_tokens(hit.text, self.settings.retrieval_snippet_tokens)}" for hit in hits
+        ]
+        return (
+            "Relevant earlier context retrieved for this turn (newer turns take precedence):\n"
+            + "\n".join(snippets)
+        )
+
+    def _build_context_messages(
+        self,
+        state: MeetingState,
+        agent: BaseProjectAgent,
+        query: str = "",
+    ) -> list[dict[str, str]]:
+        phase = state.current_phase
+        budget_tokens = self.context_budget.tokens_for(agent.role, agent.model)
+        memory = self._summary_memory_context(state) if self.summarizer is not None else ""
+        memory = memory or self._compact_phase_memory(state)
+        retrieving = self.settings.retrieval_top_k > 0 and bool(query.strip())
+
+        if budget_tokens > 0:
+            if self.settings.smart_forgetting:
+                recent: Iterable[TranscriptEntry] = reversed(state.phase_entries(phase))
+                pinned_phases = [phase]
+            else:
+                # The walk stops where the budget does, so older phases of a resumed meeting are only loaded when
+                # the packed context reaches back into them; pinned turns of phases still unloaded are not looked up.
+                recent = state.iter_transcript_reversed()
+                deferred = set(state.deferred_phases)
+                pinned_phases = [
+                    pinned_phase
+                    for pinned_phase in state.phases[: state.current_phase_index + 1]
+                    if pinned_phase not in deferred
+                ]
+            reserved = int(budget_tokens * RETRIEVAL_SHARE) if retrieving else 0
+            packed = pack_context(recent, memory, budget_tokens - reserved, self._pinned_entries(state, pinned_phases))
+            messages = packed.messages
+            window_turns = set(packed.turns)
+            retrieval_tokens = budget_tokens - packed.tokens - MESSAGE_OVERHEAD_TOKENS
+        else:
+            if self.settings.smart_forgetting:
+                window = state.phase_entries(phase)[-self.settings.context_window_turns :]
+            else:
+                window = state.latest_entries(max(10, self.settings.context_window_turns))
+            messages = [{"role": "user", "content": memory}] if memory else []
+            messages.extend({"role": "user", "content": entry.context_line} for entry in window)
+            window_turns = {entry.turn for entry in window}
+            retrieval_tokens = 0
+
+        retrieved = self._retrieved_context(state, query, window_turns) if retrieving else ""
+        if retrieved and budget_tokens > 0:
+            retrieved = truncate_to_tokens(retrieved, retrieval_tokens)
+        if retrieved:
+            messages.insert(1 if memory and messages else 0, {"role": "user", "content": retrieved})
         return messages
 
+    def _pinned_entries(self, state: MeetingState, phases: list[str]) -> Iterator[TranscriptEntry]:
+        for phase in reversed(phases):
+            entries = sorted(
+                (
+                    entry
+                    for speaker in self.context_budget.pinned_speakers
+                    for entry in state.speaker_entries(phase, speaker)
+                ),
+                key=lambda entry: entry.turn,
+            )
+            yield from reversed(entries)
+
+    def _dialog_context(
+        self,
+        state: MeetingState,
+        agent: BaseProjectAgent,
+        query: str,
+    ) -> tuple[list[dict[str, str]], int | None, bool]:
+        if not self.settings.incremental_dialog:
+            return self._build_context_messages(state, agent, query), None, False
+
+        through_turn = state.total_turns
+        position = agent.dialog_position(state.current_phase)
+        full_context = self._build_context_messages(state, agent, query)
+        if position is None or agent.dialog_tokens > self.settings.incremental_dialog_max_tokens:
+            return full_context, through_turn, False
+
+        if self.settings.smart_forgetting:
+            scope = reversed(state.phase_entries(state.current_phase))
+        else:
+            scope = state.iter_transcript_reversed()
+        delta: list[dict[str, str]] = []
+        for entry in scope:
+            if entry.turn <= position:
+                break
+            # The agent's own replies are already in its dialog as assistant messages.
+            if entry.speaker != agent.role:
+                delta.append({"role": "user", "content": entry.context_line})
+        delta.reverse()
+        # The whole dialog is resent on every call; once it costs more than the stateless window would,
+        # the agent starts over from that window.
+        if agent.dialog_tokens + estimate_messages_tokens(delta) > estimate_messages_tokens(full_context):
+            return full_context, through_turn, False
+        return delta, through_turn, True
+
     def _start_phase_dialogs(self) -> None:
         self.facilitator.start_new_dialog()
         for agent in self.agents.values():
@@ -530,17 +890,25 @@ class WaterfallController:
         self.channel.display("\n[Phase Artifact Snapshot For Review]")
         self.channel.display(WaterfallController._render_human_readable_payload(draft))
 
-    def _print_facilitator_turn(self, parsed: dict[str, Any], raw_content: str) -> None:
+    def _print_facilitator_turn(self, parsed: dict[str, Any], raw_content: str, streamed: bool = False) -> None:
         if not parsed:
-            self.channel.display(f"[facilitator] {raw_content}\n")
+            if not streamed:
+                self.channel.display(f"[facilitator] {raw_content}\n")
             return
 
-        self.channel.display("[facilitator]")
         selected = parsed.get("selected_speaker", "(not specified)")
         instruction = parsed.get("instruction", "(no instruction)")
         converged = bool(parsed.get("converged", False))
         reason = parsed.get("convergence_reason", "")
         readiness_score = int(parsed.get("readiness_score", 0))
+        if streamed:
+            # The raw reply was streamed above; only the routing decision is repeated.
+            self.channel.display(
+                f"- Next speaker: {selected} | Readiness: {readiness_score}/100 | Converged: {converged}\n"
+            )
+            return
+
+        self.channel.display("[facilitator]")
         self.channel.display(f"- Next speaker: {selected}")
         self.channel.display(f"- Instruction: {instruction}")
         self.channel.display(f"- Convergence readiness: {readiness_score}/100")
@@ -561,8 +929,15 @@ class WaterfallController:
             self.channel.display(f"- Convergence reason: {reason}")
         self.channel.display("")
 
-    def _print_role_turn(self, role: str, raw_content: str) -> None:
+    def _print_role_turn(self, role: str, raw_content: str, streamed: bool = False) -> None:
         parsed = WaterfallController._safe_parse_json(raw_content)
+        if streamed:
+            # The raw reply was streamed above; only what was parsed out of it is listed.
+            sections = [f"{key} ({len(value)})" for key, value in parsed.items() if isinstance(value, list)]
+            if sections:
+                self.channel.display(f"- Parsed: {', '.join(sections)}\n")
+            return
+
         self.channel.display(f"[{role}]")
         if not parsed:
             self.channel.display(raw_content)
@@ -653,10 +1028,7 @@ class WaterfallController:
         if readiness_score < 65:
             return False
 
-        recent_in_phase = [
-            entry for entry in reversed(state.transcript)
-            if entry.phase == state.current_phase and entry.speaker != "facilitator"
-        ][:2]
+        recent_in_phase = state.recent_entries(state.current_phase, 2, exclude=frozenset({"facilitator"}))
         if len(recent_in_phase) < 2:
             return False
 
@@ -5,7 +5,8 @@ from datetime import datetime
 from pathlib import Path
 
 from orchestration.meeting_state import MeetingState
-from output.templates import render_markdown_plan
+from orchestration.persistence import PersistenceWriter, write_text_durably
+from output.templates import render_branch_comparison, render_markdown_plan
 
 
 class ProjectPlanExporter:
@@ -13,12 +14,73 @@ class ProjectPlanExporter:
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-    def export(self, state: MeetingState, finalized: bool) -> tuple[Path, Path]:
+    def export(
+        self,
+        state: MeetingState,
+        finalized: bool,
+        writer: PersistenceWriter | None = None,
+        name_suffix: str = "",
+    ) -> tuple[Path, Path]:
         stamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
         prefix = "project_development_plan"
+        if name_suffix:
+            # Parallel runs (branches) can finish within the same second.
+            prefix = f"{prefix}_{name_suffix}"
         md_path = self.output_dir / f"{prefix}_{stamp}.md"
         json_path = self.output_dir / f"{prefix}_{stamp}.json"
 
-        md_path.write_text(render_markdown_plan(state), encoding="utf-8")
-        json_path.write_text(json.dumps(state.to_json(), indent=2, ensure_ascii=False), encoding="utf-8")
+        markdown = render_markdown_plan(state)
+        payload = state.to_json()
+
+        def write() -> tuple[Path, Path]:
+            write_text_durably(md_path, markdown)
+            write_text_durably(json_path, json.dumps(payload, indent=2, ensure_ascii=False))
+            return md_path, json_path
+
+        if writer is None:
+            return write()
+        writer.submit(write)
+        return md_path, json_path
+
+    def export_branch_comparison(
+        self,
+        states: list[MeetingState],
+        writer: PersistenceWriter | None = None,
+    ) -> tuple[Path, Path]:
+        stamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        prefix = "branch_comparison"
+        md_path = self.output_dir / f"{prefix}_{stamp}.md"
+        json_path = self.output_dir / f"{prefix}_{stamp}.json"
+
+        markdown = render_branch_comparison(states)
+        payload = {
+            "project_name": states[0].project_name if states else "",
+            "session_started_utc": states[0].session_started_utc if states else "",
+            "branches": [
+                {
+                    "name": state.branch_name,
+                    "lineage": [point.to_json() for point in state.lineage],
+                    "total_turns": state.total_turns,
+                    "fully_approved": state.is_fully_approved(),
+                    "usage": state.usage_totals().to_json(),
+                    "phases": {
+                        phase: {
+                            "approved_by_human": phase_state.approved_by_human,
+                            "artifact": phase_state.artifact,
+                        }
+                        for phase, phase_state in state.phase_states.items()
+                    },
+                }
+                for state in states
+            ],
+        }
+
+        def write() -> tuple[Path, Path]:
+            write_text_durably(md_path, markdown)
+            write_text_durably(json_path, json.dumps(payload, indent=2, ensure_ascii=False))
+            return md_path, json_path
+
+        if writer is None:
+            return write()
+        writer.submit(write)
         return md_path, json_path
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from typing import Any
 
 from orchestration.meeting_state import MeetingState
 
@@ -45,6 +46,27 @@ def render_markdown_plan(state: MeetingState) -> str:
             return "\n".join(f"- {item}" for item in field_value)
         return str(field_value)
 
+    def usage_appendix() -> list[str]:
+        if not state.usage:
+            return []
+        if language == "ru":
+            heading = "## Приложение — Использование моделей (оценка)"
+            header = "| Фаза | Вызовы | Токены (prompt / completion) | Стоимость, USD | Задержка, с | Повторы |"
+            total_label = "Итого"
+        else:
+            heading = "## Appendix — Model Usage (estimated)"
+            header = "| Phase | Calls | Tokens (prompt / completion) | Cost, USD | Latency, s | Retries |"
+            total_label = "Total"
+        summary = state.usage_summary()
+        rows = [heading, "", header, "|---|---|---|---|---|---|"]
+        for phase_name, totals in [*summary["by_phase"].items(), (total_label, summary["meeting"])]:
+            rows.append(
+                f"| {phase_name} | {totals['calls']} | {totals['prompt_tokens']} / {totals['completion_tokens']} "
+                f"| {totals['cost_usd']:.4f} | {totals['latency_seconds']:.1f} | {totals['retries']} |"
+            )
+        rows.append("")
+        return rows
+
     if language == "ru":
         lines = [
             f"# План разработки проекта: {state.project_name}",
@@ -96,6 +118,7 @@ def render_markdown_plan(state: MeetingState) -> str:
             "## 8. Итог, фазовые решения и дальнейшие шаги",
             artifact_doc_text("Maintenance Strategy", "_Добавьте итоговые выводы и план улучшений._"),
             "",
+            *usage_appendix(),
         ]
         return "\n".join(lines)
 
@@ -149,6 +172,79 @@ def render_markdown_plan(state: MeetingState) -> str:
         "## 8. Final Summary, Phase Gates, and Next Steps",
         artifact_doc_text("Maintenance Strategy", "_Add conclusions and continuous-improvement roadmap._"),
         "",
+        *usage_appendix(),
     ]
 
     return "\n".join(lines)
+
+
+def _table_cell(text: str) -> str:
+    return " ".join(str(text).split()).replace("|", "\\|") or "—"
+
+
+def _document_items(artifact: dict[str, Any], field_name: str) -> list[str]:
+    value = (artifact.get("document") or {}).get(field_name, [])
+    return [str(item) for item in value] if isinstance(value, list) else [str(value)]
+
+
+def render_branch_comparison(states: list[MeetingState]) -> str:
+    if not states:
+        return ""
+    russian = states[0].meeting_language == "ru"
+    labels = {
+        "title": "Сравнение веток" if russian else "Branch Comparison",
+        "branches": "Ветки" if russian else "Branches",
+        "header": (
+            "| Ветка | Родитель | Точка ветвления | Направление | Ходы | Утверждено фаз | Стоимость, USD |"
+            if russian
+            else "| Branch | Parent | Branched at | Direction | Turns | Approved phases | Cost, USD |"
+        ),
+        "summaries": "Итоги фаз" if russian else "Phase Summaries",
+        "phase": "Фаза" if russian else "Phase",
+        "field": "Поле" if russian else "Field",
+        "missing": "_нет артефакта_" if russian else "_no artifact_",
+    }
+    names = [state.branch_name for state in states]
+    first_divergent = min((state.lineage[-1].phase_index for state in states if state.lineage), default=0)
+    phases = states[0].phases[first_divergent:]
+
+    lines = [f"# {labels['title']}: {states[0].project_name}", "", f"## {labels['branches']}", "", labels["header"]]
+    lines.append("|---|---|---|---|---|---|---|")
+    for state in states:
+        point = state.lineage[-1] if state.lineage else None
+        approved = sum(1 for phase_state in state.phase_states.values() if phase_state.approved_by_human)
+        lines.append(
+            f"| {_table_cell(state.branch_name)} | {_table_cell(point.parent if point else '')} "
+            f"| {_table_cell(point.phase if point else '')} | {_table_cell(point.direction if point else '')} "
+            f"| {state.total_turns} | {approved}/{len(state.phases)} | {state.usage_totals().cost_usd:.4f} |"
+        )
+
+    lines.extend(["", f"## {labels['summaries']}", ""])
+    lines.append(f"| {labels['phase']} | " + " | ".join(_table_cell(name) for name in names) + " |")
+    lines.append("|---|" + "---|" * len(names))
+    for phase_name in phases:
+        artifacts = [state.phase_states[phase_name].artifact for state in states]
+        cells = [_table_cell(artifact.get("summary", "")) if artifact else labels["missing"] for artifact in artifacts]
+        lines.append(f"| {_table_cell(phase_name)} | " + " | ".join(cells) + " |")
+
+    for phase_name in phases:
+        artifacts = [state.phase_states[phase_name].artifact for state in states]
+        fields: list[str] = []
+        for artifact in artifacts:
+            for field_name in (artifact.get("document") or {}).get("schema_fields", []) or []:
+                if field_name not in fields:
+                    fields.append(str(field_name))
+        if not fields:
+            continue
+        lines.extend(["", f"### {phase_name}", ""])
+        lines.append(f"| {labels['field']} | " + " | ".join(_table_cell(name) for name in names) + " |")
+        lines.append("|---|" + "---|" * len(names))
+        for field_name in fields:
+            cells = [
+                "<br>".join(_table_cell(item) for item in _document_items(artifact, field_name)) or "—"
+                for artifact in artifacts
+            ]
+            lines.append(f"| {_table_cell(field_name)} | " + " | ".join(cells) + " |")
+
+    lines.append("")
+    return "\n".join(lines)
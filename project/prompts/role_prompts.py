@@ -230,6 +230,30 @@ def _build_ru_role_prompts() -> dict[str, str]:
     }
 
 
+def _build_en_summarizer_prompt() -> str:
+    return """
+Role: Meeting Memory Keeper.
+Boundary: condense transcript turns and phase summaries of a Waterfall kickoff meeting into a rolling summary.
+Keep every decision, requirement, constraint, owner, number and open question; drop repetition and chatter.
+Never invent content that is not in the input.
+Use English for all natural language fields.
+Respond in JSON:
+{"role":"summarizer","phase":"...","summary":"...","decisions":["..."],"open_questions":["..."]}
+""".strip()
+
+
+def _build_ru_summarizer_prompt() -> str:
+    return """
+Роль: хранитель памяти совещания.
+Границы ответственности: сжимать реплики и резюме фаз стартового Waterfall-совещания в скользящее резюме.
+Сохраняй все решения, требования, ограничения, ответственных, числа и открытые вопросы; убирай повторы.
+Не добавляй ничего, чего нет во входных данных.
+Используй русский язык во всех текстовых полях.
+Отвечай в JSON (ключи оставь на английском):
+{"role":"summarizer","phase":"...","summary":"...","decisions":["..."],"open_questions":["..."]}
+""".strip()
+
+
 FACILITATOR_PROMPT = _build_en_facilitator_prompt()
 ROLE_PROMPTS = _build_en_role_prompts()
 
@@ -240,6 +264,12 @@ def get_facilitator_prompt(language: str) -> str:
     return _build_en_facilitator_prompt()
 
 
+def get_summarizer_prompt(language: str) -> str:
+    if language == "ru":
+        return _build_ru_summarizer_prompt()
+    return _build_en_summarizer_prompt()
+
+
 def get_role_prompt(role: str, language: str) -> str:
         if role == "document_formatter":
                 role = "document_monitor"
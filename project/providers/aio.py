@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+def _cancel_pending(loop: asyncio.AbstractEventLoop) -> None:
+    pending = [task for task in asyncio.all_tasks(loop) if not task.done()]
+    for task in pending:
+        task.cancel()
+    if pending:
+        loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+
+
+def run_coroutine(awaitable: Awaitable[T]) -> T:
+    # Unlike asyncio.run(), closing the loop does not wait for executor threads, so a
+    # cancelled provider call returns control immediately instead of after its timeout.
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(awaitable)
+    except BaseException:
+        _cancel_pending(loop)
+        raise
+    finally:
+        try:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
+
+
+async def await_interruptible(
+    awaitable: Awaitable[T],
+    interrupted: Callable[[], bool],
+    poll_seconds: float = 0.05,
+) -> tuple[bool, T | None]:
+    task = asyncio.ensure_future(awaitable)
+    while not task.done():
+        if interrupted():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            return True, None
+        await asyncio.wait({task}, timeout=poll_seconds)
+    return False, task.result()
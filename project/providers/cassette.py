@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import difflib
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from providers.response_cache import normalize_messages
+
+CASSETTE_OFF = "off"
+CASSETTE_RECORD = "record"
+CASSETTE_REPLAY = "replay"
+CASSETTE_MODES = (CASSETTE_OFF, CASSETTE_RECORD, CASSETTE_REPLAY)
+CASSETTE_VERSION = 1
+
+KIND_LLM = "llm"
+KIND_PROMPT_TEXT = "prompt_text"
+KIND_PROMPT_YES_NO = "prompt_yes_no"
+
+
+class CassetteMismatchError(RuntimeError):
+    pass
+
+
+class CassetteExhaustedError(RuntimeError):
+    pass
+
+
+@dataclass
+class CassetteMismatch:
+    index: int
+    kind: str
+    key: str
+    diff: str
+
+
+def _render_request(system_prompt: str, messages: list[dict[str, Any]]) -> list[str]:
+    lines = ["[system]", *system_prompt.strip().splitlines()]
+    for message in normalize_messages(messages):
+        lines.append(f"[{message['role']}]")
+        lines.extend(message["content"].splitlines() or [""])
+    return lines
+
+
+def request_fingerprint(system_prompt: str, messages: list[dict[str, Any]]) -> str:
+    material = {"system_prompt": system_prompt.strip(), "messages": normalize_messages(messages)}
+    encoded = json.dumps(material, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class Cassette:
+    def __init__(self, path: Path, mode: str, strict: bool = False, metadata: dict[str, Any] | None = None) -> None:
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"Unknown cassette mode '{mode}'. Use one of: {', '.join(CASSETTE_MODES)}")
+        self.path = path
+        self.mode = mode
+        self.strict = strict
+        self.metadata = metadata or {}
+        self.mismatches: list[CassetteMismatch] = []
+        self.served = 0
+        self.recorded = 0
+        self._lock = threading.Lock()
+        self._llm_by_role: dict[str, list[dict[str, Any]]] = {}
+        self._answers: list[dict[str, Any]] = []
+        self._answer_cursor = 0
+        self._header_written = False
+        if mode == CASSETTE_REPLAY:
+            self._load()
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == CASSETTE_RECORD
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == CASSETTE_REPLAY
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            raise FileNotFoundError(f"Cassette not found: {self.path}")
+        with self.path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+                row = json.loads(line)
+                kind = row.get("kind")
+                if kind == "header":
+                    self.metadata = dict(row.get("metadata", {}))
+                elif kind == KIND_LLM:
+                    row["consumed"] = False
+                    self._llm_by_role.setdefault(str(row.get("role", "")), []).append(row)
+                elif kind in {KIND_PROMPT_TEXT, KIND_PROMPT_YES_NO}:
+                    self._answers.append(row)
+
+    def _append(self, row: dict[str, Any]) -> None:
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as handle:
+                if not self._header_written:
+                    header = {
+                        "kind": "header",
+                        "version": CASSETTE_VERSION,
+                        "created_utc": datetime.utcnow().isoformat(),
+                        "metadata": self.metadata,
+                    }
+                    handle.write(json.dumps(header, ensure_ascii=False) + "\n")
+                    self._header_written = True
+                handle.write(json.dumps(row, ensure_ascii=False) + "\n")
+            self.recorded += 1
+
+    def record_llm(
+        self,
+        role: str,
+        system_prompt: str,
+        messages: list[dict[str, Any]],
+        response: str,
+        provider: str,
+        model: str,
+        latency_seconds: float,
+    ) -> None:
+        self._append(
+            {
+                "kind": KIND_LLM,
+                "role": role,
+                "fingerprint": request_fingerprint(system_prompt, messages),
+                "system_prompt": system_prompt,
+                "messages": normalize_messages(messages),
+                "response": response,
+                "provider": provider,
+                "model": model,
+                "latency_seconds": round(latency_seconds, 4),
+            }
+        )
+
+    def _report(self, kind: str, key: str, expected: list[str], actual: list[str]) -> None:
+        diff = "\n".join(
+            difflib.unified_diff(expected, actual, fromfile="recorded", tofile="current", lineterm="")
+        )
+        mismatch = CassetteMismatch(index=self.served, kind=kind, key=key, diff=diff)
+        if self.strict:
+            raise CassetteMismatchError(f"Cassette mismatch for {kind} '{key}' (request #{self.served}):\n{diff}")
+        self.mismatches.append(mismatch)
+
+    def replay_llm(self, role: str, system_prompt: str, messages: list[dict[str, Any]]) -> dict[str, Any]:
+        with self._lock:
+            self.served += 1
+            pending = [row for row in self._llm_by_role.get(role, []) if not row["consumed"]]
+            if not pending:
+                raise CassetteExhaustedError(
+                    f"Cassette {self.path.name} has no more recorded replies for role '{role}'."
+                )
+            fingerprint = request_fingerprint(system_prompt, messages)
+            row = next((item for item in pending if item.get("fingerprint") == fingerprint), None)
+            if row is None:
+                row = pending[0]
+                self._report(
+                    KIND_LLM,
+                    role,
+                    _render_request(str(row.get("system_prompt", "")), list(row.get("messages", []))),
+                    _render_request(system_prompt, messages),
+                )
+            row["consumed"] = True
+            return row
+
+    def record_answer(self, kind: str, prompt: str, answer: Any) -> None:
+        self._append({"kind": kind, "prompt": prompt, "answer": answer})
+
+    def replay_answer(self, kind: str, prompt: str) -> Any:
+        with self._lock:
+            self.served += 1
+            while self._answer_cursor < len(self._answers):
+                row = self._answers[self._answer_cursor]
+                self._answer_cursor += 1
+                if row.get("kind") != kind:
+                    self._report(kind, prompt, [f"{row.get('kind')}: {row.get('prompt', '')}"], [f"{kind}: {prompt}"])
+                    continue
+                if str(row.get("prompt", "")) != prompt:
+                    self._report(kind, prompt, [str(row.get("prompt", ""))], [prompt])
+                return row.get("answer")
+            raise CassetteExhaustedError(f"Cassette {self.path.name} has no more recorded answers for: {prompt}")
+
+    def unused_llm_replies(self) -> int:
+        return sum(1 for rows in self._llm_by_role.values() for row in rows if not row["consumed"])
+
+    def write_mismatch_report(self) -> Path | None:
+        if not self.mismatches:
+            return None
+        report_path = self.path.with_suffix(".mismatches.diff")
+        with report_path.open("w", encoding="utf-8") as handle:
+            for mismatch in self.mismatches:
+                handle.write(f"### #{mismatch.index} {mismatch.kind} {mismatch.key}\n{mismatch.diff}\n\n")
+        return report_path
+
+    def summary(self) -> str:
+        if self.recording:
+            return f"recorded {self.recorded} interactions to {self.path}"
+        return (
+            f"replayed {self.served} interactions from {self.path.name}, "
+            f"mismatches={len(self.mismatches)}, unused_llm_replies={self.unused_llm_replies()}"
+        )
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import atexit
+import importlib.util
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+@dataclass(frozen=True)
+class HTTPPoolSettings:
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry_seconds: float = 30.0
+    http2: bool = True
+
+
+_CLIENTS: dict[str, Any] = {}
+_LOCK = threading.Lock()
+
+
+def http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def _normalize_base_url(base_url: str) -> str:
+    return base_url.strip().rstrip("/").lower()
+
+
+if httpx is not None:
+
+    class SharedHTTPClient(httpx.Client):
+        # AutoGen deep-copies llm_config per agent; every copy must keep using this pool.
+        def __deepcopy__(self, memo: dict[int, Any]) -> "SharedHTTPClient":
+            return self
+
+
+def _build_client(pool: HTTPPoolSettings) -> Any:
+    limits = httpx.Limits(
+        max_connections=pool.max_connections,
+        max_keepalive_connections=pool.max_keepalive_connections,
+        keepalive_expiry=pool.keepalive_expiry_seconds,
+    )
+    return SharedHTTPClient(limits=limits, http2=pool.http2 and http2_available())
+
+
+def get_http_client(base_url: str, pool: HTTPPoolSettings) -> Any | None:
+    if httpx is None or not base_url:
+        return None
+    key = _normalize_base_url(base_url)
+    with _LOCK:
+        client = _CLIENTS.get(key)
+        if client is None or client.is_closed:
+            client = _build_client(pool)
+            _CLIENTS[key] = client
+        return client
+
+
+def close_http_clients() -> None:
+    with _LOCK:
+        clients = list(_CLIENTS.values())
+        _CLIENTS.clear()
+    for client in clients:
+        try:
+            client.close()
+        except Exception:
+            pass
+
+
+atexit.register(close_http_clients)
@@ -1,9 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import random
+import threading
 import time
+from typing import Any, Callable, Iterator
 
-from providers.llm_provider import AgentModelConfig
+from providers.aio import run_coroutine
+from providers.llm_provider import AgentModelConfig, HedgingPolicy
+from providers.mock_llm import MockModelClient
+from providers.provider_health import CIRCUIT_CLOSED, ProviderHealthRegistry, get_provider_health_registry
+from providers.rate_limiter import ProviderRateLimiter, get_rate_limiter, retry_after_seconds
+from providers.response_cache import ResponseCache
+from providers.tokens import estimate_messages_tokens, estimate_tokens
+from providers.usage import CallUsage
 
 try:
     from autogen import AssistantAgent
@@ -13,6 +24,18 @@ except ImportError as exc:
     ) from exc
 
 
+ADAPTER_ONLY_CONFIG_KEYS = frozenset({"provider_name"})
+
+ChunkCallback = Callable[[str], None]
+
+
+class ProviderHTTPError(Exception):
+    def __init__(self, status_code: int, body: str, response: Any = None) -> None:
+        super().__init__(f"Error code: {status_code} - {body}")
+        self.status_code = status_code
+        self.response = response
+
+
 class AutoGenAdapter:
     def __init__(self, name: str, system_prompt: str, model_cfg: AgentModelConfig) -> None:
         self._name = name
@@ -20,25 +43,122 @@ class AutoGenAdapter:
         self._temperature = model_cfg.temperature
         self._timeout = model_cfg.timeout
         self._provider_configs = model_cfg.config_list
+        self._standard_configs = model_cfg.config_list
+        self._economy_configs = model_cfg.economy_config_list or model_cfg.config_list
+        self.economy_mode = False
+        self.last_usage: CallUsage | None = None
+        self.last_streamed = False
+        self.last_hedge_losses: list[CallUsage] = []
         self._retry_attempts = model_cfg.retry_attempts
         self._retry_backoff_seconds = model_cfg.retry_backoff_seconds
+        self._retry_backoff_max_seconds = model_cfg.retry_backoff_max_seconds
+        self._response_cache = model_cfg.response_cache
+        self._cassette = model_cfg.cassette
+        self._health: ProviderHealthRegistry = get_provider_health_registry()
+        self._rate_limiter: ProviderRateLimiter = get_rate_limiter()
+        self._hedging = model_cfg.hedging or HedgingPolicy()
+        self._streaming = model_cfg.streaming
+        self.hedges_fired = 0
+        self.hedges_won = 0
         self._active_provider_index = 0
-        self._agent = self._build_agent(self._active_provider_index)
+        self._agents: dict[int, AssistantAgent] = {}
+        self._dialog: list[dict[str, str]] = []
+        self._dialog_tokens = 0
+        self._dialog_provider = ""
+        self.dialog_epoch = 0
+
+    @staticmethod
+    def _autogen_config(config: dict[str, Any]) -> dict[str, Any]:
+        return {key: value for key, value in config.items() if key not in ADAPTER_ONLY_CONFIG_KEYS}
 
     def _build_agent(self, provider_index: int) -> AssistantAgent:
-        config = self._provider_configs[provider_index]
-        return AssistantAgent(
+        config = self._autogen_config(self._provider_configs[provider_index])
+        agent = AssistantAgent(
             name=self._name,
             system_message=self._system_prompt,
             llm_config={
                 "config_list": [config],
                 "temperature": self._temperature,
                 "timeout": self._timeout,
+                "cache_seed": None,
             },
         )
+        if config.get("model_client_cls") == MockModelClient.__name__:
+            agent.register_model_client(model_client_cls=MockModelClient)
+        return agent
+
+    def _agent_for(self, provider_index: int) -> AssistantAgent:
+        agent = self._agents.get(provider_index)
+        if agent is None:
+            agent = self._build_agent(provider_index)
+            self._agents[provider_index] = agent
+        return agent
+
+    @property
+    def active_model(self) -> str:
+        if not self._provider_configs:
+            return ""
+        index = min(self._active_provider_index, len(self._provider_configs) - 1)
+        return str(self._provider_configs[index].get("model", ""))
+
+    @property
+    def dialog_tokens(self) -> int:
+        return self._dialog_tokens
+
+    def reset_dialog(self) -> None:
+        self._dialog = []
+        self._dialog_tokens = 0
+        self._dialog_provider = ""
+        self.dialog_epoch += 1
 
     def start_new_dialog(self) -> None:
-        self._agent = self._build_agent(self._active_provider_index)
+        for agent in self._agents.values():
+            agent.clear_history()
+        self.reset_dialog()
+
+    def set_economy_mode(self, enabled: bool) -> None:
+        if enabled == self.economy_mode:
+            return
+        self.economy_mode = enabled
+        self._provider_configs = self._economy_configs if enabled else self._standard_configs
+        self._agents.clear()
+        self._active_provider_index = 0
+        self.reset_dialog()
+
+    def _record(self, messages: list[dict[str, str]], text: str) -> None:
+        if self._cassette is None or not self._cassette.recording or self.last_usage is None:
+            return
+        self._cassette.record_llm(
+            self._name,
+            self._system_prompt,
+            messages,
+            text,
+            provider=self.last_usage.provider,
+            model=self.last_usage.model,
+            latency_seconds=self.last_usage.latency_seconds,
+        )
+
+    def _prompt_tokens(self, messages: list[dict[str, str]]) -> int:
+        return estimate_tokens(self._system_prompt) + estimate_messages_tokens(messages)
+
+    def _usage(
+        self,
+        provider_index: int,
+        messages: list[dict[str, str]],
+        text: str,
+        started: float,
+        retries: int,
+        cached: bool = False,
+    ) -> CallUsage:
+        return CallUsage(
+            provider=self._provider_name(provider_index),
+            model=str(self._provider_configs[provider_index].get("model", "")),
+            prompt_tokens=self._prompt_tokens(messages),
+            completion_tokens=estimate_tokens(text),
+            latency_seconds=time.monotonic() - started,
+            retries=retries,
+            cached=cached,
+        )
 
     @staticmethod
     def _is_retryable_error(exc: Exception) -> bool:
@@ -58,6 +178,11 @@ class AutoGenAdapter:
         )
         return any(marker in text for marker in markers)
 
+    @staticmethod
+    def _is_rate_limit_error(exc: Exception) -> bool:
+        text = str(exc).lower()
+        return "429" in text or "rate limit" in text or "too many requests" in text
+
     @staticmethod
     def _is_quota_error(exc: Exception) -> bool:
         text = str(exc).lower()
@@ -71,31 +196,282 @@ class AutoGenAdapter:
         )
         return any(marker in text for marker in markers)
 
-    def reply(self, messages: list[dict[str, str]]) -> str:
+    def _cache_key(self, provider_index: int, messages: list[dict[str, str]]) -> str:
+        config = self._provider_configs[provider_index]
+        return ResponseCache.build_key(
+            model=config.get("model", ""),
+            provider_name=self._provider_name(provider_index),
+            system_prompt=self._system_prompt,
+            temperature=self._temperature,
+            messages=messages,
+        )
+
+    def reply(self, messages: list[dict[str, str]], on_chunk: ChunkCallback | None = None) -> str:
+        return run_coroutine(self.areply(messages, on_chunk=on_chunk))
+
+    def _provider_name(self, provider_index: int) -> str:
+        return self._provider_configs[provider_index].get("provider_name", f"provider_{provider_index}")
+
+    def _provider_order(self) -> Iterator[int]:
+        names = [self._provider_name(index) for index in range(len(self._provider_configs))]
+        index_by_name = {name: index for index, name in enumerate(names)}
+        ordered = [index_by_name[name] for name in self._health.order(names)]
+        attempted = False
+        for index in ordered:
+            if self._health.allow_request(names[index]):
+                attempted = True
+                yield index
+        if not attempted and ordered:
+            # Every circuit is open: probe the healthiest candidate rather than fail without trying.
+            yield ordered[0]
+
+    def _hedge_backup(self, provider_index: int) -> int | None:
+        names = [self._provider_name(index) for index in range(len(self._provider_configs))]
+        for name in self._health.order(names):
+            index = names.index(name)
+            if index != provider_index and self._health.state(name) == CIRCUIT_CLOSED:
+                return index
+        return None
+
+    def _hedge_delay(self, provider_index: int) -> float | None:
+        if not self._hedging.enabled:
+            return None
+        return self._health.latency_percentile(
+            self._provider_name(provider_index),
+            self._hedging.percentile,
+            self._hedging.min_samples,
+        )
+
+    def _backoff_delay(self, attempt: int) -> float:
+        ceiling = min(self._retry_backoff_max_seconds, self._retry_backoff_seconds * (2 ** (attempt - 1)))
+        return ceiling / 2 + random.uniform(0, ceiling / 2)
+
+    def _can_stream(self, provider_index: int) -> bool:
+        config = self._provider_configs[provider_index]
+        # Only the pool built from the configured settings is used; streaming never opens one with defaults.
+        return not config.get("model_client_cls") and config.get("http_client") is not None
+
+    def _stream_completion(
+        self,
+        provider_index: int,
+        messages: list[dict[str, str]],
+        on_chunk: ChunkCallback,
+        stop: threading.Event,
+    ) -> str:
+        config = self._provider_configs[provider_index]
+        base_url = str(config.get("base_url", "")).rstrip("/")
+        client = config["http_client"]
+        payload = {
+            "model": config.get("model", ""),
+            "messages": [{"role": "system", "content": self._system_prompt}, *messages],
+            "temperature": self._temperature,
+            "stream": True,
+        }
+        headers = {"Authorization": f"Bearer {config.get('api_key', '')}"}
+        parts: list[str] = []
+        with client.stream(
+            "POST", f"{base_url}/chat/completions", json=payload, headers=headers, timeout=self._timeout
+        ) as response:
+            if response.status_code >= 400:
+                body = response.read().decode("utf-8", errors="replace")
+                raise ProviderHTTPError(response.status_code, body[:500], response)
+            for line in response.iter_lines():
+                if stop.is_set():
+                    break
+                if not line.startswith("data:"):
+                    continue
+                data = line[len("data:") :].strip()
+                if data == "[DONE]":
+                    break
+                try:
+                    event = json.loads(data)
+                except json.JSONDecodeError:
+                    continue
+                if event.get("error"):
+                    raise ProviderHTTPError(response.status_code, json.dumps(event["error"], ensure_ascii=False))
+                for choice in event.get("choices") or []:
+                    delta = (choice.get("delta") or {}).get("content")
+                    if delta:
+                        parts.append(delta)
+                        on_chunk(delta)
+        return "".join(parts)
+
+    async def _stream_provider(
+        self,
+        provider_index: int,
+        messages: list[dict[str, str]],
+        on_chunk: ChunkCallback,
+    ) -> str:
+        stop = threading.Event()
+        try:
+            return await asyncio.to_thread(self._stream_completion, provider_index, messages, on_chunk, stop)
+        except asyncio.CancelledError:
+            stop.set()
+            raise
+
+    async def _call_provider(
+        self,
+        provider_index: int,
+        messages: list[dict[str, str]],
+        on_chunk: ChunkCallback | None = None,
+    ) -> Any:
+        provider_name = self._provider_name(provider_index)
+        agent = self._agent_for(provider_index)
+        try:
+            await self._rate_limiter.acquire(provider_name, self._prompt_tokens(messages))
+            started = time.monotonic()
+            if on_chunk is not None and self._can_stream(provider_index):
+                response = await self._stream_provider(provider_index, messages, on_chunk)
+            else:
+                response = await agent.a_generate_reply(messages=messages)
+        except asyncio.CancelledError:
+            self._health.release_probe(provider_name)
+            raise
+        except Exception as exc:
+            self._health.record_failure(provider_name, trip=self._is_quota_error(exc))
+            if self._is_rate_limit_error(exc):
+                self._rate_limiter.block(provider_name, retry_after_seconds(exc) or self._backoff_delay(1))
+            raise
+        self._health.record_success(provider_name, time.monotonic() - started)
+        if isinstance(response, str):
+            self._rate_limiter.consume(provider_name, estimate_tokens(response))
+        return response
+
+    async def _call_hedged(
+        self,
+        provider_index: int,
+        messages: list[dict[str, str]],
+        on_chunk: ChunkCallback | None = None,
+    ) -> tuple[int, Any]:
+        if on_chunk is not None:
+            return provider_index, await self._call_provider(provider_index, messages, on_chunk)
+
+        delay = self._hedge_delay(provider_index)
+        backup_index = self._hedge_backup(provider_index) if delay is not None else None
+        if delay is None or backup_index is None:
+            return provider_index, await self._call_provider(provider_index, messages)
+
+        started = time.monotonic()
+        primary = asyncio.ensure_future(self._call_provider(provider_index, messages))
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done:
+            return provider_index, primary.result()
+
+        self.hedges_fired += 1
+        backup = asyncio.ensure_future(self._call_provider(backup_index, messages))
+        task_index = {primary: provider_index, backup: backup_index}
+        pending: set[asyncio.Future[Any]] = {primary, backup}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is backup:
+                            self.hedges_won += 1
+                        return task_index[task], task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+                # The provider already received the cancelled request, so its prompt is billed all the same.
+                self.last_hedge_losses.append(self._usage(task_index[task], messages, "", started, 0))
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        raise primary.exception()
+
+    async def areply(
+        self,
+        messages: list[dict[str, str]],
+        on_chunk: ChunkCallback | None = None,
+        keep_history: bool = False,
+    ) -> str:
+        if not keep_history:
+            return await self._areply(messages, on_chunk)
+
+        request = [*self._dialog, *messages]
+        text = await self._areply(request, on_chunk)
+        reply = {"role": "assistant", "content": text}
+        self._dialog = [*request, reply]
+        self._dialog_tokens += estimate_messages_tokens([*messages, reply])
+        served_provider = self.last_usage.provider if self.last_usage is not None else ""
+        if self._dialog_provider and served_provider != self._dialog_provider:
+            # A failover answered from another provider; the next turn starts over from the full window.
+            self.reset_dialog()
+        else:
+            self._dialog_provider = served_provider
+        return text
+
+    async def _areply(self, messages: list[dict[str, str]], on_chunk: ChunkCallback | None = None) -> str:
         failures: list[str] = []
-        provider_count = len(self._provider_configs)
+        streamed: list[str] = []
+        started = time.monotonic()
+        self.last_usage = None
+        self.last_streamed = False
+        self.last_hedge_losses = []
+
+        def forward_chunk(chunk: str) -> None:
+            streamed.append(chunk)
+            on_chunk(chunk)
 
-        for provider_offset in range(provider_count):
-            provider_index = (self._active_provider_index + provider_offset) % provider_count
-            provider_name = self._provider_configs[provider_index].get("provider_name", f"provider_{provider_index}")
-            self._agent = self._build_agent(provider_index)
+        stream_callback = forward_chunk if on_chunk is not None and self._streaming else None
+
+        if self._cassette is not None and self._cassette.replaying:
+            recorded = self._cassette.replay_llm(self._name, self._system_prompt, messages)
+            text = str(recorded.get("response", ""))
+            self.last_usage = CallUsage(
+                provider=str(recorded.get("provider", "")),
+                model=str(recorded.get("model", "")),
+                prompt_tokens=self._prompt_tokens(messages),
+                completion_tokens=estimate_tokens(text),
+                latency_seconds=time.monotonic() - started,
+                cached=True,
+            )
+            return text
+
+        for provider_index in self._provider_order():
+            provider_name = self._provider_name(provider_index)
+
+            if self._response_cache is not None:
+                cached = self._response_cache.get(self._cache_key(provider_index, messages))
+                if cached is not None:
+                    self._health.release_probe(provider_name)
+                    self._active_provider_index = provider_index
+                    self.last_usage = self._usage(
+                        provider_index, messages, cached, started, len(failures), cached=True
+                    )
+                    self._record(messages, cached)
+                    return cached
 
             for attempt in range(1, self._retry_attempts + 1):
                 try:
-                    response = self._agent.generate_reply(messages=messages)
-                    self._active_provider_index = provider_index
-                    return response if isinstance(response, str) else json.dumps(response, ensure_ascii=False)
+                    served_index, response = await self._call_hedged(provider_index, messages, stream_callback)
                 except Exception as exc:
                     failures.append(f"{provider_name} attempt {attempt}: {exc}")
+                    if streamed:
+                        streamed.clear()
+                        on_chunk(f"\n[{provider_name} stream failed; retrying]\n")
                     if self._is_quota_error(exc):
                         break
 
                     retryable = self._is_retryable_error(exc)
-                    if retryable and attempt < self._retry_attempts:
-                        delay = self._retry_backoff_seconds * attempt
-                        time.sleep(delay)
+                    if retryable and attempt < self._retry_attempts and self._health.allow_request(provider_name):
+                        await asyncio.sleep(self._backoff_delay(attempt))
                         continue
                     break
 
+                self._active_provider_index = served_index
+                text = response if isinstance(response, str) else json.dumps(response, ensure_ascii=False)
+                if self._response_cache is not None and response is not None and text.strip():
+                    metadata = {
+                        "role": self._name,
+                        "provider": self._provider_name(served_index),
+                        "model": self._provider_configs[served_index].get("model", ""),
+                    }
+                    self._response_cache.put(self._cache_key(served_index, messages), text, metadata)
+                self.last_usage = self._usage(served_index, messages, text, started, len(failures))
+                # Replayed and cached replies are never streamed; a streamed reply was already shown chunk by chunk.
+                self.last_streamed = bool(streamed)
+                self._record(messages, text)
+                return text
+
         error_summary = " | ".join(failures[-6:]) if failures else "No provider attempts recorded"
         raise TimeoutError(f"All providers failed to generate a reply. {error_summary}")
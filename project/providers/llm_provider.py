@@ -2,76 +2,204 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
 
 from config.settings import RuntimeSettings
+from providers.cassette import CASSETTE_OFF, CASSETTE_REPLAY, Cassette
+from providers.http_pool import HTTPPoolSettings, get_http_client
+from providers.mock_llm import MOCK_VENDOR, MockModelClient
+from providers.provider_health import HealthPolicy, get_provider_health_registry
+from providers.rate_limiter import RateLimit, get_rate_limiter
+from providers.response_cache import ResponseCache
+from providers.usage import ModelPrice
+
+
+@dataclass(frozen=True)
+class HedgingPolicy:
+    enabled: bool = False
+    percentile: float = 0.9
+    min_samples: int = 8
 
 
 @dataclass(frozen=True)
 class AgentModelConfig:
     role: str
     model: str
-    config_list: list[dict[str, str]]
+    config_list: list[dict[str, Any]]
     temperature: float
     timeout: int
     retry_attempts: int
     retry_backoff_seconds: float
+    retry_backoff_max_seconds: float = 30.0
+    response_cache: ResponseCache | None = None
+    hedging: HedgingPolicy | None = None
+    streaming: bool = False
+    economy_config_list: list[dict[str, Any]] | None = None
+    cassette: Cassette | None = None
+
+
+def build_response_cache(settings: RuntimeSettings) -> ResponseCache | None:
+    if not settings.response_cache_enabled:
+        return None
+    return ResponseCache(
+        cache_dir=settings.output_dir / "llm_cache",
+        max_memory_entries=settings.response_cache_memory_entries,
+        max_disk_entries=settings.response_cache_disk_entries,
+        ttl_seconds=settings.response_cache_ttl_seconds,
+    )
+
+
+def build_cassette(settings: RuntimeSettings) -> Cassette | None:
+    if settings.cassette_mode == CASSETTE_OFF:
+        return None
+    cassette_dir = settings.output_dir / "cassettes"
+    path = settings.cassette_path
+    if path is None and settings.cassette_mode == CASSETTE_REPLAY:
+        recorded = sorted(cassette_dir.glob("meeting_*.jsonl"), key=lambda item: item.stat().st_mtime)
+        if not recorded:
+            raise FileNotFoundError(f"CASSETTE_MODE=replay but no cassette found in {cassette_dir}.")
+        path = recorded[-1]
+    if path is None:
+        path = cassette_dir / f"meeting_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.jsonl"
+    metadata = {
+        "provider_chain": list(settings.provider_chain),
+        "meeting_language": settings.meeting_language,
+        "temperature": settings.temperature,
+    }
+    return Cassette(path, settings.cassette_mode, strict=settings.cassette_strict, metadata=metadata)
+
+
+def build_http_pool_settings(settings: RuntimeSettings) -> HTTPPoolSettings:
+    return HTTPPoolSettings(
+        max_connections=settings.http_pool_max_connections,
+        max_keepalive_connections=settings.http_pool_max_keepalive,
+        keepalive_expiry_seconds=settings.http_keepalive_expiry_seconds,
+        http2=settings.http2_enabled,
+    )
+
+
+def build_health_policy(settings: RuntimeSettings) -> HealthPolicy:
+    return HealthPolicy(
+        failure_threshold=settings.circuit_failure_threshold,
+        error_rate_threshold=settings.circuit_error_rate_threshold,
+        min_samples=settings.circuit_min_samples,
+        window_seconds=settings.health_window_seconds,
+        cooldown_seconds=settings.circuit_cooldown_seconds,
+    )
+
+
+def build_hedging_policy(settings: RuntimeSettings) -> HedgingPolicy:
+    return HedgingPolicy(
+        enabled=settings.hedge_enabled,
+        percentile=settings.hedge_percentile,
+        min_samples=settings.hedge_min_samples,
+    )
 
 
 class LLMProvider(ABC):
-    def __init__(self, settings: RuntimeSettings) -> None:
+    def __init__(
+        self,
+        settings: RuntimeSettings,
+        response_cache: ResponseCache | None = None,
+        cassette: Cassette | None = None,
+    ) -> None:
         self.settings = settings
+        self.response_cache = response_cache if response_cache is not None else build_response_cache(settings)
+        self.cassette = cassette if cassette is not None else build_cassette(settings)
+        self.http_pool = build_http_pool_settings(settings)
+        self.health = get_provider_health_registry()
+        self.health.configure(build_health_policy(settings))
+        self.hedging = build_hedging_policy(settings)
+        self.rate_limiter = get_rate_limiter()
+        for provider_name in settings.provider_chain:
+            provider_settings = settings.providers[provider_name]
+            self.rate_limiter.configure(
+                provider_name,
+                RateLimit(
+                    requests_per_minute=provider_settings.requests_per_minute,
+                    tokens_per_minute=provider_settings.tokens_per_minute,
+                ),
+            )
 
     @abstractmethod
     def build_agent_model_config(self, role: str) -> AgentModelConfig:
         raise NotImplementedError
 
+    def model_price(self, provider_name: str, model: str) -> ModelPrice:
+        provider_settings = self.settings.providers.get(provider_name)
+        if provider_settings is None or model not in provider_settings.pricing:
+            return ModelPrice()
+        input_price, output_price = provider_settings.pricing[model]
+        return ModelPrice(input_per_million=input_price, output_per_million=output_price)
+
+    def estimate_cost(self, provider_name: str, model: str, prompt_tokens: int, completion_tokens: int) -> float:
+        return self.model_price(provider_name, model).cost(prompt_tokens, completion_tokens)
+
 
 class CloudProvider(LLMProvider):
-    def build_agent_model_config(self, role: str) -> AgentModelConfig:
-        config_list: list[dict[str, str]] = []
-        first_model = ""
+    def _config_list(self, role: str, economy: bool = False) -> list[dict[str, Any]]:
+        config_list: list[dict[str, Any]] = []
         for provider_name in self.settings.provider_chain:
             provider_settings = self.settings.providers[provider_name]
             model_name = provider_settings.model_map.get(role)
             if not model_name:
                 continue
+            if economy and provider_settings.economy_model:
+                model_name = provider_settings.economy_model
 
             api_key = provider_settings.api_key
-            if provider_settings.vendor == "ollama" and not api_key:
-                api_key = "ollama"
-            if provider_settings.vendor != "ollama" and not api_key:
+            if provider_settings.vendor in {"ollama", MOCK_VENDOR} and not api_key:
+                api_key = provider_settings.vendor
+            if provider_settings.vendor not in {"ollama", MOCK_VENDOR} and not api_key:
                 continue
 
-            if not first_model:
-                first_model = model_name
-
-            config_list.append(
-                {
-                    "model": model_name,
-                    "api_key": api_key,
-                    "base_url": provider_settings.base_url,
-                    "provider_name": provider_name,
-                }
-            )
+            config = {
+                "model": model_name,
+                "api_key": api_key,
+                "base_url": provider_settings.base_url,
+                "provider_name": provider_name,
+            }
+            if provider_settings.vendor == MOCK_VENDOR:
+                config["model_client_cls"] = MockModelClient.__name__
+                config["mock_options"] = provider_settings.options
+                config_list.append(config)
+                continue
+            http_client = get_http_client(provider_settings.base_url, self.http_pool)
+            if http_client is not None:
+                config["http_client"] = http_client
+            config_list.append(config)
+        return config_list
 
-        if not config_list:
+    def build_agent_model_config(self, role: str) -> AgentModelConfig:
+        config_list = self._config_list(role)
+        replaying = self.cassette is not None and self.cassette.replaying
+        if not config_list and not replaying:
             providers = ", ".join(self.settings.provider_chain)
             raise ValueError(f"No model configured for role '{role}' across providers: {providers}.")
 
         return AgentModelConfig(
             role=role,
-            model=first_model,
+            model=config_list[0]["model"] if config_list else "",
             config_list=config_list,
             temperature=self.settings.temperature,
             timeout=self.settings.timeout_seconds,
             retry_attempts=self.settings.retry_attempts,
             retry_backoff_seconds=self.settings.retry_backoff_seconds,
+            retry_backoff_max_seconds=self.settings.retry_backoff_max_seconds,
+            response_cache=self.response_cache,
+            hedging=self.hedging,
+            streaming=self.settings.streaming_enabled,
+            economy_config_list=self._config_list(role, economy=True),
+            cassette=self.cassette,
         )
 
 
 class OllamaProvider(LLMProvider):
     def build_agent_model_config(self, role: str) -> AgentModelConfig:
-        return CloudProvider(self.settings).build_agent_model_config(role)
+        return CloudProvider(
+            self.settings, response_cache=self.response_cache, cassette=self.cassette
+        ).build_agent_model_config(role)
 
 
 def provider_factory(settings: RuntimeSettings) -> LLMProvider:
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import json
+import math
+import random
+import re
+import time
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any
+
+from prompts.phase_prompts import WATERFALL_PHASES
+from providers.tokens import estimate_messages_tokens, estimate_tokens
+
+MOCK_VENDOR = "mock"
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal")
+
+_SCHEMA_PATTERN = re.compile(r"\{\s*\"role\"\s*:\s*\"[^\"]+\".*?\}", re.DOTALL)
+_TURN_COUNT_PATTERN = re.compile(r"Current phase turn count:\s*(\d+)")
+_ALLOWED_PATTERN = re.compile(r"Allowed speakers for this phase:\s*([^\n]+)")
+
+
+class MockAPIError(Exception):
+    def __init__(self, status_code: int, message: str) -> None:
+        super().__init__(f"Error code: {status_code} - {message}")
+        self.status_code = status_code
+
+
+@dataclass(frozen=True)
+class MockBehavior:
+    seed: int = 0
+    latency_distribution: str = "fixed"
+    latency_mean_seconds: float = 0.0
+    latency_stddev_seconds: float = 0.0
+    latency_min_seconds: float = 0.0
+    latency_max_seconds: float = 30.0
+    timeout_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    quota_rate: float = 0.0
+    malformed_json_rate: float = 0.0
+    converge_after_turns: int = 8
+    converge_after_turns_by_phase: dict[str, int] = field(default_factory=dict)
+    items_per_field: int = 2
+
+    @classmethod
+    def from_options(cls, options: dict[str, Any] | None) -> "MockBehavior":
+        options = options or {}
+        latency = options.get("latency") or {}
+        failures = options.get("failures") or {}
+        converge = options.get("converge_after_turns", 8)
+        by_phase: dict[str, int] = {}
+        if isinstance(converge, dict):
+            by_phase = {str(phase): max(1, int(turns)) for phase, turns in converge.items() if phase != "default"}
+            converge = converge.get("default", 8)
+        distribution = str(latency.get("distribution", "fixed")).lower()
+        if distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(
+                f"Unknown mock latency distribution '{distribution}'. Use one of: {', '.join(LATENCY_DISTRIBUTIONS)}"
+            )
+        return cls(
+            seed=int(options.get("seed", 0)),
+            latency_distribution=distribution,
+            latency_mean_seconds=max(0.0, float(latency.get("mean_seconds", 0.0))),
+            latency_stddev_seconds=max(0.0, float(latency.get("stddev_seconds", 0.0))),
+            latency_min_seconds=max(0.0, float(latency.get("min_seconds", 0.0))),
+            latency_max_seconds=max(0.0, float(latency.get("max_seconds", 30.0))),
+            timeout_rate=min(1.0, max(0.0, float(failures.get("timeout_rate", 0.0)))),
+            rate_limit_rate=min(1.0, max(0.0, float(failures.get("rate_limit_rate", 0.0)))),
+            quota_rate=min(1.0, max(0.0, float(failures.get("quota_rate", 0.0)))),
+            malformed_json_rate=min(1.0, max(0.0, float(failures.get("malformed_json_rate", 0.0)))),
+            converge_after_turns=max(1, int(converge)),
+            converge_after_turns_by_phase=by_phase,
+            items_per_field=max(1, int(options.get("items_per_field", 2))),
+        )
+
+    def converge_after(self, phase: str) -> int:
+        return self.converge_after_turns_by_phase.get(phase, self.converge_after_turns)
+
+
+def sample_latency(behavior: MockBehavior, rng: random.Random) -> float:
+    mean = behavior.latency_mean_seconds
+    stddev = behavior.latency_stddev_seconds
+    if behavior.latency_distribution == "uniform":
+        value = rng.uniform(max(0.0, mean - stddev), mean + stddev)
+    elif behavior.latency_distribution == "normal":
+        value = rng.gauss(mean, stddev)
+    elif behavior.latency_distribution == "lognormal" and mean > 0:
+        sigma = math.sqrt(math.log(1 + (stddev / mean) ** 2))
+        value = rng.lognormvariate(math.log(mean) - sigma**2 / 2, sigma)
+    else:
+        value = mean
+    return min(behavior.latency_max_seconds, max(behavior.latency_min_seconds, value))
+
+
+def _message_text(messages: list[dict[str, Any]]) -> str:
+    return "\n".join(str(message.get("content", "") or "") for message in messages)
+
+
+def _detect_phase(text: str) -> str:
+    # Turn prompts open with the phase instruction; later mentions may come from quoted transcript.
+    positions = [(text.find(phase), phase) for phase in WATERFALL_PHASES if phase in text]
+    return min(positions)[1] if positions else WATERFALL_PHASES[0]
+
+
+def _role_schema(system_prompt: str) -> dict[str, Any] | None:
+    match = _SCHEMA_PATTERN.search(system_prompt)
+    if match is None:
+        return None
+    try:
+        schema = json.loads(match.group(0))
+    except json.JSONDecodeError:
+        return None
+    return schema if isinstance(schema, dict) else None
+
+
+def _is_facilitator(system_prompt: str) -> bool:
+    return "\"selected_speaker\"" in system_prompt
+
+
+class MockResponder:
+    def __init__(self, behavior: MockBehavior) -> None:
+        self.behavior = behavior
+
+    def facilitator_reply(self, prompt_text: str, calls: int) -> dict[str, Any]:
+        phase = _detect_phase(prompt_text)
+        turn_match = _TURN_COUNT_PATTERN.search(prompt_text)
+        phase_turns = int(turn_match.group(1)) if turn_match else calls
+        allowed_match = _ALLOWED_PATTERN.search(prompt_text)
+        allowed = (
+            [role.strip() for role in allowed_match.group(1).split(",") if role.strip()] if allowed_match else []
+        )
+        speakers = [role for role in allowed if role != "human_stakeholder"] or ["business_analyst"]
+        target = self.behavior.converge_after(phase)
+        converged = phase_turns >= target
+        readiness = min(100, int(100 * phase_turns / target))
+        return {
+            "selected_speaker": speakers[phase_turns % len(speakers)],
+            "instruction": f"Add your {phase} contribution (mock turn {phase_turns + 1}).",
+            "readiness_score": readiness,
+            "converged": converged,
+            "convergence_reason": "Scripted convergence reached." if converged else "More input needed.",
+            "phase_summary": f"Mock summary of {phase}." if converged else "",
+            "artifact_check": {
+                "complete": converged,
+                "missing_items": [] if converged else [f"{phase} details"],
+            },
+        }
+
+    def role_reply(self, schema: dict[str, Any], prompt_text: str, calls: int) -> dict[str, Any]:
+        phase = _detect_phase(prompt_text)
+        role = str(schema.get("role", "unknown"))
+        payload: dict[str, Any] = {}
+        for key, template in schema.items():
+            if key == "role":
+                payload[key] = role
+            elif key == "phase":
+                payload[key] = phase
+            elif isinstance(template, list):
+                payload[key] = [
+                    f"{role} {key.replace('_', ' ')} {calls}.{index} for {phase}"
+                    for index in range(1, self.behavior.items_per_field + 1)
+                ]
+            else:
+                payload[key] = f"{role} {key.replace('_', ' ')} for {phase}"
+        return payload
+
+    def reply(self, system_prompt: str, messages: list[dict[str, Any]], calls: int) -> str:
+        prompt_text = _message_text(messages[-1:]) if messages else ""
+        if _is_facilitator(system_prompt):
+            payload = self.facilitator_reply(prompt_text, calls)
+        else:
+            schema = _role_schema(system_prompt) or {"role": "unknown", "phase": "...", "notes": ["..."]}
+            payload = self.role_reply(schema, prompt_text, calls)
+        return json.dumps(payload, ensure_ascii=False)
+
+
+class MockModelClient:
+    def __init__(self, config: dict[str, Any], **kwargs: Any) -> None:
+        self._model = str(config.get("model", "mock"))
+        self._behavior = MockBehavior.from_options(config.get("mock_options"))
+        self._responder = MockResponder(self._behavior)
+        self._rng = random.Random(f"{self._behavior.seed}:{self._model}:{config.get('base_url', '')}")
+        self._calls = 0
+
+    def _inject_failure(self) -> str | None:
+        roll = self._rng.random()
+        behavior = self._behavior
+        for name, rate in (
+            ("timeout", behavior.timeout_rate),
+            ("rate_limit", behavior.rate_limit_rate),
+            ("quota", behavior.quota_rate),
+            ("malformed_json", behavior.malformed_json_rate),
+        ):
+            if roll < rate:
+                return name
+            roll -= rate
+        return None
+
+    def create(self, params: dict[str, Any]) -> Any:
+        messages = list(params.get("messages") or [])
+        system_prompt = ""
+        if messages and messages[0].get("role") == "system":
+            system_prompt = str(messages[0].get("content", "") or "")
+            messages = messages[1:]
+
+        self._calls += 1
+        latency = sample_latency(self._behavior, self._rng)
+        failure = self._inject_failure()
+        if latency > 0:
+            time.sleep(latency)
+
+        if failure == "timeout":
+            raise TimeoutError("Mock request timed out")
+        if failure == "rate_limit":
+            raise MockAPIError(429, "Rate limit reached for mock model. Please try again in 1s.")
+        if failure == "quota":
+            raise MockAPIError(402, "insufficient_quota: mock credit balance exhausted")
+
+        content = self._responder.reply(system_prompt, messages, self._calls)
+        if failure == "malformed_json":
+            content = content[: max(1, len(content) // 2)]
+
+        prompt_tokens = estimate_tokens(system_prompt) + estimate_messages_tokens(messages)
+        completion_tokens = estimate_tokens(content)
+        return SimpleNamespace(
+            model=self._model,
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content, function_call=None, tool_calls=None))],
+            usage=SimpleNamespace(
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                total_tokens=prompt_tokens + completion_tokens,
+            ),
+            cost=0.0,
+        )
+
+    def message_retrieval(self, response: Any) -> list[str]:
+        return [choice.message.content for choice in response.choices]
+
+    def cost(self, response: Any) -> float:
+        return 0.0
+
+    @staticmethod
+    def get_usage(response: Any) -> dict[str, Any]:
+        return {
+            "prompt_tokens": response.usage.prompt_tokens,
+            "completion_tokens": response.usage.completion_tokens,
+            "total_tokens": response.usage.total_tokens,
+            "cost": 0.0,
+            "model": response.model,
+        }
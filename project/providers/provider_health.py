@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class HealthPolicy:
+    failure_threshold: int = 3
+    error_rate_threshold: float = 0.5
+    min_samples: int = 4
+    window_seconds: float = 120.0
+    cooldown_seconds: float = 30.0
+    latency_alpha: float = 0.3
+    latency_samples: int = 200
+
+
+@dataclass
+class ProviderHealth:
+    name: str
+    state: str = CIRCUIT_CLOSED
+    latency_ewma: float | None = None
+    consecutive_failures: int = 0
+    opened_at: float = 0.0
+    probe_in_flight: bool = False
+    outcomes: deque[tuple[float, bool]] = field(default_factory=deque)
+    latencies: deque[float] = field(default_factory=deque)
+
+    def prune(self, now: float, window_seconds: float) -> None:
+        while self.outcomes and now - self.outcomes[0][0] > window_seconds:
+            self.outcomes.popleft()
+
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        failures = sum(1 for _, ok in self.outcomes if not ok)
+        return failures / len(self.outcomes)
+
+
+class ProviderHealthRegistry:
+    def __init__(self, policy: HealthPolicy | None = None) -> None:
+        self._policy = policy or HealthPolicy()
+        self._providers: dict[str, ProviderHealth] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def policy(self) -> HealthPolicy:
+        return self._policy
+
+    def configure(self, policy: HealthPolicy) -> None:
+        with self._lock:
+            self._policy = policy
+
+    def reset(self) -> None:
+        with self._lock:
+            self._providers.clear()
+
+    def _health(self, name: str) -> ProviderHealth:
+        health = self._providers.get(name)
+        if health is None:
+            health = ProviderHealth(name=name)
+            self._providers[name] = health
+        return health
+
+    def _refresh_state(self, health: ProviderHealth, now: float) -> None:
+        if health.state == CIRCUIT_OPEN and now - health.opened_at >= self._policy.cooldown_seconds:
+            health.state = CIRCUIT_HALF_OPEN
+            health.probe_in_flight = False
+
+    def _open(self, health: ProviderHealth, now: float) -> None:
+        health.state = CIRCUIT_OPEN
+        health.opened_at = now
+        health.probe_in_flight = False
+
+    def state(self, name: str) -> str:
+        with self._lock:
+            health = self._health(name)
+            self._refresh_state(health, time.monotonic())
+            return health.state
+
+    def allow_request(self, name: str) -> bool:
+        with self._lock:
+            health = self._health(name)
+            self._refresh_state(health, time.monotonic())
+            if health.state == CIRCUIT_CLOSED:
+                return True
+            if health.state == CIRCUIT_HALF_OPEN and not health.probe_in_flight:
+                health.probe_in_flight = True
+                return True
+            return False
+
+    def order(self, names: list[str]) -> list[str]:
+        now = time.monotonic()
+        ranked: list[tuple[int, int, str]] = []
+        with self._lock:
+            for position, name in enumerate(names):
+                health = self._health(name)
+                self._refresh_state(health, now)
+                if health.state == CIRCUIT_HALF_OPEN:
+                    # Probe a recovering provider at its configured position so it can close again.
+                    rank = 0
+                elif health.state == CIRCUIT_CLOSED:
+                    rank = 0 if health.consecutive_failures == 0 else 1
+                else:
+                    rank = 2
+                ranked.append((rank, position, name))
+        return [name for _, _, name in sorted(ranked)]
+
+    def record_success(self, name: str, latency_seconds: float) -> None:
+        now = time.monotonic()
+        with self._lock:
+            health = self._health(name)
+            health.outcomes.append((now, True))
+            health.prune(now, self._policy.window_seconds)
+            health.consecutive_failures = 0
+            health.probe_in_flight = False
+            health.state = CIRCUIT_CLOSED
+            health.latencies.append(latency_seconds)
+            while len(health.latencies) > self._policy.latency_samples:
+                health.latencies.popleft()
+            alpha = self._policy.latency_alpha
+            if health.latency_ewma is None:
+                health.latency_ewma = latency_seconds
+            else:
+                health.latency_ewma = alpha * latency_seconds + (1 - alpha) * health.latency_ewma
+
+    def record_failure(self, name: str, trip: bool = False) -> None:
+        now = time.monotonic()
+        with self._lock:
+            health = self._health(name)
+            health.outcomes.append((now, False))
+            health.prune(now, self._policy.window_seconds)
+            health.consecutive_failures += 1
+            if trip or health.state == CIRCUIT_HALF_OPEN:
+                self._open(health, now)
+                return
+            if health.consecutive_failures >= self._policy.failure_threshold:
+                self._open(health, now)
+                return
+            if (
+                len(health.outcomes) >= self._policy.min_samples
+                and health.error_rate() >= self._policy.error_rate_threshold
+            ):
+                self._open(health, now)
+
+    def latency_percentile(self, name: str, percentile: float, min_samples: int = 1) -> float | None:
+        with self._lock:
+            samples = sorted(self._health(name).latencies)
+        if not samples or len(samples) < min_samples:
+            return None
+        rank = min(len(samples) - 1, max(0, int(round(percentile * (len(samples) - 1)))))
+        return samples[rank]
+
+    def release_probe(self, name: str) -> None:
+        with self._lock:
+            self._health(name).probe_in_flight = False
+
+    def summary(self) -> str:
+        now = time.monotonic()
+        parts: list[str] = []
+        with self._lock:
+            for name, health in self._providers.items():
+                self._refresh_state(health, now)
+                latency = f"{health.latency_ewma:.1f}s" if health.latency_ewma is not None else "n/a"
+                parts.append(
+                    f"{name}={health.state} (latency~{latency}, errors={health.error_rate() * 100:.0f}%)"
+                )
+        return ", ".join(parts) if parts else "no requests recorded"
+
+
+_REGISTRY = ProviderHealthRegistry()
+
+
+def get_provider_health_registry() -> ProviderHealthRegistry:
+    return _REGISTRY
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+import re
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    requests_per_minute: float = 0.0
+    tokens_per_minute: float = 0.0
+
+
+class TokenBucket:
+    def __init__(self, per_minute: float) -> None:
+        self.capacity = float(per_minute)
+        self._refill_per_second = float(per_minute) / 60.0
+        self._level = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self._level = min(self.capacity, self._level + (now - self._updated) * self._refill_per_second)
+        self._updated = now
+
+    def reserve(self, amount: float, now: float) -> float:
+        # Reservations may drive the level negative; the caller waits until it is paid back,
+        # which keeps concurrent callers in FIFO order without a wait queue.
+        self._refill(now)
+        self._level -= min(amount, self.capacity)
+        if self._level >= 0:
+            return 0.0
+        return -self._level / self._refill_per_second
+
+    def refund(self, amount: float, now: float) -> None:
+        self._refill(now)
+        self._level = min(self.capacity, self._level + min(amount, self.capacity))
+
+
+class _ProviderLimits:
+    def __init__(self, limit: RateLimit) -> None:
+        self.limit = limit
+        self.requests = TokenBucket(limit.requests_per_minute) if limit.requests_per_minute > 0 else None
+        self.tokens = TokenBucket(limit.tokens_per_minute) if limit.tokens_per_minute > 0 else None
+        self.blocked_until = 0.0
+
+
+class ProviderRateLimiter:
+    def __init__(self) -> None:
+        self._providers: dict[str, _ProviderLimits] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, name: str, limit: RateLimit) -> None:
+        with self._lock:
+            current = self._providers.get(name)
+            if current is None or current.limit != limit:
+                self._providers[name] = _ProviderLimits(limit)
+
+    def _limits(self, name: str) -> _ProviderLimits:
+        limits = self._providers.get(name)
+        if limits is None:
+            limits = _ProviderLimits(RateLimit())
+            self._providers[name] = limits
+        return limits
+
+    def _reserve(self, name: str, tokens: int) -> float:
+        now = time.monotonic()
+        with self._lock:
+            limits = self._limits(name)
+            waits = [max(0.0, limits.blocked_until - now)]
+            if limits.requests is not None:
+                waits.append(limits.requests.reserve(1, now))
+            if limits.tokens is not None and tokens > 0:
+                waits.append(limits.tokens.reserve(tokens, now))
+            return max(waits)
+
+    def _refund(self, name: str, tokens: int) -> None:
+        now = time.monotonic()
+        with self._lock:
+            limits = self._limits(name)
+            if limits.requests is not None:
+                limits.requests.refund(1, now)
+            if limits.tokens is not None and tokens > 0:
+                limits.tokens.refund(tokens, now)
+
+    async def acquire(self, name: str, tokens: int = 0) -> float:
+        wait = self._reserve(name, tokens)
+        if wait <= 0:
+            return 0.0
+        try:
+            await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            self._refund(name, tokens)
+            raise
+        return wait
+
+    def consume(self, name: str, tokens: int) -> None:
+        if tokens <= 0:
+            return
+        now = time.monotonic()
+        with self._lock:
+            limits = self._limits(name)
+            if limits.tokens is not None:
+                limits.tokens.reserve(tokens, now)
+
+    def block(self, name: str, seconds: float) -> None:
+        if seconds <= 0:
+            return
+        with self._lock:
+            limits = self._limits(name)
+            limits.blocked_until = max(limits.blocked_until, time.monotonic() + seconds)
+
+
+_RETRY_IN_PATTERN = re.compile(r"(?:try again|retry)\s+(?:in|after)\s+(\d+(?:\.\d+)?)\s*(ms|milliseconds?|s|sec|seconds?)?", re.I)
+
+
+def retry_after_seconds(exc: BaseException) -> float | None:
+    response: Any = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if headers is not None:
+        raw_ms = headers.get("retry-after-ms")
+        if raw_ms:
+            try:
+                return max(0.0, float(raw_ms) / 1000.0)
+            except ValueError:
+                pass
+        raw = headers.get("retry-after")
+        if raw:
+            try:
+                return max(0.0, float(raw))
+            except ValueError:
+                try:
+                    return max(0.0, parsedate_to_datetime(raw).timestamp() - time.time())
+                except (TypeError, ValueError):
+                    pass
+
+    match = _RETRY_IN_PATTERN.search(str(exc))
+    if match:
+        value = float(match.group(1))
+        unit = (match.group(2) or "s").lower()
+        return value / 1000.0 if unit.startswith("m") else value
+    return None
+
+
+_LIMITER = ProviderRateLimiter()
+
+
+def get_rate_limiter() -> ProviderRateLimiter:
+    return _LIMITER
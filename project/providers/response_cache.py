@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+
+@dataclass
+class CacheStats:
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+    expired: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    def to_json(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "expired": self.expired,
+        }
+
+
+def normalize_messages(messages: list[dict[str, Any]]) -> list[dict[str, str]]:
+    normalized: list[dict[str, str]] = []
+    for message in messages:
+        content = str(message.get("content", "") or "").replace("\r\n", "\n").strip()
+        normalized.append({"role": str(message.get("role", "user")), "content": content})
+    return normalized
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        cache_dir: Path | None,
+        max_memory_entries: int = 256,
+        max_disk_entries: int = 5000,
+        ttl_seconds: float = 0.0,
+    ) -> None:
+        self._cache_dir = cache_dir
+        self._max_memory_entries = max(1, max_memory_entries)
+        self._max_disk_entries = max(0, max_disk_entries)
+        self._ttl_seconds = max(0.0, ttl_seconds)
+        self._memory: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._disk_count: int | None = None
+        self._lock = threading.Lock()
+        self.stats = CacheStats()
+        if self._cache_dir is not None:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def build_key(
+        *,
+        model: str,
+        provider_name: str,
+        system_prompt: str,
+        temperature: float,
+        messages: list[dict[str, Any]],
+    ) -> str:
+        material = {
+            "model": model,
+            "provider": provider_name,
+            "system_prompt": system_prompt.strip(),
+            "temperature": round(float(temperature), 4),
+            "messages": normalize_messages(messages),
+        }
+        encoded = json.dumps(material, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def _is_expired(self, created: float) -> bool:
+        return self._ttl_seconds > 0 and time.time() - created > self._ttl_seconds
+
+    def _disk_path(self, key: str) -> Path | None:
+        if self._cache_dir is None or self._max_disk_entries <= 0:
+            return None
+        return self._cache_dir / key[:2] / f"{key}.json"
+
+    def _remember(self, key: str, created: float, response: str) -> None:
+        self._memory[key] = (created, response)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_memory_entries:
+            self._memory.popitem(last=False)
+            self.stats.evictions += 1
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None:
+                created, response = cached
+                if not self._is_expired(created):
+                    self._memory.move_to_end(key)
+                    self.stats.memory_hits += 1
+                    return response
+                del self._memory[key]
+                self.stats.expired += 1
+
+            path = self._disk_path(key)
+            if path is not None and path.exists():
+                try:
+                    payload = json.loads(path.read_text(encoding="utf-8"))
+                    created = float(payload.get("created", 0.0))
+                    response = str(payload["response"])
+                except (OSError, ValueError, KeyError):
+                    payload = None
+                if payload is not None and not self._is_expired(created):
+                    self._remember(key, created, response)
+                    self.stats.disk_hits += 1
+                    return response
+                self._unlink(path)
+                self.stats.expired += 1
+
+            self.stats.misses += 1
+            return None
+
+    def put(self, key: str, response: str, metadata: dict[str, Any] | None = None) -> None:
+        created = time.time()
+        with self._lock:
+            self._remember(key, created, response)
+            self.stats.writes += 1
+
+            path = self._disk_path(key)
+            if path is None:
+                return
+            is_new = not path.exists()
+            record = {"created": created, "response": response, **(metadata or {})}
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = path.with_suffix(".tmp")
+                tmp_path.write_text(json.dumps(record, ensure_ascii=False), encoding="utf-8")
+                tmp_path.replace(path)
+            except OSError:
+                return
+            if is_new:
+                self._disk_count = self._count_disk_entries() if self._disk_count is None else self._disk_count + 1
+                if self._disk_count > self._max_disk_entries:
+                    self._prune_disk()
+
+    def _count_disk_entries(self) -> int:
+        if self._cache_dir is None:
+            return 0
+        return sum(1 for _ in self._cache_dir.glob("*/*.json"))
+
+    def _prune_disk(self) -> None:
+        if self._cache_dir is None:
+            return
+        entries: list[tuple[float, Path]] = []
+        for path in self._cache_dir.glob("*/*.json"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+        entries.sort()
+        target = int(self._max_disk_entries * 0.9)
+        excess = len(entries) - target
+        for _, path in entries[: max(0, excess)]:
+            self._unlink(path)
+            self.stats.evictions += 1
+        self._disk_count = len(entries) - max(0, excess)
+
+    @staticmethod
+    def _unlink(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+    def summary(self) -> str:
+        stats = self.stats
+        total = stats.hits + stats.misses
+        ratio = (stats.hits / total * 100) if total else 0.0
+        return (
+            f"hits={stats.hits} (memory={stats.memory_hits}, disk={stats.disk_hits}) "
+            f"misses={stats.misses} hit_rate={ratio:.0f}% evictions={stats.evictions}"
+        )
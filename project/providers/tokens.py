@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import math
+from typing import Any
+
+CHARS_PER_TOKEN = 4.0
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def estimate_tokens(text: str) -> int:
+    if not text:
+        return 0
+    return max(1, math.ceil(len(text) / CHARS_PER_TOKEN))
+
+
+def estimate_messages_tokens(messages: list[dict[str, Any]]) -> int:
+    return sum(
+        estimate_tokens(str(message.get("content", "") or "")) + MESSAGE_OVERHEAD_TOKENS for message in messages
+    )
+
+
+def truncate_to_tokens(text: str, max_tokens: int, marker: str = " …[truncated]") -> str:
+    if max_tokens <= 0:
+        return ""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    keep = max(0, int(max_tokens * CHARS_PER_TOKEN) - len(marker))
+    return text[:keep].rstrip() + marker
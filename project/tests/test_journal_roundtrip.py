@@ -0,0 +1,186 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from orchestration.checkpoint_catalog import load_checkpoint
+from orchestration.checkpoint_format import (
+    compression_available,
+    decode_checkpoint,
+    encode_checkpoint,
+    encoding_available,
+    pack_state,
+    unpack_state,
+)
+from orchestration.journal import MeetingJournal, journal_sidecars, read_journal_events
+from orchestration.meeting_state import MeetingState
+from orchestration.summary_memory import PhaseSummary
+from providers.usage import CallUsage
+
+PHASES = ["Requirements Gathering", "System Design", "Implementation Planning"]
+ROLES = ["business_analyst", "architect", "backend_engineer"]
+
+CODECS = [
+    pytest.param(encoding, compression, id=f"{encoding}-{compression}")
+    for encoding, compression in [
+        ("json", "none"),
+        ("json", "gzip"),
+        ("json", "zstd"),
+        ("msgpack", "none"),
+        ("msgpack", "gzip"),
+    ]
+    if encoding_available(encoding) and compression_available(compression)
+]
+
+
+def _new_state() -> MeetingState:
+    return MeetingState(
+        project_name="Journal",
+        project_description="Round-trip the meeting journal",
+        meeting_language="en",
+        phases=list(PHASES),
+        max_turns_per_phase=8,
+        global_max_turns=100,
+    )
+
+
+def _play_phase(state: MeetingState, turns: int = 4) -> None:
+    phase = state.current_phase
+    for turn in range(turns):
+        role = ROLES[turn % len(ROLES)]
+        payload = {"role": role, "phase": phase, "risks": [f"{phase} risk {turn}", "shared risk"], "notes": "x" * 60}
+        state.add_transcript(role, json.dumps(payload))
+        state.update_phase_draft(payload)
+        call = CallUsage(
+            provider="mock",
+            model="mock-large",
+            prompt_tokens=100 + turn,
+            completion_tokens=20,
+            latency_seconds=0.5,
+        )
+        state.record_usage(role, call, 0.001)
+    state.add_transcript("facilitator", "not json at all")
+    state.add_transcript("human_stakeholder", "Keep it simple.")
+    state.set_phase_summary(phase, PhaseSummary(text=f"{phase} so far", covered_turn=state.total_turns))
+
+
+def _play_meeting(state: MeetingState, journal: MeetingJournal | None = None) -> None:
+    _play_phase(state)
+    state.extend_current_phase_turn_limit(2)
+    state.mark_phase_converged({"phase": state.current_phase, "summary": "done"})
+    state.approve_current_phase(True)
+    if journal is not None:
+        journal.checkpoint("phase approved")
+    state.transition_to_next_phase()
+    _play_phase(state)
+    state.mark_phase_converged({"phase": state.current_phase, "summary": "first pass"})
+    state.reopen_current_phase()
+    _play_phase(state, turns=2)
+    state.set_meeting_summary("Meeting summary", PHASES[:1])
+    if journal is not None:
+        journal.checkpoint("phase reopened")
+    state.transition_to_next_phase()
+    _play_phase(state, turns=3)
+
+
+def _comparable(state: MeetingState) -> dict:
+    return json.loads(json.dumps(state.to_json()))
+
+
+def _journaled_meeting(path: Path, **options) -> MeetingState:
+    state = _new_state()
+    journal = MeetingJournal(path, **options)
+    journal.open(state)
+    _play_meeting(state, journal)
+    journal.close()
+    return state
+
+
+@pytest.mark.parametrize("encoding, compression", CODECS)
+@pytest.mark.parametrize("snapshot_every", [1000, 5])
+def test_journal_replay_matches_state(tmp_path: Path, encoding: str, compression: str, snapshot_every: int) -> None:
+    path = tmp_path / "meeting_journal_test.jsonl"
+    state = _journaled_meeting(path, snapshot_every=snapshot_every, encoding=encoding, compression=compression)
+    restored = MeetingState.from_journal(path)
+    assert _comparable(restored) == _comparable(state)
+    assert _comparable(load_checkpoint(path)) == _comparable(state)
+
+
+@pytest.mark.parametrize("encoding, compression", [codec for codec in CODECS if codec.values[1] != "none"])
+def test_compaction_keeps_only_the_current_sidecar(tmp_path: Path, encoding: str, compression: str) -> None:
+    path = tmp_path / "meeting_journal_test.jsonl"
+    state = _journaled_meeting(path, snapshot_every=1, encoding=encoding, compression=compression)
+    sidecars = journal_sidecars(path)
+    snapshots = [event for event in read_journal_events(path) if event.get("e") == "snapshot"]
+    assert len(snapshots) == 1
+    assert [sidecar.name for sidecar in sidecars] == [snapshots[0]["file"]]
+    assert _comparable(MeetingState.from_journal(path)) == _comparable(state)
+
+
+def test_torn_last_line_is_ignored(tmp_path: Path) -> None:
+    path = tmp_path / "meeting_journal_test.jsonl"
+    state = _journaled_meeting(path)
+    expected = _comparable(state)
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write('{"e":"turn","speaker":"architect","con')
+    assert _comparable(MeetingState.from_journal(path)) == expected
+
+
+def test_corrupt_line_before_the_end_is_an_error(tmp_path: Path) -> None:
+    path = tmp_path / "meeting_journal_test.jsonl"
+    _journaled_meeting(path)
+    lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+    lines[2] = lines[2][: len(lines[2]) // 2] + "\n"
+    path.write_text("".join(lines), encoding="utf-8")
+    with pytest.raises(ValueError, match="Corrupt journal event"):
+        MeetingState.from_journal(path)
+
+
+def test_resume_event_replays(tmp_path: Path) -> None:
+    path = tmp_path / "meeting_journal_test.jsonl"
+    state = _new_state()
+    journal = MeetingJournal(path)
+    journal.open(state)
+    _play_meeting(state)
+    state.resume_from_phase(1)
+    _play_phase(state, turns=2)
+    journal.close()
+    assert _comparable(MeetingState.from_journal(path)) == _comparable(state)
+
+
+@pytest.mark.parametrize("encoding, compression", CODECS)
+@pytest.mark.parametrize("lazy", [False, True])
+def test_packed_checkpoint_round_trip(encoding: str, compression: str, lazy: bool) -> None:
+    state = _new_state()
+    _play_meeting(state)
+    eager_phases = state.eager_phases() if lazy else None
+    payload = state.to_json(columnar=True)
+    packed_text = json.dumps(pack_state(payload, eager_phases))
+    for restored_payload in (
+        unpack_state(json.loads(packed_text)),
+        decode_checkpoint(encode_checkpoint(state.to_json(columnar=True), encoding, compression, eager_phases)),
+    ):
+        restored = MeetingState.from_json(restored_payload)
+        assert bool(restored.deferred_phases) == lazy
+        assert _comparable(restored) == _comparable(state)
+
+
+def test_version_1_journal_and_legacy_checkpoint_load(tmp_path: Path) -> None:
+    state = _new_state()
+    _play_phase(state)
+    snapshot = {"e": "snapshot", "v": 1, "ts": "2024-01-01T00:00:00", "state": _comparable(state)}
+    events: list[dict] = []
+    state.attach_journal(events.append)
+    state.mark_phase_converged({"phase": state.current_phase, "summary": "done"})
+    state.approve_current_phase(True)
+    state.transition_to_next_phase()
+    _play_phase(state, turns=2)
+    state.attach_journal(None)
+
+    path = tmp_path / "meeting_journal_v1.jsonl"
+    path.write_text("".join(json.dumps(event) + "\n" for event in [snapshot, *events]), encoding="utf-8")
+    assert _comparable(MeetingState.from_journal(path)) == _comparable(state)
+
+    legacy = tmp_path / "meeting_checkpoint_legacy.json"
+    legacy.write_text(json.dumps(_comparable(state)), encoding="utf-8")
+    assert _comparable(load_checkpoint(legacy)) == _comparable(state)
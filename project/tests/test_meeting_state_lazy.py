@@ -0,0 +1,144 @@
+import itertools
+import json
+
+import pytest
+
+from orchestration.checkpoint_format import pack_state, unpack_state
+from orchestration.context_packing import pack_context
+from orchestration.meeting_state import MeetingState
+
+PHASES = ["Alpha", "Beta", "Gamma", "Delta"]
+ROLES = ["business_analyst", "architect", "qa_engineer"]
+TURNS_PER_PHASE = 3
+
+
+def _build_state() -> MeetingState:
+    state = MeetingState(
+        project_name="Lazy",
+        project_description="Lazy loading",
+        meeting_language="en",
+        phases=list(PHASES),
+        max_turns_per_phase=10,
+        global_max_turns=100,
+    )
+    for phase_index, phase in enumerate(PHASES):
+        state.current_phase_index = phase_index
+        for turn in range(TURNS_PER_PHASE):
+            role = ROLES[(phase_index + turn) % len(ROLES)]
+            payload = {"role": role, "summary": f"{phase} turn {turn}", "risks": [f"{phase}-risk-{turn}"]}
+            state.add_transcript(role, json.dumps(payload))
+            state.update_phase_draft(payload)
+        if phase_index < len(PHASES) - 1:
+            state.mark_phase_converged(dict(state.phase_states[phase].draft_artifact))
+            state.approve_current_phase(True)
+    return state
+
+
+def _snapshot(state: MeetingState) -> MeetingState:
+    packed = pack_state(state.to_json(columnar=True), eager_phases=state.eager_phases())
+    return MeetingState.from_json(unpack_state(json.loads(json.dumps(packed))))
+
+
+def _rows(entries) -> list[tuple]:
+    return [(entry.turn, entry.phase, entry.speaker, entry.content) for entry in entries]
+
+
+@pytest.fixture(scope="module")
+def eager() -> MeetingState:
+    return _build_state()
+
+
+@pytest.fixture()
+def lazy(eager: MeetingState) -> MeetingState:
+    state = _snapshot(eager)
+    assert state.deferred_phases == PHASES[:-1]
+    return state
+
+
+def _assert_matches(lazy: MeetingState, eager: MeetingState) -> None:
+    assert _rows(lazy.iter_transcript_reversed()) == _rows(reversed(eager.transcript))
+    assert _rows(lazy.transcript) == _rows(eager.transcript)
+    assert lazy.deferred_phases == []
+    for phase in PHASES:
+        assert _rows(lazy.phase_entries(phase)) == _rows(eager.phase_entries(phase))
+        assert lazy.spoken_roles(phase) == eager.spoken_roles(phase)
+        assert lazy.phase_states[phase].raw_contributions == eager.phase_states[phase].raw_contributions
+
+
+def test_walk_after_out_of_order_load(lazy: MeetingState, eager: MeetingState) -> None:
+    lazy.phase_entries("Alpha")
+    assert [entry.turn for entry in lazy.iter_transcript_reversed()] == list(range(12, 0, -1))
+    _assert_matches(lazy, eager)
+
+
+def test_walk_loads_only_what_it_reaches(lazy: MeetingState, eager: MeetingState) -> None:
+    assert _rows(lazy.latest_entries(TURNS_PER_PHASE)) == _rows(eager.latest_entries(TURNS_PER_PHASE))
+    assert lazy.deferred_phases == PHASES[:-1]
+    assert _rows(lazy.latest_entries(TURNS_PER_PHASE + 1)) == _rows(eager.latest_entries(TURNS_PER_PHASE + 1))
+    assert lazy.deferred_phases == PHASES[:-2]
+
+
+@pytest.mark.parametrize("entries", [1, TURNS_PER_PHASE, TURNS_PER_PHASE + 1, 2 * TURNS_PER_PHASE + 1])
+def test_packed_context_loads_only_what_fits(entries: int, lazy: MeetingState, eager: MeetingState) -> None:
+    budget = sum(entry.token_estimate for entry in eager.latest_entries(entries))
+    packed = pack_context(lazy.iter_transcript_reversed(), "", budget)
+    assert packed == pack_context(reversed(eager.transcript), "", budget)
+    assert packed.turns == [entry.turn for entry in eager.latest_entries(entries)]
+    # The walk reads one turn past what fits before it stops, so that turn's phase is loaded too.
+    reached_phases = -(-(entries + 1) // TURNS_PER_PHASE)
+    assert lazy.deferred_phases == PHASES[: len(PHASES) - reached_phases]
+
+
+def test_search_leaves_sections_deferred(lazy: MeetingState, eager: MeetingState) -> None:
+    hits = lazy.search_context("Alpha risk", 20)
+    assert lazy.deferred_phases == PHASES[:-1]
+    assert {hit.doc_id for hit in hits if hit.doc_id.startswith("artifact:Alpha:")}
+    assert not any(hit.doc_id.startswith("turn:") and int(hit.doc_id[5:]) <= TURNS_PER_PHASE for hit in hits)
+
+    lazy.phase_entries("Alpha")
+    assert {f"turn:{turn}" for turn in range(1, TURNS_PER_PHASE + 1)} <= {
+        hit.doc_id for hit in lazy.search_context("Alpha risk", 20)
+    }
+    lazy.load_all_sections()
+    assert lazy.search_context("Alpha risk", 20) == eager.search_context("Alpha risk", 20)
+
+
+@pytest.mark.parametrize("order", list(itertools.permutations(PHASES[:-1])))
+def test_sections_loaded_in_any_order(order: tuple[str, ...], lazy: MeetingState, eager: MeetingState) -> None:
+    for loaded, phase in enumerate(order, start=1):
+        assert _rows(lazy.phase_entries(phase)) == _rows(eager.phase_entries(phase))
+        for limit in (1, TURNS_PER_PHASE + 1, len(PHASES) * TURNS_PER_PHASE + 5):
+            assert _rows(lazy.latest_entries(limit)) == _rows(eager.latest_entries(limit))
+        assert len(lazy.deferred_phases) <= len(order) - loaded
+    _assert_matches(lazy, eager)
+
+
+@pytest.mark.parametrize("order", list(itertools.permutations(PHASES[:-1])))
+def test_sections_loaded_during_walk(order: tuple[str, ...], lazy: MeetingState, eager: MeetingState) -> None:
+    walk = lazy.iter_transcript_reversed()
+    walked = [next(walk)]
+    for phase in order:
+        lazy.speaker_entries(phase, ROLES[0])
+        walked.append(next(walk))
+    walked.extend(walk)
+    assert _rows(walked) == _rows(reversed(eager.transcript))
+
+
+@pytest.mark.parametrize("loaded", [(), ("Alpha",), ("Beta",), ("Alpha", "Gamma")])
+@pytest.mark.parametrize("phase_index", range(len(PHASES)))
+def test_resume_and_branch_after_partial_load(loaded: tuple[str, ...], phase_index: int, eager: MeetingState) -> None:
+    lazy = _snapshot(eager)
+    for phase in loaded:
+        lazy.phase_entries(phase)
+    branch = lazy.branch(phase_index, "what_if")
+    expected_branch = eager.branch(phase_index, "what_if")
+    assert _rows(branch.iter_transcript_reversed()) == _rows(reversed(expected_branch.transcript))
+    assert _rows(branch.transcript) == _rows(expected_branch.transcript)
+
+    expected = _snapshot(eager)
+    expected.load_all_sections()
+    expected.resume_from_phase(phase_index)
+    lazy.resume_from_phase(phase_index)
+    assert _rows(lazy.transcript) == _rows(expected.transcript)
+    for phase in PHASES:
+        assert lazy.phase_states[phase].raw_contributions == expected.phase_states[phase].raw_contributions
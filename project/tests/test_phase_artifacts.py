@@ -0,0 +1,249 @@
+import copy
+import random
+from typing import Any
+
+import pytest
+
+from orchestration.meeting_state import PhaseState
+from orchestration.phase_artifacts import (
+    PHASE_ARTIFACT_SCHEMAS,
+    PHASE_FIELD_SOURCES,
+    PhaseArtifactBuilder,
+    build_phase_artifact,
+)
+
+# The per-phase artifact builder as it was before the incremental PhaseArtifactBuilder; kept verbatim as the oracle.
+
+
+def _reference_as_list(value: Any) -> list[str]:
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return [str(item) for item in value if str(item).strip()]
+    if isinstance(value, str):
+        return [value] if value.strip() else []
+    return [str(value)]
+
+
+def _reference_latest_by_role(contributions: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    result: dict[str, dict[str, Any]] = {}
+    for payload in contributions:
+        role = str(payload.get("role", "unknown"))
+        result[role] = payload
+    return result
+
+
+def _reference_merge_values(*values: Any) -> list[str]:
+    merged: list[str] = []
+    seen: set[str] = set()
+    for value in values:
+        for item in _reference_as_list(value):
+            if item not in seen:
+                seen.add(item)
+                merged.append(item)
+    return merged
+
+
+def _reference_build_phase_artifact(phase_name: str, contributions: list[dict[str, Any]]) -> dict[str, Any]:
+    schema_fields = PHASE_ARTIFACT_SCHEMAS.get(phase_name, [])
+    latest = _reference_latest_by_role(contributions)
+
+    artifact: dict[str, Any] = {
+        "phase": phase_name,
+        "schema_fields": schema_fields,
+        "contribution_count": len(contributions),
+    }
+
+    if phase_name == "Requirements Gathering":
+        ba = latest.get("business_analyst", {})
+        monitor = latest.get("document_monitor", latest.get("document_formatter", {}))
+        pm = latest.get("product_manager", {})
+        sec = latest.get("security_specialist", {})
+        artifact.update(
+            {
+                "functional_requirements": _reference_merge_values(ba.get("requirements")),
+                "non_functional_requirements": _reference_merge_values(
+                    ba.get("non_functional_requirements"), sec.get("security_controls")
+                ),
+                "constraints": _reference_merge_values(ba.get("constraints")),
+                "formatted_specification": _reference_merge_values(
+                    monitor.get("formatted_specification"), monitor.get("document_sections")
+                ),
+                "coverage_good": _reference_merge_values(monitor.get("coverage_good")),
+                "coverage_gaps": _reference_merge_values(monitor.get("coverage_gaps")),
+                "open_questions": _reference_merge_values(ba.get("clarifications"), pm.get("open_risks"), monitor.get("coverage_gaps")),
+                "stakeholders": _reference_merge_values(pm.get("insights")),
+                "success_criteria": _reference_merge_values(pm.get("decisions")),
+            }
+        )
+
+    elif phase_name == "System Design":
+        architect = latest.get("architect", {})
+        backend = latest.get("backend_engineer", {})
+        frontend = latest.get("frontend_engineer", {})
+        devops = latest.get("devops_engineer", {})
+        sec = latest.get("security_specialist", {})
+        artifact.update(
+            {
+                "architecture_overview": _reference_merge_values(architect.get("architecture_points")),
+                "component_boundaries": _reference_merge_values(
+                    architect.get("architecture_points"), frontend.get("frontend_plan")
+                ),
+                "integration_strategy": _reference_merge_values(
+                    architect.get("architecture_points"), backend.get("dependencies"), devops.get("controls")
+                ),
+                "data_flows": _reference_merge_values(architect.get("architecture_points"), backend.get("backend_plan")),
+                "security_architecture": _reference_merge_values(sec.get("security_controls"), sec.get("threats")),
+                "design_risks": _reference_merge_values(
+                    architect.get("risks"), backend.get("risks"), frontend.get("risks"), devops.get("risks")
+                ),
+            }
+        )
+
+    elif phase_name == "Implementation Planning":
+        backend = latest.get("backend_engineer", {})
+        frontend = latest.get("frontend_engineer", {})
+        devops = latest.get("devops_engineer", {})
+        pm = latest.get("product_manager", {})
+        artifact.update(
+            {
+                "work_breakdown": _reference_merge_values(backend.get("backend_plan"), frontend.get("frontend_plan")),
+                "timeline_milestones": _reference_merge_values(pm.get("decisions")),
+                "resource_plan": _reference_merge_values(devops.get("controls"), pm.get("insights")),
+                "dependency_plan": _reference_merge_values(backend.get("dependencies"), frontend.get("dependencies")),
+                "raci_outline": _reference_merge_values(pm.get("decisions")),
+                "change_control": _reference_merge_values(devops.get("controls")),
+            }
+        )
+
+    elif phase_name == "Testing Strategy":
+        qa = latest.get("qa_engineer", {})
+        sec = latest.get("security_specialist", {})
+        artifact.update(
+            {
+                "test_levels": _reference_merge_values(qa.get("test_strategy")),
+                "acceptance_criteria": _reference_merge_values(qa.get("quality_gates")),
+                "quality_gates": _reference_merge_values(qa.get("quality_gates")),
+                "test_data_strategy": _reference_merge_values(qa.get("test_strategy")),
+                "defect_management": _reference_merge_values(qa.get("risks"), sec.get("risks")),
+            }
+        )
+
+    elif phase_name == "Deployment Planning":
+        devops = latest.get("devops_engineer", {})
+        sec = latest.get("security_specialist", {})
+        artifact.update(
+            {
+                "environment_strategy": _reference_merge_values(devops.get("devops_plan")),
+                "release_strategy": _reference_merge_values(devops.get("controls")),
+                "rollback_plan": _reference_merge_values(devops.get("controls"), devops.get("risks")),
+                "observability_plan": _reference_merge_values(devops.get("controls")),
+                "operational_readiness": _reference_merge_values(sec.get("security_controls"), devops.get("devops_plan")),
+            }
+        )
+
+    elif phase_name == "Maintenance Strategy":
+        pm = latest.get("product_manager", {})
+        qa = latest.get("qa_engineer", {})
+        devops = latest.get("devops_engineer", {})
+        artifact.update(
+            {
+                "support_model": _reference_merge_values(devops.get("devops_plan"), pm.get("insights")),
+                "incident_response": _reference_merge_values(devops.get("controls"), qa.get("quality_gates")),
+                "sla_slo": _reference_merge_values(pm.get("decisions"), qa.get("quality_gates")),
+                "continuous_improvement": _reference_merge_values(pm.get("open_risks"), qa.get("risks")),
+                "monitoring_governance": _reference_merge_values(devops.get("controls")),
+            }
+        )
+
+    else:
+        artifact["raw"] = contributions[-1] if contributions else {}
+
+    for field in schema_fields:
+        artifact.setdefault(field, [])
+    return artifact
+
+
+PHASES = [*PHASE_ARTIFACT_SCHEMAS, "Retrospective"]
+ROLES = sorted(
+    {
+        role
+        for sources in PHASE_FIELD_SOURCES.values()
+        for field_sources in sources.values()
+        for roles, _ in field_sources
+        for role in ((roles,) if isinstance(roles, str) else roles)
+    }
+    | {"unknown", "tech_writer"}
+)
+KEYS = sorted({key for sources in PHASE_FIELD_SOURCES.values() for field_sources in sources.values() for _, key in field_sources})
+ITEMS = ["alpha", "beta", "gamma", "delta", "", "  ", "beta "]
+
+
+def _random_value(rng: random.Random) -> Any:
+    kind = rng.random()
+    if kind < 0.55:
+        return [rng.choice(ITEMS + [7, None]) for _ in range(rng.randint(0, 5))]
+    if kind < 0.75:
+        return rng.choice(ITEMS)
+    if kind < 0.85:
+        return None
+    return rng.choice([0, 3, 2.5, True])
+
+
+def _random_contribution(rng: random.Random) -> dict[str, Any]:
+    payload: dict[str, Any] = {key: _random_value(rng) for key in rng.sample(KEYS, rng.randint(0, 6))}
+    if rng.random() < 0.95:
+        payload["role"] = rng.choice(ROLES)
+    payload["summary"] = f"turn {rng.randint(0, 1000)}"
+    return payload
+
+
+def _random_contributions(rng: random.Random) -> list[dict[str, Any]]:
+    return [_random_contribution(rng) for _ in range(rng.randint(0, 25))]
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_incremental_apply_matches_reference(seed: int) -> None:
+    rng = random.Random(seed)
+    phase = rng.choice(PHASES)
+    contributions = _random_contributions(rng)
+    builder = PhaseArtifactBuilder(phase)
+    assert builder.artifact() == _reference_build_phase_artifact(phase, [])
+    drafts = []
+    for count, payload in enumerate(contributions, start=1):
+        draft = builder.apply(payload)
+        assert draft == _reference_build_phase_artifact(phase, contributions[:count])
+        drafts.append((count, copy.deepcopy(draft), draft))
+    # Earlier drafts stay as they were returned; later contributions never mutate them.
+    for count, snapshot, draft in drafts:
+        assert draft == snapshot == _reference_build_phase_artifact(phase, contributions[:count])
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_rebuild_from_contributions_matches_reference(seed: int) -> None:
+    rng = random.Random(seed)
+    phase = rng.choice(PHASES)
+    contributions = _random_contributions(rng)
+    expected = _reference_build_phase_artifact(phase, contributions)
+    assert PhaseArtifactBuilder.from_contributions(phase, contributions).artifact() == expected
+    assert build_phase_artifact(phase, contributions) == expected
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_phase_state_rebuild_matches_reference(seed: int) -> None:
+    rng = random.Random(seed)
+    phase = rng.choice(PHASES)
+    contributions = _random_contributions(rng) + [_random_contribution(rng)]
+    split = rng.randint(0, len(contributions) - 1)
+    # A restored phase starts with stored contributions and no builder.
+    state = PhaseState(name=phase, raw_contributions=copy.deepcopy(contributions[:split]))
+    for count in range(split + 1, len(contributions) + 1):
+        state.add_contribution(contributions[count - 1])
+        assert state.draft_artifact == _reference_build_phase_artifact(phase, contributions[:count])
+        if rng.random() < 0.3:
+            # Contributions replaced behind the builder's back (replay, resume) force another rebuild.
+            state.raw_contributions = list(state.raw_contributions)
+            state.raw_contributions.pop()
+            state.add_contribution(contributions[count - 1])
+            assert state.draft_artifact == _reference_build_phase_artifact(phase, contributions[:count])
+    assert state.raw_contributions == contributions